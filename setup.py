@@ -38,7 +38,12 @@ setup(
     'xmltodict',
     'lxml',
     'natsort'
-]
+],
+    extras_require = {
+    'async': ['aiohttp'],
+    'fast-json': ['orjson'],
+    'parallel': ['pyarrow'],
+}
 )
 
 
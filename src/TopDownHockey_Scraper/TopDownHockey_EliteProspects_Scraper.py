@@ -15,6 +15,14 @@ import warnings
 warnings.filterwarnings("ignore")
 import sys
 from requests import ConnectionError, ReadTimeout, ConnectTimeout, HTTPError, Timeout
+from TopDownHockey_Scraper.http_client import get_http_client, DEFAULT_HEADERS
+from TopDownHockey_Scraper import json_backend
+
+# Share the NHL scraper's pooled HTTP client, but with the plain requests headers this scraper has always sent:
+# every nhl.com header (Origin/Referer, the Chrome User-Agent and its sec-ch-ua*/sec-fetch-* hints) is dropped
+_http_client = get_http_client()
+_EP_HEADERS = {name: None for name in DEFAULT_HEADERS}
+_EP_HEADERS.update(requests.utils.default_headers())
 
 def tableDataText(table):
 
@@ -69,13 +77,13 @@ def getskaters(league, year):
     # Return list with all plyers for season in link     
     players = []
     
-    page = (requests.get(url+str(1), timeout = 500))
+    page = (_http_client.get(url+str(1), timeout = 500, headers = _EP_HEADERS))
     first_page_string = str(page)
     
     while first_page_string == '<Response [403]>':
         print("Just got a 403 Error before entering the page. Time to Sleep, then re-obtain the link.")
         time.sleep(100)
-        page = (requests.get(url+str(1), timeout = 500))
+        page = (_http_client.get(url+str(1), timeout = 500, headers = _EP_HEADERS))
         first_page_string = str(page)
         print("Changed the string before entering the page. Let's try again")
     
@@ -85,13 +93,13 @@ def getskaters(league, year):
     else:
         
         for i in range(1,99):
-            page = requests.get(url+str(i), timeout = 500) 
+            page = _http_client.get(url+str(i), timeout = 500, headers = _EP_HEADERS) 
             page_string = str(page)
             
             while page_string == '<Response [403]>':
                 print("Just got a 403 Error within the page. Time to Sleep, then re-obtain the link.")
                 time.sleep(100)
-                page = requests.get(url+str(i), timeout = 500) 
+                page = _http_client.get(url+str(i), timeout = 500, headers = _EP_HEADERS) 
                 page_string = str(page)
                 print("Changed the string within the page. Let's try again")
                 
@@ -104,7 +112,7 @@ def getskaters(league, year):
                 df_players = tableDataText(player_table)
                 
             except AttributeError:
-                print("BREAK: TABLE NONE ERROR: " + str(requests.get(url+str(i), timeout = 500)) + " On League: " + league + " In Year: " + year)
+                print("BREAK: TABLE NONE ERROR: " + str(_http_client.get(url+str(i), timeout = 500, headers = _EP_HEADERS)) + " On League: " + league + " In Year: " + year)
                 break
                 
             if len(df_players)>0:
@@ -166,7 +174,7 @@ def getskaters(league, year):
 
             return df_players
         
-        else: print("LENGTH 0 ERROR: " + str(requests.get(url+str(1), timeout = 500)) + " On League: " + league + " In Year: " + year)
+        else: print("LENGTH 0 ERROR: " + str(_http_client.get(url+str(1), timeout = 500, headers = _EP_HEADERS)) + " On League: " + league + " In Year: " + year)
             
 def getgoalies(league, year):
     """
@@ -181,14 +189,14 @@ def getgoalies(league, year):
     # Return list with all plyers for season in link     
     players = []
     
-    page = (requests.get(url + str(1) + "#goalies", timeout = 500))
+    page = (_http_client.get(url + str(1) + "#goalies", timeout = 500, headers = _EP_HEADERS))
     first_page_string = str(page)
     
     while first_page_string == '<Response [403]>':
         print("Just got a 403 Error before entering the page. This means EliteProspects has temporarily blocked your IP address.")
         print("We're going to sleep for 60 seconds, then try again.")
         time.sleep(100)
-        page = (requests.get(url + str(1) + "#goalies", timeout = 500))
+        page = (_http_client.get(url + str(1) + "#goalies", timeout = 500, headers = _EP_HEADERS))
         first_page_string = str(page)
         print("Okay, let's try this again")
     
@@ -198,13 +206,13 @@ def getgoalies(league, year):
     else:
         
         for i in range(1,99):
-            page = requests.get(url+str(i), timeout = 500)
+            page = _http_client.get(url+str(i), timeout = 500, headers = _EP_HEADERS)
             page_string = str(page)
             
             while page_string == '<Response [403]>':
                 print("Just got a 403 Error within the page. Time to Sleep, then re-obtain the link.")
                 time.sleep(100)
-                page = (requests.get(url+str(i), timeout = 500))
+                page = (_http_client.get(url+str(i), timeout = 500, headers = _EP_HEADERS))
                 page_string = str(page)
                 print("Changed the string within the page. Let's try again")
                 
@@ -216,7 +224,7 @@ def getgoalies(league, year):
             try:
                 df_players = tableDataText(player_table)
             except AttributeError:
-                print("BREAK: TABLE NONE ERROR: " + str(requests.get(url+str(i), timeout = 500)) + " On League: " + league + " In Year: " + year)
+                print("BREAK: TABLE NONE ERROR: " + str(_http_client.get(url+str(i), timeout = 500, headers = _EP_HEADERS)) + " On League: " + league + " In Year: " + year)
                 break
                 
             if len(df_players)>0:
@@ -265,7 +273,7 @@ def getgoalies(league, year):
             df_players = df_players.loc[((df_players.gp!=0) & (~pd.isna(df_players.gp)) & (df_players.gp!="0") & (df_players.gaa!="-"))]
 
             return df_players
-        else: print("LENGTH 0 ERROR: " + str(requests.get(url+str(1), timeout = 500)) + " On League: " + league + " In Year: " + year)  
+        else: print("LENGTH 0 ERROR: " + str(_http_client.get(url+str(1), timeout = 500, headers = _EP_HEADERS)) + " On League: " + league + " In Year: " + year)  
     
 def get_info(link):
     """
@@ -279,14 +287,14 @@ def get_info(link):
 
     url = link if link.startswith('http') else 'https://www.eliteprospects.com' + link
 
-    page = requests.get(url, timeout = 500)
+    page = _http_client.get(url, timeout = 500, headers = _EP_HEADERS)
     soup = BeautifulSoup(page.content, "html.parser")
 
     page_string = str(page)
 
     while ((page_string == '<Response [403]>') or ("evil" in str(soup.p))):
         print("403 Error. re-obtaining string and re-trying.")
-        page = requests.get(url, timeout = 500)
+        page = _http_client.get(url, timeout = 500, headers = _EP_HEADERS)
         page_string = str(page)
         soup = BeautifulSoup(page.content, "html.parser")
         time.sleep(60)
@@ -296,7 +304,7 @@ def get_info(link):
 
     if next_data_tag:
         try:
-            next_data = json.loads(next_data_tag.string)
+            next_data = json_backend.loads(next_data_tag.string)
             p = next_data.get('props', {}).get('pageProps', {}).get('playerData', {}).get('player', {})
         except (json.JSONDecodeError, AttributeError):
             p = {}
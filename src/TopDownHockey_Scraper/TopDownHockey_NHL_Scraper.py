@@ -14,50 +14,53 @@ import lxml
 from requests import ConnectionError, ReadTimeout, ConnectTimeout, HTTPError, Timeout
 import xml
 import re
-from natsort import natsorted
+from natsort import natsorted, natsort_keygen
 import xml.etree.ElementTree as ET
 import xmltodict
 from xml.parsers.expat import ExpatError
 from requests.exceptions import ChunkedEncodingError
 import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from TopDownHockey_Scraper.http_client import get_http_client, configure_http_client
+from TopDownHockey_Scraper.rate_limiter import configure_rate_limits, rate_limit_config, is_rate_limited, penalize
 from TopDownHockey_Scraper.scrape_nhl_api_events import scrape_api_events
+from TopDownHockey_Scraper.response_cache import (
+    enable_response_cache, disable_response_cache, cache_config, get_cached_response, store_response,
+    conditional_headers, remember_validated_response, not_modified_response, reuse_unchanged_parse
+)
+from TopDownHockey_Scraper.json_backend import response_json
+from TopDownHockey_Scraper.documents import (
+    start_game_documents, release_game_documents, register_page, registered_page, page_tree, page_json
+)
+from TopDownHockey_Scraper.response_archive import configure_response_archive, archive_config, is_replaying, replay_response, record_response
+
+# Optional: Arrow IPC for shipping results back from worker processes
+try:
+    import pyarrow as _pa
+except ImportError:
+    _pa = None
 
 print('Successfully did local install plus update - OPTIMIZED VERSION (Round 1: _append(), Round 2: name corrections, Round 3: vectorization, Round 4: parallel network requests)')
 
 # ========== OPTIMIZATIONS ==========
-# Create a persistent session with connection pooling
-_session = requests.Session()
-_session.headers.update({
-    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/146.0.0.0 Safari/537.36',
-    'Origin': 'https://www.nhl.com',
-    'Referer': 'https://www.nhl.com/',
-    'Accept': '*/*',
-    'Accept-Language': 'en-US,en;q=0.9',
-    'sec-ch-ua': '"Chromium";v="146", "Not-A.Brand";v="24", "Google Chrome";v="146"',
-    'sec-ch-ua-mobile': '?0',
-    'sec-ch-ua-platform': '"macOS"',
-    'sec-fetch-dest': 'empty',
-    'sec-fetch-mode': 'cors',
-    'sec-fetch-site': 'cross-site',
-})
-_adapter = requests.adapters.HTTPAdapter(
-    pool_connections=10,
-    pool_maxsize=20,
-    max_retries=2
-)
-_session.mount('http://', _adapter)
-_session.mount('https://', _adapter)
+# One pooled HTTP client shared by every scraper module (see http_client.configure_http_client)
+_http_client = get_http_client()
+_session = _http_client.session
 
 # Compile regex patterns once for reuse
 _BBORDER_PATTERN = re.compile('.*bborder.*')
-_ZONE_PATTERN = re.compile(r'(\S+?) Zone')
+_ZONE_PATTERN = re.compile(r'(\S+? Zone)')
 _PLAYER_NUM_PATTERN = re.compile(r'[#-]\s*(\d+)')
 _MATCH_GAME_PATTERN = re.compile(r'Match|Game')
 _PARENTHESIS_PATTERN = re.compile(r'\((.*?)\)')
 _MULTI_SPACE_PATTERN = re.compile(r' +')
 _CAPTAIN_A_PATTERN = re.compile(r' \(A\)$')
 _CAPTAIN_C_PATTERN = re.compile(r' \(C\)$')
+# Play-by-play order of events at the same second in merge_and_prepare; other events get 0
+_EVENT_PRIORITY = {'TAKE': 1, 'GIVE': 1, 'MISS': 1, 'HIT': 1, 'SHOT': 1, 'BLOCK': 1, 'GOAL': 2, 'STOP': 3,
+                   'DELPEN': 4, 'PENL': 5, 'CHANGE': 6, 'PEND': 7, 'GEND': 8, 'FAC': 9}
+# Jersey numbers in an HTML PBP on-ice cell, like "18 C 47 C 73 D 91 D 70 G" with whitespace/newlines
+_HTML_ON_ICE_PATTERN = re.compile(r'(\d+)\s*[CLDGRW]')
 
 # ========== DEBUG LOGGING HELPER ==========
 def _log_exception_with_dataframe(error, context_name, dataframes_dict=None, max_rows=100):
@@ -99,27 +102,52 @@ def _log_exception_with_dataframe(error, context_name, dataframes_dict=None, max
     print(f"{'='*60}\n")
 
 # ========== PARALLEL FETCHING HELPERS ==========
-def _fetch_url(url, max_retries=3, base_delay=2, **kwargs):
+def _http_get(url, **kwargs):
+    """
+    GET a URL through the shared session, serving it from the on-disk response cache
+    when one is enabled (see enable_response_cache) and storing fresh 200 responses.
+    In replay mode the page comes from the replay archive and never touches the network;
+    in record mode every page is also saved to the record archive.
+    Network requests are conditional when the URL has been seen before: a 304 answer
+    hands back the previous response object, which lets parsers skip re-parsing it.
+    """
+    params = kwargs.get('params')
+    if is_replaying():
+        return replay_response(url, params)
+    response = get_cached_response(url, params)
+    if response is None:
+        validators = conditional_headers(url) if params is None else {}
+        if validators:
+            kwargs['headers'] = {**kwargs.get('headers', {}), **validators}
+        response = _http_client.get(url, **kwargs)
+        if response.status_code == 304:
+            previous = not_modified_response(url)
+            if previous is not None:
+                return previous
+            # Previous response was evicted in the meantime; ask again unconditionally
+            kwargs['headers'] = {k: v for k, v in kwargs['headers'].items() if k not in validators}
+            response = _http_client.get(url, **kwargs)
+        remember_validated_response(url, response)
+        store_response(url, response, params)
+    record_response(url, response, params)
+    return response
+
+def _fetch_url(url, **kwargs):
     """
     Helper function to fetch URL with session for use in ThreadPoolExecutor.
-    Includes retry logic with exponential backoff for transient failures.
+    Fails fast instead of sleeping in the thread: the error ends the game's fetch, and
+    full_scrape_1by1 requeues the game with a deadline while the games behind it keep flowing.
     """
-    last_exception = None
-    for attempt in range(max_retries + 1):
-        try:
-            response = _session.get(url, **kwargs)
-            response.raise_for_status()
-            return response
-        except Exception as e:
-            last_exception = e
-            if attempt < max_retries:
-                delay = base_delay * (2 ** attempt)  # Exponential backoff: 2, 4, 8 seconds
-                print(f"  Fetch failed for {url.split('/')[-1]} (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                print(f"  Retrying in {delay} seconds...")
-                time.sleep(delay)
-            else:
-                print(f"  All {max_retries + 1} attempts failed for {url.split('/')[-1]}")
-                raise last_exception
+    try:
+        response = _http_get(url, **kwargs)
+        response.raise_for_status()
+        return response
+    except Exception as e:
+        print(f"  Fetch failed for {url.split('/')[-1]}: {e}")
+        if is_rate_limited(url) and _classify_scrape_failure(e) == 'network':
+            # Back off the whole host through its token bucket, so every thread slows down together
+            penalize(url, _THROTTLE_PENALTY)
+        raise
 # ===============================================
 
 team_names = ['ANAHEIM DUCKS',
@@ -169,7 +197,7 @@ ewc = ['SHOT', 'HIT', 'BLOCK', 'MISS', 'GIVE', 'TAKE', 'GOAL']
 
 # ==================================
 
-from TopDownHockey_Scraper.name_corrections import NAME_CORRECTIONS, normalize_player_name
+from TopDownHockey_Scraper.name_corrections import NAME_CORRECTIONS, normalize_player_name, normalize_player_names
 
 # Lazy-loaded portrait links for ID fallback in fix_missing()
 _portrait_links_dict = None
@@ -239,8 +267,8 @@ def scrape_schedule(start_date, end_date):
     """
     
     url = 'https://statsapi.web.nhl.com/api/v1/schedule?startDate=' + start_date + '&endDate=' + end_date
-    page = _session.get(url, timeout=30)
-    loaddict = json.loads(page.content)
+    page = _http_get(url, timeout=30)
+    loaddict = response_json(page)
     date_list = (loaddict['dates'])
     date_df = pd.DataFrame(date_list)
     
@@ -323,25 +351,154 @@ def hs_strip_html(td):
 
     return td
 
+def _stripped_text(element):
+    """
+    Text of an lxml element with each text fragment stripped, like BeautifulSoup's get_text(strip=True).
+    """
+    return ''.join(text.strip() for text in element.itertext())
+
+_EVENT_PLAYER_PATTERN = re.compile(r'[#-]\s*(\d+)')
+
+def _parse_events_table(tds):
+    """
+    Build the play-by-play columns from the PL0 page's 'bborder' cells in a single pass.
+
+    Replaces hs_strip_html + a reshaped object array + the chain of str.split/assign passes
+    that used to follow: every 8 cells make one row, the header rows ('Per') are skipped,
+    and each row's period, elapsed seconds, event team and event players are derived as it
+    is read. The results match what the pandas version produced, NaN placement included.
+
+    Args:
+        tds: lxml td elements whose class contains 'bborder', in document order
+
+    Returns:
+        Tuple of (dict of column lists, away team abbreviation, home team abbreviation)
+    """
+    texts = [td.text_content() for td in tds]
+    length = (len(texts) // 8) * 8
+
+    # Validate we got meaningful HTML data
+    if length == 0:
+        raise ValueError(f"HTML events page returned no valid event data (found {len(tds)} td elements)")
+    if texts[0] != '#':
+        # hs_strip_html would have turned the first on-ice cells into player lists, which can't form a table
+        raise ValueError(f"HTML events page does not start with its header row (first cell: {texts[0]!r})")
+
+    # hs_strip_html trimmed the very first time cell (the header's) to just past its colon
+    texts[3] = texts[3][:texts[3].find(':') + 3]
+
+    # Validate time column has actual time data (should contain ':' like "12:34")
+    # This catches cases where HTML returned but contained garbage/error page content
+    times = texts[3:length:8]
+    if not any(':' in t for t in times):
+        raise ValueError(f"HTML events page has no valid time data (first 3 values: {times[:3]})")
+
+    away_abbreviated = texts[6].replace('\n', '').split(' ')[0]
+    home_abbreviated = texts[7].replace('\n', '').split(' ')[0]
+    teams = (home_abbreviated, away_abbreviated)
+
+    columns = {name: [] for name in [
+        'event_index', 'period', 'strength', 'period_seconds', 'event', 'description', 'away_skaters', 'home_skaters',
+        'original_time', 'event_team', 'other_team', 'event_player_str', 'event_player_1', 'event_player_2', 'event_player_3']}
+    drawn_by = False
+
+    for row in range(length // 8):
+        index, period, strength, time_text, event, description, away_skaters, home_skaters = texts[row * 8:row * 8 + 8]
+        if period == 'Per':
+            continue
+
+        # The time cell holds elapsed and remaining run together (e.g. 0:3519:25); keep elapsed
+        time_parts = time_text.split(':')
+        if len(time_parts) > 1:
+            minutes, seconds = time_parts[0], time_parts[1][:2]
+        else:
+            minutes, seconds = '0', '00'
+
+        event_team = description.split(' ')[0].split('\xa0')[0]
+        if event_team not in teams:
+            event_team = '\xa0'
+        if event_team == '':
+            other_team = '\xa0'
+        else:
+            other_team = away_abbreviated if event_team == home_abbreviated else home_abbreviated
+
+        numbers = _EVENT_PLAYER_PATTERN.findall(description)
+        drawn_by = drawn_by or 'Drawn By' in description
+
+        columns['event_index'].append(row)
+        columns['period'].append(int(period) if period != '' else 1)
+        columns['strength'].append(strength)
+        columns['period_seconds'].append(int(minutes.replace('-', '')) * 60 + int(seconds.replace('-', '')))
+        columns['event'].append(event)
+        columns['description'].append(description)
+        columns['away_skaters'].append(away_skaters.replace('\n', ''))
+        columns['home_skaters'].append(home_skaters.replace('\n', ''))
+        columns['original_time'].append(time_text)
+        columns['event_team'].append(event_team)
+        columns['other_team'].append(other_team)
+        columns['event_player_str'].append(' '.join(numbers))
+        columns['event_player_1'].append(numbers[0] if numbers else '')
+        columns['event_player_2'].append(numbers[1] if len(numbers) > 1 else np.nan)
+        columns['event_player_3'].append(numbers[2] if len(numbers) > 2 else np.nan)
+
+    for k in range(len(columns['event'])):
+        event = columns['event'][k]
+        description = columns['description'][k]
+        event_team = columns['event_team'][k]
+        player_1 = columns['event_player_1'][k]
+        player_2 = columns['event_player_2'][k]
+        player_3 = columns['event_player_3'][k]
+
+        # Penalties: the second player is whoever drew it; a served-by player isn't an event player
+        if drawn_by:
+            if 'Drawn By' in description:
+                drawn = description.split('Drawn By')[1].split('#')
+                player_2 = drawn[1].split(' ')[0].strip() if len(drawn) > 1 else np.nan
+            if 'Served By' in description:
+                player_3 = '\xa0'
+
+        # Prefix each jersey number with the team it belongs to
+        if type(player_1) == str and player_1 != '':
+            player_1 = (away_abbreviated if event == 'FAC' else event_team) + player_1
+        if type(player_2) == str and player_2 != '':
+            if event == 'FAC':
+                player_2 = home_abbreviated + player_2
+            elif event in ('BLOCK', 'HIT', 'PENL'):
+                player_2 = columns['other_team'][k] + player_2
+            else:
+                player_2 = event_team + player_2
+        if type(player_3) == str and player_3 != '':
+            player_3 = event_team + player_3
+
+        # Faceoffs won by the home team list the home player first
+        if event == 'FAC' and event_team == home_abbreviated:
+            player_1, player_2 = player_2, player_1
+
+        columns['event_player_1'][k] = player_1
+        columns['event_player_2'][k] = player_2
+        columns['event_player_3'][k] = player_3
+
+    return columns, away_abbreviated, home_abbreviated
+
 def parse_goaltender_summary(goalie_table):
-    """Parse the goaltender summary table into a DataFrame."""
+    """Parse the goaltender summary table (an lxml element) into a DataFrame."""
     
-    rows = goalie_table.find_all('tr')
+    rows = goalie_table.xpath('.//tr')
     
     goalie_data = []
     current_team = None
     
     for row in rows:
-        cells = row.find_all('td')
+        cells = row.xpath('.//td')
         if not cells:
             continue
         
         # Check if this is a team header row (contains team name)
-        first_cell_text = cells[0].get_text(strip=True)
+        first_cell_text = _stripped_text(cells[0])
         
         # Team header row - look for visitorsectionheading or homesectionheading
-        if 'visitorsectionheading' in str(cells[0].get('class', [])) or \
-           'homesectionheading' in str(cells[0].get('class', [])):
+        if 'visitorsectionheading' in cells[0].get('class', '') or \
+           'homesectionheading' in cells[0].get('class', ''):
             # Extract team name
             if first_cell_text and first_cell_text not in ['TOI', 'GOALS-SHOTS AGAINST', 'EV', 'PP', 'SH', 'TOT', '1', '2', '3']:
                 current_team = first_cell_text
@@ -361,7 +518,7 @@ def parse_goaltender_summary(goalie_table):
         # This should be a goaltender data row
         # Check if it has position "G" in the second cell
         if len(cells) >= 11:
-            cell_texts = [c.get_text(strip=True) for c in cells]
+            cell_texts = [_stripped_text(c) for c in cells]
             
             # Goalie rows have: Number, "G", Name, EV, PP, SH, TOT, P1, P2, P3, TOT
             if len(cell_texts) >= 2 and cell_texts[1] == 'G':
@@ -376,7 +533,7 @@ def parse_goaltender_summary(goalie_table):
     
     return pd.DataFrame(goalie_data)
 
-def backfill_missing_goalie_shifts_from_period_summary(shifts_df, soup, goalie_names, team_name, venue):
+def backfill_missing_goalie_shifts_from_period_summary(shifts_df, period_summary, goalie_names, team_name, venue):
     """
     Backfill missing goalie shifts for historical games where the NHL shift data
     has gaps. This parses the per-period summary table and creates synthetic shifts
@@ -388,7 +545,8 @@ def backfill_missing_goalie_shifts_from_period_summary(shifts_df, soup, goalie_n
 
     Args:
         shifts_df: DataFrame of individual shifts already parsed
-        soup: BeautifulSoup object of the HTML shifts page
+        period_summary: Per-period summary DataFrame from _parse_shift_report, or the
+            HTML shifts page itself (lxml document, BeautifulSoup object or string)
         goalie_names: List of goalie names for this team
         team_name: Team name string
         venue: 'home' or 'away'
@@ -399,55 +557,19 @@ def backfill_missing_goalie_shifts_from_period_summary(shifts_df, soup, goalie_n
     if len(shifts_df) == 0:
         return shifts_df
 
-    # Parse the per-period summary data (class 'bborder + lborder +')
-    found = soup.find_all('td', {'class':['playerHeading + border', 'bborder + lborder +']})
-    if len(found) == 0:
-        return shifts_df
-
-    players = dict()
-    current_player = None
-
-    for i in range(len(found)):
-        line = found[i].get_text()
-        if line == '25 PETTERSSON, ELIAS':
-            line = '25 PETTERSSON(D), ELIAS'
-        if ', ' in line:
-            # Player header row
-            name_parts = line.split(',')
-            if len(name_parts) >= 2:
-                number_last = name_parts[0].split(' ', 1)
-                number = number_last[0].strip()
-                last_name = number_last[1].strip() if len(number_last) > 1 else ''
-                first_name = name_parts[1].strip()
-                full_name = first_name + " " + last_name
-                players[full_name] = {
-                    'number': number,
-                    'name': full_name,
-                    'shifts': []
-                }
-                current_player = full_name
-        elif current_player is not None:
-            players[current_player]['shifts'].append(line)
-
-    # Build period summary dataframe
-    period_summary_list = []
-    for key in players.keys():
-        shifts_array = players[key]['shifts']
-        # Per-period summary has 6 columns: period, shifts, avg, TOI, EV Total, PP Total
-        length = int(len(shifts_array) / 6)
-        if length > 0:
-            try:
-                df = pd.DataFrame(np.array(shifts_array).reshape(length, 6)).rename(
-                    columns={0: 'period', 1: 'shifts_count', 2: 'avg', 3: 'TOI', 4: 'EV Total', 5: 'PP Total'})
-                df = df.assign(name=players[key]['name'], number=players[key]['number'])
-                period_summary_list.append(df)
-            except:
-                continue
+    # Parse the per-period summary data (class 'bborder + lborder +') unless the caller already has it
+    if not isinstance(period_summary, pd.DataFrame):
+        if hasattr(period_summary, 'find_all'):
+            period_summary = str(period_summary)
+        try:
+            period_summary = pd.DataFrame(_parse_shift_report(period_summary)['period_summary'])
+        except IndexError:
+            return shifts_df
 
-    if not period_summary_list:
+    if len(period_summary) == 0:
         return shifts_df
 
-    period_summary = pd.concat(period_summary_list, ignore_index=True)
+    period_summary = period_summary.copy()
 
     # Normalize goalie names for comparison
     period_summary['name_normalized'] = period_summary.name.str.normalize('NFKD').str.encode('ascii', errors='ignore').str.decode('utf-8').str.upper()
@@ -550,10 +672,13 @@ def scrape_html_roster(season, game_id, page=None, verbose=False):
     """
     if page is None:
         url = 'http://www.nhl.com/scores/htmlreports/' + season + '/RO0' + game_id + '.HTM'
-        
+        # Reuse the page already fetched for this game (e.g. merge_and_prepare called without a roster)
+        page = registered_page(url)
+
+    if page is None:
         # TIME: Roster network request
         net_start = time.time()
-        page = _session.get(url, timeout=10)
+        page = _http_get(url, timeout=10)
         net_duration = time.time() - net_start
         if verbose:
             try:
@@ -561,11 +686,8 @@ def scrape_html_roster(season, game_id, page=None, verbose=False):
             except Exception:
                 pass
     
-    # OPTIMIZED: Use lxml directly instead of BeautifulSoup for faster parsing
-    if type(page) == str:
-        doc = html.fromstring(page)
-    else:
-        doc = html.fromstring(page.content.decode('ISO-8859-1'))
+    # OPTIMIZED: Use lxml directly instead of BeautifulSoup for faster parsing, once per game
+    doc = page_tree(page, 'ISO-8859-1')
 
     # XPath to find td elements with align='center', class containing 'teamHeading' and 'border', width='50%'
     teamsoup = doc.xpath("//td[@align='center' and @width='50%' and contains(@class, 'teamHeading') and contains(@class, 'border')]")
@@ -708,10 +830,118 @@ def scrape_html_roster(season, game_id, page=None, verbose=False):
 
     roster_df['Name'] = roster_df['Name'].str.replace('  ', ' ')
 
-    roster_df['Name'] = roster_df['Name'].apply(lambda x: normalize_player_name(x))
+    roster_df['Name'] = normalize_player_names(roster_df['Name'])
 
     return roster_df 
 
+# ========== SHIFT REPORT PARSING ==========
+_SHIFT_HEADING_CLASS = 'playerHeading + border'
+_SHIFT_CELL_CLASS = 'lborder + bborder'
+_SHIFT_SUMMARY_CLASS = 'bborder + lborder +'
+_SHIFT_REPORT_XPATH = '//td[{}]'.format(' or '.join(
+    'normalize-space(@class)="{}"'.format(c) for c in (_SHIFT_HEADING_CLASS, _SHIFT_CELL_CLASS, _SHIFT_SUMMARY_CLASS)))
+_SHIFT_COLUMNS = ['shift_number', 'period', 'shift_start', 'shift_end', 'duration']
+_PERIOD_SUMMARY_COLUMNS = ['period', 'shifts', 'avg', 'TOI', 'EV Total', 'PP Total']
+
+def _parse_shift_report(page):
+    """
+    Parse a TH0/TV0 shift report in a single pass over an lxml tree.
+
+    Player headings, individual shift cells and per-period summary cells are matched by
+    their exact class attribute (the same cells BeautifulSoup's class matching picked out)
+    and walked once in document order, filling plain column lists.
+
+    Args:
+        page: requests.Response, HTML string or lxml document of the shifts page
+
+    Returns:
+        Dictionary with:
+            'doc': the lxml document
+            'team': team heading text, or None if the page has none
+            'shifts': columns shift_number, period, shift_start, shift_end, duration, name, number
+            'period_summary': columns period, shifts, avg, TOI, EV Total, PP Total, name, number
+            'ragged_summary': names of players whose summary cells don't divide into whole rows
+                (left out of 'period_summary')
+    """
+    # FIX: Use .text instead of .content to handle charset mismatch (HTML declares UTF-16 but is UTF-8)
+    doc = page_tree(page)
+
+    cells = doc.xpath(_SHIFT_REPORT_XPATH)
+    if len(cells) == 0:
+        raise IndexError('This game has no shift data.')
+
+    team = doc.xpath('//td[@align="center" and normalize-space(@class)="teamHeading + border"]')
+    team = team[0].text_content() if team else None
+
+    # {name: (number, shift cells, summary cells)}; a repeated heading starts its player over
+    players = {}
+    current = None
+    for cell in cells:
+        line = cell.text_content()
+        if line == '25 PETTERSSON, ELIAS':
+            line = '25 PETTERSSON(D), ELIAS'
+        if ', ' in line:
+            name_parts = line.split(',')
+            number_last = name_parts[0].split(' ', 1)
+            number = number_last[0].strip()
+            last_name = number_last[1].strip() if len(number_last) > 1 else ''
+            full_name = name_parts[1].strip() + " " + last_name
+            current = players[full_name] = (number, [], [])
+        elif current is not None:
+            cell_class = ' '.join(cell.get('class', '').split())
+            if cell_class != _SHIFT_SUMMARY_CLASS:
+                current[1].append(line)
+            if cell_class != _SHIFT_CELL_CLASS:
+                current[2].append(line)
+
+    shifts = {column: [] for column in _SHIFT_COLUMNS + ['name', 'number']}
+    period_summary = {column: [] for column in _PERIOD_SUMMARY_COLUMNS + ['name', 'number']}
+    ragged_summary = []
+    for name, (number, shift_cells, summary_cells) in players.items():
+        # Shift rows are 5 cells wide; drop any trailing partial row
+        rows = len(shift_cells) // 5
+        for offset, column in enumerate(_SHIFT_COLUMNS):
+            shifts[column].extend(shift_cells[offset:rows * 5:5])
+        shifts['name'].extend([name] * rows)
+        shifts['number'].extend([number] * rows)
+
+        if len(summary_cells) % 6 != 0:
+            ragged_summary.append(name)
+            continue
+        rows = len(summary_cells) // 6
+        for offset, column in enumerate(_PERIOD_SUMMARY_COLUMNS):
+            period_summary[column].extend(summary_cells[offset::6])
+        period_summary['name'].extend([name] * rows)
+        period_summary['number'].extend([number] * rows)
+
+    return {'doc': doc, 'team': team, 'shifts': shifts, 'period_summary': period_summary,
+            'ragged_summary': ragged_summary}
+
+def _shift_report_team(report):
+    """
+    Team heading from a parsed shift report, with Montreal's name normalized.
+    """
+    team = report['team']
+    if team is None:
+        raise AttributeError('Shift report has no team heading.')
+    # Normalize Montreal team name (handles encoding issues)
+    if 'MONTR' in team and 'CANAD' in team:
+        team = 'MONTREAL CANADIENS'
+    return team
+
+def _find_goaltender_table(summary):
+    """
+    Find the GOALTENDER SUMMARY table on a game summary (GS) page, parsed with lxml.
+    """
+    # Both teams' goaltenders come from the same page, so it is parsed once per game
+    summary_doc = page_tree(summary, 'ISO-8859-1')
+
+    for section in summary_doc.xpath('//td[contains(concat(" ", normalize-space(@class), " "), " sectionheading ")]'):
+        if 'GOALTENDER SUMMARY' in section.text_content():
+            return section.xpath('ancestor::tr[1]/following-sibling::tr[1]')[0].xpath('.//table')[0]
+    raise IndexError('Game summary has no goaltender summary.')
+
+@reuse_unchanged_parse
 def scrape_html_shifts(season, game_id, live = True, home_page=None, away_page=None, summary = None, roster_cache = None, verbose=False):
     """
     Scrape HTML shifts pages.
@@ -738,7 +968,7 @@ def scrape_html_shifts(season, game_id, live = True, home_page=None, away_page=N
         
         # TIME: Home shifts network request
         net_start = time.time()
-        home_page = _session.get(url, timeout=10)
+        home_page = _http_get(url, timeout=10)
         net_duration = time.time() - net_start
         if verbose:
             try:
@@ -746,127 +976,27 @@ def scrape_html_shifts(season, game_id, live = True, home_page=None, away_page=N
             except Exception:
                 pass
 
-    # NOTE: Keeping BeautifulSoup for shifts parsing for now due to complex class matching
-    # lxml optimization applied to events parsing (major speedup achieved there)
-    # FIX: Use .text instead of .content to handle charset mismatch (HTML declares UTF-16 but is UTF-8)
-    if type(home_page) == str:
-        home_soup = BeautifulSoup(home_page)
-    else:
-        home_soup = BeautifulSoup(home_page.text, 'lxml')
-    found = home_soup.find_all('td', {'class':['playerHeading + border', 'lborder + bborder']})
-    if len(found)==0:
-        raise IndexError('This game has no shift data.')
-    thisteam = home_soup.find('td', {'align':'center', 'class':'teamHeading + border'}).get_text()
-    # Normalize Montreal team name (handles encoding issues)
-    if 'MONTR' in thisteam and 'CANAD' in thisteam:
-        thisteam = 'MONTREAL CANADIENS'
-
-    players = dict()
-
-    # OPTIMIZED: Reduce repeated string operations
-    for i in range(len(found)):
-        line = found[i].get_text()
-        if line == '25 PETTERSSON, ELIAS':
-            line = '25 PETTERSSON(D), ELIAS'
-        if ', ' in line:
-            # OPTIMIZED: Split once and reuse
-            name_parts = line.split(',')
-            if len(name_parts) >= 2:
-                number_last = name_parts[0].split(' ', 1)  # Split only once
-                number = number_last[0].strip()
-                last_name = number_last[1].strip() if len(number_last) > 1 else ''
-                first_name = name_parts[1].strip()
-                full_name = first_name + " " + last_name
-                players[full_name] = {
-                    'number': number,
-                    'name': full_name,
-                    'shifts': []
-                }
-        else:
-            players[full_name]['shifts'].append(line)  # Use append instead of extend([line])
+    # OPTIMIZED: One lxml pass over the report yields the shift columns and the per-period summary
+    home_report = _parse_shift_report(home_page)
+    thisteam = _shift_report_team(home_report)
 
-    # OPTIMIZED: Use list + concat instead of repeated _append()
-    alldf_list = []
-    for key in players.keys(): 
-        shifts_array = np.array(players[key]['shifts'])
-        length = (len(shifts_array) // 5) * 5
-        shifts_array = shifts_array[:length]
-        df = pd.DataFrame(shifts_array.reshape(-1, 5)).rename(
-        columns = {0:'shift_number', 1:'period', 2:'shift_start', 3:'shift_end', 4:'duration'})
-        df = df.assign(name = players[key]['name'],
-                        number = players[key]['number'],
-                        team = thisteam,
-                        venue = "home")
-        alldf_list.append(df)
-
-    home_shifts = pd.concat(alldf_list, ignore_index=True) if alldf_list else pd.DataFrame()
+    home_shifts = pd.DataFrame(home_report['shifts']).assign(team = thisteam, venue = "home")
 
     if live == True:
 
         home_shifts = home_shifts.assign(shift_number = home_shifts.shift_number.astype(int))
         home_shifts = home_shifts.assign(number = home_shifts.number.astype(int))
 
-        found = home_soup.find_all('td', {'class':['playerHeading + border', 'bborder + lborder +']})
-        if len(found)==0:
-            raise IndexError('This game has no shift data.')
-        thisteam = home_soup.find('td', {'align':'center', 'class':'teamHeading + border'}).get_text()
-        # Normalize Montreal team name (handles encoding issues)
-        if 'MONTR' in thisteam and 'CANAD' in thisteam:
-            thisteam = 'MONTREAL CANADIENS'
-
-        players = dict()
-
-        for i in range(len(found)):
-            line = found[i].get_text()
-            if line == '25 PETTERSSON, ELIAS':
-                line = '25 PETTERSSON(D), ELIAS'
-            if ', ' in line:
-                # OPTIMIZED: Split once and reuse
-                name_parts = line.split(',')
-                if len(name_parts) >= 2:
-                    number_last = name_parts[0].split(' ', 1)  # Split only once
-                    number = number_last[0].strip()
-                    last_name = number_last[1].strip() if len(number_last) > 1 else ''
-                    first_name = name_parts[1].strip()
-                    full_name = first_name + " " + last_name
-                    players[full_name] = {
-                        'number': number,
-                        'name': full_name,
-                        'shifts': []
-                    }
-            else:
-                players[full_name]['shifts'].append(line)  # Use append instead of extend([line])
-
-        # OPTIMIZED: Use list + concat instead of repeated _append()
-        alldf_list = []
-        for key in players.keys(): 
-            length = length = int(len(players[key]['shifts'])/6)
-            df = df = pd.DataFrame(np.array((players[key]['shifts'])).reshape(length, 6)).rename(
-            columns = {0:'period', 1:'shifts', 2:'avg', 3:'TOI', 4:'EV Total', 5:'PP Total'})
-            df = df.assign(name = players[key]['name'],
-                            number = players[key]['number'],
-                            team = thisteam,
-                            venue = "home")
-            alldf_list.append(df)
-            
-        home_extra_shifts = pd.concat(alldf_list, ignore_index=True) if alldf_list else pd.DataFrame()
+        if len(home_report['ragged_summary']) > 0:
+            raise ValueError('Period summary for ' + ', '.join(home_report['ragged_summary']) + ' does not divide into rows of 6 cells.')
+
+        home_extra_shifts = pd.DataFrame(home_report['period_summary']).assign(team = thisteam, venue = "home")
 
         # Trigger: There is no home goalie for this period and we're not about to pull one from the extra shifts. 
 
         if len(home_shifts[(home_shifts.period==max(home_shifts.period)) & (home_shifts.name.isin(home_goalie_names))]) == 0 and len(home_extra_shifts[home_extra_shifts.name.isin(home_goalie_names)]) == 0:
 
-            if type(summary) == str:
-                summary_soup = BeautifulSoup(summary)
-            else:
-                summary_soup = BeautifulSoup(summary.content.decode('ISO-8859-1'))
-
-            sections = summary_soup.find_all('td', class_='sectionheading')
-            for section in sections:
-                if 'GOALTENDER SUMMARY' in section.get_text():
-                    goalie_table = section.find_parent('tr').find_next_sibling('tr').find('table')
-                    break
-
-            goalie_summary = parse_goaltender_summary(goalie_table)
+            goalie_summary = parse_goaltender_summary(_find_goaltender_table(summary))
 
             goalie_summary = goalie_summary[((goalie_summary.team==thisteam) | (('CANADIENS' in thisteam) & (goalie_summary.team.str.contains('CANADIENS')))) & ~(pd.isna(goalie_summary['TOI']))]
 
@@ -950,7 +1080,7 @@ def scrape_html_shifts(season, game_id, live = True, home_page=None, away_page=N
         
         # TIME: away shifts network request
         net_start = time.time()
-        away_page = _session.get(url, timeout=10)
+        away_page = _http_get(url, timeout=10)
         net_duration = time.time() - net_start
         if verbose:
             try:
@@ -958,121 +1088,29 @@ def scrape_html_shifts(season, game_id, live = True, home_page=None, away_page=N
             except Exception:
                 pass
 
-    # NOTE: Keeping BeautifulSoup for shifts parsing for now due to complex class matching
-    # lxml optimization applied to events parsing (major speedup achieved there)
-    # FIX: Use .text instead of .content to handle charset mismatch (HTML declares UTF-16 but is UTF-8)
-    if type(away_page) == str:
-        away_soup = BeautifulSoup(away_page)
-    else:
-        away_soup = BeautifulSoup(away_page.text, 'lxml')
-    found = away_soup.find_all('td', {'class':['playerHeading + border', 'lborder + bborder']})
-    if len(found)==0:
-        raise IndexError('This game has no shift data.')
-    thisteam = away_soup.find('td', {'align':'center', 'class':'teamHeading + border'}).get_text()
-
-    players = dict()
-
-    # OPTIMIZED: Reduce repeated string operations
-    for i in range(len(found)):
-        line = found[i].get_text()
-        if line == '25 PETTERSSON, ELIAS':
-            line = '25 PETTERSSON(D), ELIAS'
-        if ', ' in line:
-            # OPTIMIZED: Split once and reuse
-            name_parts = line.split(',')
-            if len(name_parts) >= 2:
-                number_last = name_parts[0].split(' ', 1)  # Split only once
-                number = number_last[0].strip()
-                last_name = number_last[1].strip() if len(number_last) > 1 else ''
-                first_name = name_parts[1].strip()
-                full_name = first_name + " " + last_name
-                players[full_name] = {
-                    'number': number,
-                    'name': full_name,
-                    'shifts': []
-                }
-        else:
-            players[full_name]['shifts'].append(line)  # Use append instead of extend([line])
+    # OPTIMIZED: One lxml pass over the report yields the shift columns and the per-period summary
+    away_report = _parse_shift_report(away_page)
+    thisteam = away_report['team']
+    if thisteam is None:
+        raise AttributeError('Shift report has no team heading.')
 
-    # OPTIMIZED: Use list + concat instead of repeated _append()
-    alldf_list = []
-    for key in players.keys(): 
-        shifts_array = np.array(players[key]['shifts'])
-        length = (len(shifts_array) // 5) * 5
-        shifts_array = shifts_array[:length]
-        df = pd.DataFrame(shifts_array.reshape(-1, 5)).rename(
-        columns = {0:'shift_number', 1:'period', 2:'shift_start', 3:'shift_end', 4:'duration'})
-        df = df.assign(name = players[key]['name'],
-                        number = players[key]['number'],
-                        team = thisteam,
-                        venue = "away")
-        alldf_list.append(df)
-
-    away_shifts = pd.concat(alldf_list, ignore_index=True) if alldf_list else pd.DataFrame()
+    away_shifts = pd.DataFrame(away_report['shifts']).assign(team = thisteam, venue = "away")
 
     if live == True:
 
         away_shifts = away_shifts.assign(shift_number = away_shifts.shift_number.astype(int))
         away_shifts = away_shifts.assign(number = away_shifts.number.astype(int))
 
-        found = away_soup.find_all('td', {'class':['playerHeading + border', 'bborder + lborder +']})
-        if len(found)==0:
-            raise IndexError('This game has no shift data.')
-        thisteam = away_soup.find('td', {'align':'center', 'class':'teamHeading + border'}).get_text()
-
-        players = dict()
-
-        for i in range(len(found)):
-            line = found[i].get_text()
-            if line == '25 PETTERSSON, ELIAS':
-                line = '25 PETTERSSON(D), ELIAS'
-            if ', ' in line:
-                # OPTIMIZED: Split once and reuse
-                name_parts = line.split(',')
-                if len(name_parts) >= 2:
-                    number_last = name_parts[0].split(' ', 1)  # Split only once
-                    number = number_last[0].strip()
-                    last_name = number_last[1].strip() if len(number_last) > 1 else ''
-                    first_name = name_parts[1].strip()
-                    full_name = first_name + " " + last_name
-                    players[full_name] = {
-                        'number': number,
-                        'name': full_name,
-                        'shifts': []
-                    }
-            else:
-                players[full_name]['shifts'].append(line)  # Use append instead of extend([line])
-
-        # OPTIMIZED: Use list + concat instead of repeated _append()
-        alldf_list = []
-        for key in players.keys(): 
-            length = length = int(len(players[key]['shifts'])/6)
-            df = df = pd.DataFrame(np.array((players[key]['shifts'])).reshape(length, 6)).rename(
-            columns = {0:'period', 1:'shifts', 2:'avg', 3:'TOI', 4:'EV Total', 5:'PP Total'})
-            df = df.assign(name = players[key]['name'],
-                            number = players[key]['number'],
-                            team = thisteam,
-                            venue = "away")
-            alldf_list.append(df)
-            
-        away_extra_shifts = pd.concat(alldf_list, ignore_index=True) if alldf_list else pd.DataFrame()
+        if len(away_report['ragged_summary']) > 0:
+            raise ValueError('Period summary for ' + ', '.join(away_report['ragged_summary']) + ' does not divide into rows of 6 cells.')
+
+        away_extra_shifts = pd.DataFrame(away_report['period_summary']).assign(team = thisteam, venue = "away")
 
         # Trigger: There is no away goalie for this period and we're not about to pull one from the extra shifts. 
 
         if len(away_shifts[(away_shifts.period==max(away_shifts.period)) & (away_shifts.name.isin(away_goalie_names))]) == 0 and len(away_extra_shifts[away_extra_shifts.name.isin(away_goalie_names)]) == 0:
 
-            if type(summary) == str:
-                summary_soup = BeautifulSoup(summary)
-            else:
-                summary_soup = BeautifulSoup(summary.content.decode('ISO-8859-1'))
-
-            sections = summary_soup.find_all('td', class_='sectionheading')
-            for section in sections:
-                if 'GOALTENDER SUMMARY' in section.get_text():
-                    goalie_table = section.find_parent('tr').find_next_sibling('tr').find('table')
-                    break
-
-            goalie_summary = parse_goaltender_summary(goalie_table)
+            goalie_summary = parse_goaltender_summary(_find_goaltender_table(summary))
 
             goalie_summary = goalie_summary[((goalie_summary.team==thisteam) | (('CANADIENS' in thisteam) & (goalie_summary.team.str.contains('CANADIENS')))) & ~(pd.isna(goalie_summary['TOI']))]
 
@@ -1155,23 +1193,14 @@ def scrape_html_shifts(season, game_id, live = True, home_page=None, away_page=N
     # This addresses NHL data quality issues where goalie shifts are missing
     # from the detailed shift list but present in the period summary
     if not live and int(season) < 20232024:
-        # Get team names from the parsed data
-        home_team_name = home_soup.find('td', {'align': 'center', 'class': 'teamHeading + border'}).get_text()
-        if 'MONTR' in home_team_name and 'CANAD' in home_team_name:
-            home_team_name = 'MONTREAL CANADIENS'
-
-        away_team_name = away_soup.find('td', {'align': 'center', 'class': 'teamHeading + border'}).get_text()
-        if 'MONTR' in away_team_name and 'CANAD' in away_team_name:
-            away_team_name = 'MONTREAL CANADIENS'
-
         # Backfill home goalie shifts
         home_shifts = backfill_missing_goalie_shifts_from_period_summary(
-            home_shifts, home_soup, home_goalie_names, home_team_name, 'home'
+            home_shifts, pd.DataFrame(home_report['period_summary']), home_goalie_names, _shift_report_team(home_report), 'home'
         )
 
         # Backfill away goalie shifts
         away_shifts = backfill_missing_goalie_shifts_from_period_summary(
-            away_shifts, away_soup, away_goalie_names, away_team_name, 'away'
+            away_shifts, pd.DataFrame(away_report['period_summary']), away_goalie_names, _shift_report_team(away_report), 'away'
         )
 
     home_shifts = home_shifts[~home_shifts.duration.str.startswith('-')]
@@ -1221,7 +1250,7 @@ def scrape_html_shifts(season, game_id, live = True, home_page=None, away_page=N
     
     # OPTIMIZED: Use dictionary lookup instead of nested np.where() chains
     all_shifts['name'] = all_shifts['name'].str.normalize('NFKD').str.encode('ascii', errors='ignore').str.decode('utf-8').str.upper()
-    all_shifts['name'] = all_shifts['name'].apply(lambda x: normalize_player_name(x))
+    all_shifts['name'] = normalize_player_names(all_shifts['name'])
     
     # OPTIMIZED: Already handled by dictionary lookup above
     # Old nested chains removed - they were replaced with: all_shifts['name'] = all_shifts['name'].replace(_NAME_CORRECTIONS) 
@@ -1361,6 +1390,7 @@ def scrape_html_shifts(season, game_id, live = True, home_page=None, away_page=N
 
     return full_changes.reset_index(drop = True)
 
+@reuse_unchanged_parse
 def scrape_html_events(season, game_id, events_page=None, roster_page=None, verbose=False):
     """
     Scrape HTML events page.
@@ -1381,7 +1411,7 @@ def scrape_html_events(season, game_id, events_page=None, roster_page=None, verb
         
         # TIME: Network request
         net_start = time.time()
-        events_page = _session.get(url, timeout=10)
+        events_page = _http_get(url, timeout=10)
         net_duration = time.time() - net_start
         if verbose:
             try:
@@ -1397,31 +1427,11 @@ def scrape_html_events(season, game_id, events_page=None, roster_page=None, verb
     # TIME: Parsing
     parse_start = time.time()
     # OPTIMIZED: Use lxml directly instead of BeautifulSoup for faster parsing
-    if type(events_page) == str:
-        doc = html.fromstring(events_page)
-    else:
-        doc = html.fromstring(events_page.content.decode('ISO-8859-1'))
+    doc = page_tree(events_page, 'ISO-8859-1')
     # XPath to find td elements with class containing 'bborder'
     tds = doc.xpath("//td[contains(@class, 'bborder')]")
-    #global stripped_html
-    #global eventdf
-    stripped_html = hs_strip_html(tds)
-    length = (len(stripped_html) // 8) * 8
-
-    # Validate we got meaningful HTML data
-    if length == 0:
-        raise ValueError(f"HTML events page returned no valid event data (found {len(tds)} td elements)")
-
-    stripped_html = stripped_html[:length]
-    eventdf = pd.DataFrame(np.array(stripped_html).reshape(int(length/8), 8)).rename(
-    columns = {0:'index', 1:'period', 2:'strength', 3:'time', 4:'event', 5:'description', 6:'away_skaters', 7:'home_skaters'})
-
-    # Validate time column has actual time data (should contain ':' like "12:34")
-    # This catches cases where HTML returned but contained garbage/error page content
-    eventdf['time'] = eventdf['time'].astype(str)
-    if not eventdf['time'].str.contains(':').any():
-        raise ValueError(f"HTML events page has no valid time data (first 3 values: {eventdf['time'].head(3).tolist()})")
-    split = eventdf.time.str.split(':')
+    # OPTIMIZED: One pass over the table cells builds every column; the DataFrame is created once below
+    columns, away_team_abbreviated, home_team_abbreviated = _parse_events_table(tds)
     # XPath to find td elements with align='center' and style containing 'font-size: 10px;font-weight:bold'
     potentialnames = doc.xpath("//td[@align='center' and contains(@style, 'font-size: 10px;font-weight:bold')]")
     game_date = potentialnames[2].text_content() if len(potentialnames) > 2 else ''
@@ -1438,69 +1448,13 @@ def scrape_html_events(season, game_id, events_page=None, roster_page=None, verb
             home = _MATCH_GAME_PATTERN.split(home)[0]
             break
             
-    game = eventdf.assign(away_skaters = eventdf.away_skaters.str.replace('\n', ''),
-                  home_skaters = eventdf.home_skaters.str.replace('\n', ''),
-                  original_time = eventdf.time,
-                  time = split.str[0] + ":" + split.str[1].str[:2],
-                  home_team = home,
-                  away_team = away)
-    
-    game = game.assign(away_team_abbreviated = game.away_skaters[0].split(' ')[0],
-                       home_team_abbreviated = game.home_skaters[0].split(' ')[0])
-    
-    game = game[game.period!='Per']
-    
-    game = game.assign(index = game.index.astype(int)).rename(columns = {'index':'event_index'})
-    
-    game = game.assign(event_team = game.description.str.split(' ').str[0])
-    
-    game = game.assign(event_team = game.event_team.str.split('\xa0').str[0])
-    
-    game = game.assign(event_team = np.where(~game.event_team.isin([game.home_team_abbreviated.iloc[0], game.away_team_abbreviated.iloc[0]]), '\xa0', game.event_team))
-    
-    game = game.assign(other_team = np.where(game.event_team=='', '\xa0',
-                                            np.where(game.event_team==game.home_team_abbreviated.iloc[0], game.away_team_abbreviated.iloc[0], game.home_team_abbreviated.iloc[0])))
-    
-    # Optimized: use single function instead of multiple .str.replace() calls
-    def _extract_player_numbers(desc):
-        matches = re.findall(r'[#-]\s*(\d+)', str(desc))
-        return ' '.join(matches)
-    game['event_player_str'] = game.description.apply(_extract_player_numbers)
-
-    game = game.assign(event_player_1 = 
-            game.event_player_str.str.split(' ').str[0],
-            event_player_2 = 
-            game.event_player_str.str.split(' ').str[1],
-            event_player_3 = 
-            game.event_player_str.str.split(' ').str[2])
-    #return game
-
-    if len(game[game.description.str.contains('Drawn By')])>0:
-    
-        game = game.assign(event_player_2 = np.where(game.description.str.contains('Drawn By'), 
-                                          game.description.str.split('Drawn By').str[1].str.split('#').str[1].str.split(' ').str[0].str.strip(), 
-                                          game.event_player_2),
-                          event_player_3 = np.where(game.description.str.contains('Served By'),
-                                                   '\xa0',
-                                                   game.event_player_3))
-
-    game = game.assign(event_player_1 = np.where((~pd.isna(game.event_player_1)) & (game.event_player_1!=''),
-                              np.where(game.event=='FAC', game.away_team_abbreviated,
-                                       game.event_team) + (game.event_player_1.astype(str)), 
-                              game.event_player_1),
-                  event_player_2 = np.where((~pd.isna(game.event_player_2)) & (game.event_player_2!=''),
-                              np.where(game.event=='FAC', game.home_team_abbreviated,
-                                       np.where(game.event.isin(['BLOCK', 'HIT', 'PENL']), game.other_team, game.event_team)) + (game.event_player_2.astype(str)), 
-                              game.event_player_2),
-                  event_player_3 = np.where((~pd.isna(game.event_player_3)) & (game.event_player_3!=''),
-                              game.event_team + (game.event_player_3.astype(str)), 
-                              game.event_player_3))
-    
-    game = game.assign(
-        event_player_1 = np.where((game.event=='FAC') & (game.event_team==game.home_team_abbreviated),
-                                 game.event_player_2, game.event_player_1),
-        event_player_2 = np.where((game.event=='FAC') & (game.event_team==game.home_team_abbreviated),
-                                 game.event_player_1, game.event_player_2))
+    object_columns = ['event_player_1', 'event_player_2', 'event_player_3']
+    game = pd.DataFrame({name: (np.array(values, dtype=object) if name in object_columns else values)
+                         for name, values in columns.items()})
+    game.insert(game.columns.get_loc('original_time') + 1, 'home_team', home)
+    game.insert(game.columns.get_loc('home_team') + 1, 'away_team', away)
+    game.insert(game.columns.get_loc('away_team') + 1, 'away_team_abbreviated', away_team_abbreviated)
+    game.insert(game.columns.get_loc('away_team_abbreviated') + 1, 'home_team_abbreviated', home_team_abbreviated)
     
     #return game
     
@@ -1524,14 +1478,6 @@ def scrape_html_events(season, game_id, events_page=None, roster_page=None, verb
     event_player_3s, on = 'event_player_3', how = 'left').assign(
     date = game_date)
     #return game
-    game['period'] = np.where(game['period'] == '', '1', game['period'])
-    game['time'] = np.where((game['time'] == '') | (pd.isna(game['time'])), '0:00', game['time'])
-    game['period'] = game.period.astype(int)
-
-    # OPTIMIZED: Split time once instead of twice
-    time_split = game.time.str.split(':')
-    game['period_seconds'] = time_split.str[0].str.replace('-', '', regex=False).astype(int) * 60 + time_split.str[1].str.replace('-', '', regex=False).astype(int)
-
     game['game_seconds'] = (np.where((game.period<5) & int(game_id[0])!=3, 
                                        (((game.period - 1) * 1200) + game.period_seconds),
                               3900))
@@ -1610,7 +1556,30 @@ def scrape_html_events(season, game_id, events_page=None, roster_page=None, verb
     #     pass
     
     # OPTIMIZATION: Return roster to avoid re-scraping in merge_and_prepare
-    return game.drop(columns = ['period_seconds', 'time', 'priority', 'home_skater_count_temp', 'away_skater_count_temp']), roster
+    return game.drop(columns = ['period_seconds', 'priority', 'home_skater_count_temp', 'away_skater_count_temp']), roster
+
+_JSON_DECODER = json.JSONDecoder()
+_WHITESPACE_PATTERN = re.compile(r'\s*')
+
+def _embedded_json(text, marker):
+    """
+    Decode the JSON value embedded in a page right after the first occurrence of `marker`.
+
+    The decoder stops at the value's own closing bracket, so nothing that follows it
+    needs to be split off and the page is never built into a DOM.
+
+    Args:
+        text: Raw page text
+        marker: Text just before the value, e.g. '"playGrps":'
+
+    Returns:
+        The decoded value
+    """
+    start = text.find(marker)
+    if start == -1:
+        raise IndexError(f'No {marker} found in page.')
+    start = _WHITESPACE_PATTERN.match(text, start + len(marker)).end()
+    return _JSON_DECODER.raw_decode(text, start)[0]
 
 def scrape_espn_events(espn_game_id, drop_description = True):
 
@@ -1618,23 +1587,20 @@ def scrape_espn_events(espn_game_id, drop_description = True):
     
     url = f'https://www.espn.com/nhl/playbyplay/_/gameId/{espn_game_id}'
     
-    page = _session.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=30)
+    page = _http_get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=30)
     
-    soup = BeautifulSoup(page.content.decode('ISO-8859-1'), 'lxml', multi_valued_attributes = None)
+    # OPTIMIZED: Pull the embedded JSON straight out of the page text instead of building and re-serializing a soup
+    text = page.content.decode('ISO-8859-1')
     
-    period_jsons = json.loads(str(soup).split('"playGrps":')[1].split(',"tms"')[0])
+    period_jsons = _embedded_json(text, '"playGrps":')
     
-    # OPTIMIZED: Use list + concat instead of repeated _append()
-    clock_df_list = []
-    for period in range(0, len(period_jsons)):
-        clock_df_list.append(pd.DataFrame(period_jsons[period]))
-    clock_df = pd.concat(clock_df_list, ignore_index=True) if clock_df_list else pd.DataFrame()
+    # OPTIMIZED: One frame from every period's plays instead of a frame per period
+    clock_df = pd.DataFrame([play for period in period_jsons for play in period])
 
     clock_df = clock_df[~pd.isna(clock_df.clock)]
 
-    # Needed to add .split(',"st":3')[0] for playoffs
-
-    coords_df = pd.DataFrame(json.loads(str(soup).split('plays":')[1].split(',"st":1')[0].split(',"st":2')[0].split(',"st":3')[0]))
+    # The decoder stops at the end of the plays array, whatever follows it (e.g. ',"st":3' in the playoffs)
+    coords_df = pd.DataFrame(_embedded_json(text, 'plays":'))
 
     clock_df = clock_df.assign(
         clock = clock_df.clock.apply(lambda x: x['displayValue'])
@@ -1865,7 +1831,7 @@ def scrape_espn_ids_single_game(game_date, home_team, away_team):
     
     this_date = (game_date)
     url = 'http://www.espn.com/nhl/scoreboard?date=' + this_date.replace("-", "")
-    page = _session.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=30)
+    page = _http_get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=30)
     print('Request to ESPN IDs successful.')
     soup = BeautifulSoup(page.content, 'lxml')
     soup_found = soup.find_all('a', {'class':['AnchorLink truncate', 
@@ -2021,6 +1987,159 @@ def scrape_espn_ids_single_game(game_date, home_team, away_team):
         
     return(gamedays)
 
+def _player_codes(side_roster):
+    """
+    Assign each of one team's dressed players a small integer code for on-ice tracking.
+
+    Codes are the players' positions in natural name order, so sorting codes sorts names.
+
+    Args:
+        side_roster: One team's non-scratched rows of the game roster (Name, teamnum and # columns)
+
+    Returns:
+        names: Object array of names by code, with a trailing blank so that code -1 (an empty slot) reads as '\\xa0'
+        teamnums: List of each code's team abbreviation + jersey number, as written in the shift data
+        jersey_codes: Dict of jersey number (str) -> code
+    """
+    # A name listed twice keeps its last row, as a name-keyed dict of players would
+    teamnum_by_name = dict(zip(side_roster.Name, side_roster.teamnum))
+    ordered_names = natsorted(teamnum_by_name)
+    code_by_name = {name: code for code, name in enumerate(ordered_names)}
+    teamnums = [teamnum_by_name[name] for name in ordered_names]
+    jersey_codes = {jersey: code_by_name[name] for jersey, name in zip(side_roster['#'].astype(str), side_roster.Name)}
+    names = np.array(ordered_names + ['\xa0'], dtype=object)
+    return names, teamnums, jersey_codes
+
+def _change_tokens(column):
+    """
+    Split a jumping_on/jumping_off column into one (row, teamnum) pair per listed player.
+
+    Players are listed as "TEAM1, TEAM2"; a piece that follows a bare ',' is not read as a
+    player, so this finds exactly the whole-value matches of the old per-player regex.
+
+    Args:
+        column: Series of comma-separated teamnums; missing values list no one
+
+    Returns:
+        rows: Int array of row positions
+        tokens: Object array of the teamnum listed at each of those rows
+    """
+    rows = []
+    tokens = []
+    for row, value in enumerate(column):
+        if not isinstance(value, str):
+            continue
+        pieces = value.split(',')
+        rows.append(row)
+        tokens.append(pieces[0])
+        for piece in pieces[1:]:
+            if piece[:1] == ' ':
+                rows.append(row)
+                tokens.append(piece[1:])
+    return np.array(rows, dtype=np.int64), np.array(tokens, dtype=object)
+
+def _on_ice_slots(counts):
+    """
+    Pack the players on the ice at each row into 9 slots.
+
+    Args:
+        counts: Running on-ice counts, rows x player codes (see _player_codes)
+
+    Returns:
+        Int array, rows x 9, of the codes with a count of exactly 1 in ascending (natural name)
+        order, padded with -1. Players past the ninth are dropped.
+    """
+    on_ice = counts == 1
+    slot = np.cumsum(on_ice, axis = 1) - 1
+    rows, codes = np.nonzero(on_ice & (slot < 9))
+    slots = np.full((len(counts), 9), -1, dtype=np.int64)
+    slots[rows, slot[rows, codes]] = codes
+    return slots
+
+def _html_on_ice_slots(on_ice_strings, jersey_codes):
+    """
+    Read one team's on-ice players from the HTML PBP on-ice cells into 9 code slots.
+
+    Args:
+        on_ice_strings: Series of HTML on-ice text, one per event
+        jersey_codes: Dict of jersey number (str) -> player code (see _player_codes)
+
+    Returns:
+        slots: Int array, rows x 9, of the listed players' codes in ascending (natural name) order,
+            padded with -1. Jerseys not on the roster are skipped.
+        has_data: Bool array, True for rows that list at least one rostered player
+    """
+    # Lineups repeat from event to event, so each distinct string is parsed once
+    ids, uniques = pd.factorize(on_ice_strings.astype(str))
+    unique_slots = np.full((len(uniques), 9), -1, dtype=np.int64)
+    unique_has_data = np.zeros(len(uniques), dtype=bool)
+    for u, on_ice_string in enumerate(uniques):
+        codes = sorted(jersey_codes[j] for j in _HTML_ON_ICE_PATTERN.findall(on_ice_string) if j in jersey_codes)[:9]
+        unique_slots[u, :len(codes)] = codes
+        unique_has_data[u] = len(codes) > 0
+    return unique_slots[ids], unique_has_data[ids]
+
+def _lexsort_codes(values):
+    """
+    Integer sort key for np.lexsort that orders like sort_values: ascending, missing values last.
+    """
+    codes, uniques = pd.factorize(values, sort = True)
+    return np.where(codes == -1, len(uniques), codes)
+
+def _on_ice_names(names, slots, goalie_names):
+    """
+    Turn one team's slot array into on-ice names and pick out the goalie on the ice.
+
+    Args:
+        names: Names by player code, from _player_codes (ending in the blank for code -1)
+        slots: Int array, rows x 9, of player codes (-1 for an empty slot)
+        goalie_names: Names of the game's dressed goalies
+
+    Returns:
+        on_ice: Object array, rows x 9, of names; missing or empty names read as '\xa0'
+        goalie: Object array with the name in the first slot held by a goalie, or '\xa0'
+    """
+    # Membership and blank checks run once per player, not once per row and slot
+    is_goalie = pd.Index(names).isin(goalie_names)
+    names = np.where(pd.isna(names) | (names == ''), '\xa0', names)
+    on_ice = names[slots]
+    goalie_slots = is_goalie[slots]
+    first_goalie = slots[np.arange(len(slots)), goalie_slots.argmax(axis = 1)]
+    goalie = np.where(goalie_slots.any(axis = 1), names[first_goalie], '\xa0')
+    return on_ice, goalie
+
+def _natsorted_joins(token_lists):
+    """
+    Vectorized equivalent of token_lists.apply(lambda x: ' '.join(natsorted(x))).
+
+    Tokens are exploded into one array, each distinct token is ranked once by its natsort
+    key, and a stable lexsort orders every row's tokens by rank before they are re-joined.
+    Tokens whose keys tie keep their order within the row, as in natsorted.
+
+    Args:
+        token_lists: Series of lists of str, none of them empty (e.g. from str.split)
+
+    Returns:
+        Object array of the joined strings, in the order of token_lists
+    """
+    lengths = token_lists.str.len().to_numpy(dtype=np.int64)
+    rows = np.repeat(np.arange(len(token_lists)), lengths)
+    token_ids, uniques = pd.factorize(token_lists.explode().to_numpy())
+    natsort_key = natsort_keygen()
+    keys = [natsort_key(token) for token in uniques]
+    # Dense rank of each distinct token's key, so tokens with equal keys compare equal
+    unique_ranks = np.zeros(len(uniques), dtype=np.int64)
+    rank = -1
+    previous_key = None
+    for position, u in enumerate(sorted(range(len(uniques)), key=keys.__getitem__)):
+        if position == 0 or keys[u] != previous_key:
+            rank += 1
+            previous_key = keys[u]
+        unique_ranks[u] = rank
+    order = np.lexsort((unique_ranks[token_ids], rows))
+    joined = pd.Series(uniques[token_ids[order]], dtype=object).groupby(rows[order]).agg(' '.join)
+    return joined.to_numpy(dtype=object)
+
 def merge_and_prepare(events, shifts, roster=None, live = False):
     
     season = str(int(str(events.game_id.iloc[0])[:4])) + str(int(str(events.game_id.iloc[0])[:4]) + 1)
@@ -2062,8 +2181,8 @@ def merge_and_prepare(events, shifts, roster=None, live = False):
 
     merged['tmp'] = merged.away_skaters.str.replace("[^0-9]", " ")
 
-    # OPTIMIZED: Combine two .apply() calls into one (reduces function calls from 2N to N)
-    merged['tmp2'] = (merged.tmp.str.strip().str.split("  ")).apply(lambda x: ' '.join(natsorted(x)))
+    # OPTIMIZED: Natural sort of every row's tokens at once instead of natsorted() per row
+    merged['tmp2'] = _natsorted_joins(merged.tmp.str.strip().str.split("  "))
 
     merged['tmp2'] = (merged.away_team_abbreviated.iloc[0] + merged.tmp2).str.replace(" ", away_space).str.replace(" ", ", ")
 
@@ -2075,8 +2194,8 @@ def merge_and_prepare(events, shifts, roster=None, live = False):
 
     merged['tmp'] = merged.home_skaters.str.replace("[^0-9]", " ")
 
-    # OPTIMIZED: Combine two .apply() calls into one (reduces function calls from 2N to N)
-    merged['tmp2'] = (merged.tmp.str.strip().str.split("  ")).apply(lambda x: ' '.join(natsorted(x)))
+    # OPTIMIZED: Natural sort of every row's tokens at once instead of natsorted() per row
+    merged['tmp2'] = _natsorted_joins(merged.tmp.str.strip().str.split("  "))
 
     merged['tmp2'] = (merged.home_team_abbreviated.iloc[0] + merged.tmp2).str.replace(" ", home_space).str.replace(" ", ", ")
 
@@ -2084,24 +2203,13 @@ def merge_and_prepare(events, shifts, roster=None, live = False):
 
     merged['home_on_ice'] = merged['tmp2']
 
-    merged = merged.sort_values(by = ['game_seconds', 'period'])
-
+    # OPTIMIZED: Rows are put in order once, by the single lexsort after priorities are assigned
     merged = merged.assign(jumping_on = (np.where(merged.home_team == merged.team, (merged.home_team_abbreviated.iloc[0] + merged.on_numbers).str.replace(", ", home_space).str.replace(" ", ", "), 
                                    np.where(merged.away_team == merged.team, (merged.away_team_abbreviated.iloc[0] + merged.on_numbers).str.replace(", ", away_space).str.replace(" ", ", "),
                                             '\xa0'))),
                           jumping_off = (np.where(merged.home_team == merged.team, (merged.home_team_abbreviated.iloc[0] + merged.off_numbers).str.replace(", ", home_space).str.replace(" ", ", "), 
                                    np.where(merged.away_team == merged.team, (merged.away_team_abbreviated.iloc[0] + merged.off_numbers).str.replace(", ", away_space).str.replace(" ", ", "),
-                                            '\xa0'))),
-                          prio = np.where(merged.event=="CHANGE", 0,
-                                          np.where(merged.event.isin(['PGSTR', 'PGEND', 'PSTR', 'PEND', 'ANTHEM']), -1, 1))).sort_values(
-        by = ['game_seconds', 'period', 'event_index'])
-
-    merged = merged.assign(change_before_event = np.where(
-        (
-            (merged.away_on_ice!='') & (merged.event.shift()=='CHANGE') & (merged.away_on_ice!=merged.away_on_ice.shift()) | 
-            (merged.home_on_ice!='') & (merged.event.shift()=='CHANGE') & (merged.home_on_ice!=merged.home_on_ice.shift())
-        ), 1, 0
-    ))
+                                            '\xa0'))))
 
     merged = merged.assign(change_prio =
                           np.where((merged.team==merged.home_team) & (merged.event=='CHANGE') , 1,
@@ -2115,26 +2223,13 @@ def merge_and_prepare(events, shifts, roster=None, live = False):
     # We detect this by checking if on_numbers appear in play event home_skaters/away_skaters.
     # =========================================================================
 
-    # Helper to extract jersey numbers from on-ice string (e.g., "18 C 47 C 73 D" -> {'18', '47', '73'})
-    def _extract_jersey_numbers(on_ice_str):
-        if pd.isna(on_ice_str) or not isinstance(on_ice_str, str):
-            return set()
-        # Match digits followed by position letter (C, L, R, D, G, W)
-        return set(re.findall(r'(\d+)\s*[CLDGRW]', on_ice_str))
-
-    # Helper to extract jersey numbers from on_numbers string (e.g., "44, 51" -> {'44', '51'})
-    def _extract_change_numbers(on_numbers_str):
-        if pd.isna(on_numbers_str) or not isinstance(on_numbers_str, str):
-            return set()
-        return set(re.findall(r'(\d+)', on_numbers_str))
-
-    # OPTIMIZED: Vectorized CHANGE ordering (replaces slow nested loop)
+    # OPTIMIZED: Vectorized CHANGE ordering (replaces per-row jersey sets and the per-CHANGE loop)
     # Determine if each CHANGE should come BEFORE play events at the same game_seconds
     # by checking if any player jumping ON appears on-ice for a play event
     #
     # IMPORTANT: Reset index first to ensure unique indices. After pd.concat([events, shifts]),
-    # the DataFrame has duplicate indices which causes get_loc() to return boolean masks
-    # instead of integer positions. See docs/CHANGE_ORDERING_BUGS.md for details.
+    # the DataFrame has duplicate indices; the relations below are keyed by row position.
+    # See docs/CHANGE_ORDERING_BUGS.md for details.
     merged = merged.reset_index(drop=True)
     change_should_be_before = np.zeros(len(merged), dtype=bool)
 
@@ -2143,74 +2238,51 @@ def merge_and_prepare(events, shifts, roster=None, live = False):
     # mark CHANGEs as should_be_before.
     play_events = {'TAKE', 'GIVE', 'MISS', 'HIT', 'SHOT', 'BLOCK', 'GOAL'}
 
-    # Step 1: Pre-compute jersey sets for all rows once (avoid repeated parsing)
-    merged['_home_jerseys'] = merged['home_skaters'].apply(_extract_jersey_numbers)
-    merged['_away_jerseys'] = merged['away_skaters'].apply(_extract_jersey_numbers)
-    merged['_on_numbers'] = merged['on_numbers'].apply(_extract_change_numbers)
+    def jersey_relation(rows, numbers, pattern, team):
+        """(row, game_seconds, team, jersey) for every jersey number matched in the given rows."""
+        # Non-string values (e.g. a column that is entirely NaN) list no jerseys
+        jerseys = merged.loc[rows, numbers].astype(object).str.extractall(pattern)[0]
+        row = jerseys.index.get_level_values(0)
+        return pd.DataFrame({'row': row, 'game_seconds': merged.game_seconds.to_numpy()[row],
+                             'team': team, 'jersey': jerseys.to_numpy()})
 
-    # Step 2: Get play events and compute jersey unions per game_seconds
+    # Step 1: (game_seconds, team, jersey) for every player on the ice at a play event,
+    # e.g. "18 C 47 C 73 D" -> 18, 47, 73: digits followed by a position letter
     play_mask = merged.event.isin(play_events)
-    play_df = merged[play_mask][['game_seconds', '_home_jerseys', '_away_jerseys']]
-
-    if len(play_df) > 0:
-        # Group by game_seconds and compute union of all jerseys from play events
-        def union_sets(series):
-            result = set()
-            for s in series:
-                result |= s
-            return result
-
-        play_unions = play_df.groupby('game_seconds').agg({
-            '_home_jerseys': union_sets,
-            '_away_jerseys': union_sets
-        })
-
-        # Step 3: For each CHANGE event, check intersection with play event jerseys
-        change_mask = merged.event == 'CHANGE'
-        change_indices = merged[change_mask].index.tolist()
-
-        # Pre-fetch data for all CHANGE events (faster than row-by-row access)
-        change_data = merged.loc[change_indices, ['game_seconds', 'team', '_on_numbers']]
-
-        for idx in change_indices:
-            gs = change_data.loc[idx, 'game_seconds']
-            if gs not in play_unions.index:
-                continue
-
-            change_team = change_data.loc[idx, 'team']
-            on_nums = change_data.loc[idx, '_on_numbers']
-
-            if change_team == home_team:
-                relevant = play_unions.loc[gs, '_home_jerseys']
-            elif change_team == away_team:
-                relevant = play_unions.loc[gs, '_away_jerseys']
-            else:
-                continue
-
-            if on_nums & relevant:
-                change_should_be_before[idx] = True
-
-    # Clean up temporary columns
-    merged = merged.drop(columns=['_home_jerseys', '_away_jerseys', '_on_numbers'])
+    on_ice_pattern = r'(\d+)\s*[CLDGRW]'
+    play_jerseys = pd.concat([
+        jersey_relation(play_mask, 'home_skaters', on_ice_pattern, home_team),
+        jersey_relation(play_mask, 'away_skaters', on_ice_pattern, away_team)
+    ]).drop(columns = 'row').dropna(subset = ['game_seconds']).drop_duplicates()
+
+    # Step 2: (row, game_seconds, team, jersey) for every player jumping on at a CHANGE,
+    # e.g. "44, 51" -> 44, 51
+    change_jerseys = pd.concat([
+        jersey_relation((merged.event == 'CHANGE') & (merged.team == team), 'on_numbers', r'(\d+)', team)
+        for team in [home_team, away_team]
+    ])
+
+    # Step 3: A CHANGE goes first if any player it brings on is on the ice for a play at that second
+    before_rows = change_jerseys.merge(play_jerseys, on = ['game_seconds', 'team', 'jersey']).row
+    change_should_be_before[before_rows.to_numpy(dtype=np.int64)] = True
 
     # Assign priority: CHANGE events that should come before play events get priority 0.5
-    # (between period events at -1/0 and play events at 1)
-    merged = merged.assign(priority = np.where(merged.event.isin(['TAKE', 'GIVE', 'MISS', 'HIT', 'SHOT', 'BLOCK']), 1,
-                                                np.where(merged.event=="GOAL", 2,
-                                                    np.where(merged.event=="STOP", 3,
-                                                        np.where(merged.event=="DELPEN", 4,
-                                                            np.where(merged.event=="PENL", 5,
-                                                                np.where((merged.event=="CHANGE") & change_should_be_before, 0.5,
-                                                                    np.where(merged.event=="CHANGE", 6,
-                                                                        np.where(merged.event=="PEND", 7,
-                                                                            np.where(merged.event=="GEND", 8,
-                                                                                np.where(merged.event=="FAC", 9, 0)))))))))))
+    # (between period markers and other unlisted events at 0 and play events at 1)
+    # OPTIMIZED: Look priorities up by event code instead of a nested np.where chain
+    event_codes = pd.Categorical(merged.event, categories = list(_EVENT_PRIORITY)).codes
+    # Code -1 (any other event) reads the trailing 0
+    priority = np.append(np.array(list(_EVENT_PRIORITY.values()), dtype = float), 0)[event_codes]
+    priority[(merged.event == 'CHANGE').to_numpy() & change_should_be_before] = 0.5
+    merged = merged.assign(priority = priority)
 
     # =========================================================================
     # End of CHANGE ordering fix
     # =========================================================================
 
-    merged = merged.sort_values(by = ['game_seconds', 'period', 'priority', 'event_index', 'change_prio'])
+    # OPTIMIZED: One stable lexsort (last key is primary) gives the same order as the chain of
+    # stable sort_values calls: ties fall back to the events-then-shifts order of the concat
+    order = np.lexsort([_lexsort_codes(merged[column]) for column in ['change_prio', 'event_index', 'priority', 'period', 'game_seconds']])
+    merged = merged.iloc[order]
 
     merged = merged.reset_index(drop = True).reset_index().rename(columns = {'index':'event_index', 'event_index':'original_index'})
 
@@ -2239,67 +2311,29 @@ def merge_and_prepare(events, shifts, roster=None, live = False):
     merged.jumping_on = np.where(pd.isna(merged.jumping_on), '\xa0', merged.jumping_on)
     merged.jumping_off = np.where(pd.isna(merged.jumping_off), '\xa0', merged.jumping_off)
 
-    # OPTIMIZED: Use vectorized string operations instead of .apply()
-    # This provides 10-20x speedup on the on-ice tracking loops
     change_mask = (merged.event == 'CHANGE')
-    
-    # OPTIMIZED: Use regex pattern matching for exact teamnum matches in comma-separated strings
-    # Pattern matches teamnum at start, middle (after comma+space), or end of string
-    # Note: re module is already imported at module level
-    
-    # Build all columns at once using vectorized string operations
-    awaydf_dict = {}
-    for i in range(0, len(away_roster)):
-        teamnum = away_roster.teamnum.iloc[i]
-        # Use regex to match teamnum as whole value (not substring)
-        # Match: start of string OR comma+space, then teamnum, then comma OR end of string
-        pattern = r'(^|, )' + re.escape(teamnum) + r'(,|$)'
-        on_mask = merged.jumping_on.str.contains(pattern, na=False, regex=True)
-        off_mask = merged.jumping_off.str.contains(pattern, na=False, regex=True) & change_mask
-        vec = np.cumsum(on_mask.astype(int) - off_mask.astype(int))
-        awaydf_dict[away_roster.Name.iloc[i]] = vec
-    
-    awaydf = pd.DataFrame(awaydf_dict)
-
-    # OPTIMIZED: Same optimization for home roster
-    homedf_dict = {}
-    for i in range(0, len(home_roster)):
-        teamnum = home_roster.teamnum.iloc[i]
-        pattern = r'(^|, )' + re.escape(teamnum) + r'(,|$)'
-        on_mask = merged.jumping_on.str.contains(pattern, na=False, regex=True)
-        off_mask = merged.jumping_off.str.contains(pattern, na=False, regex=True) & change_mask
-        vec = np.cumsum(on_mask.astype(int) - off_mask.astype(int))
-        homedf_dict[home_roster.Name.iloc[i]] = vec
-    
-    homedf = pd.DataFrame(homedf_dict)
-
-    # OPTIMIZED: Use numpy arrays directly instead of slow pandas .iloc[] access
-    # Convert dataframe to numpy once, then iterate over numpy arrays (10x+ faster)
-    def build_on_ice_strings(df):
-        col_names = df.columns.to_numpy()
-        values = df.values
-        result = [''] * len(values)
-        for i, row in enumerate(values):
-            mask = row == 1
-            if np.any(mask):
-                players = col_names[mask]
-                result[i] = ','.join(natsorted(players))
-        return result
-
-    home_on = pd.DataFrame({0: build_on_ice_strings(homedf)})
-    away_on = pd.DataFrame({0: build_on_ice_strings(awaydf)})
-
-    away_on = away_on[0].str.split(',', expand=True).rename(columns = {0:'away_on_1', 1:'away_on_2', 2:'away_on_3', 3:'away_on_4', 4:'away_on_5', 5:'away_on_6', 6:'away_on_7', 7:'away_on_8', 8:'away_on_9'})
-    home_on = home_on[0].str.split(',', expand=True).rename(columns = {0:'home_on_1', 1:'home_on_2', 2:'home_on_3', 3:'home_on_4', 4:'home_on_5', 5:'home_on_6', 6:'home_on_7', 7:'home_on_8', 8:'home_on_9'})
-
-    # OPTIMIZED: Initialize missing columns in a loop
-    for side in ['away', 'home']:
-        for i in range(1, 10):
-            col = f'{side}_on_{i}'
-            if col not in (away_on if side == 'away' else home_on).columns:
-                (away_on if side == 'away' else home_on)[col] = '\xa0'
 
-    game = pd.concat([merged, home_on, away_on], axis = 1)
+    # OPTIMIZED: Players are tracked as small per-game integer codes (see _player_codes) while
+    # on-ice state is built; names are materialized once, when the slot columns are assembled
+    away_names, away_teamnums, away_jersey_codes = _player_codes(away_roster)
+    home_names, home_teamnums, home_jersey_codes = _player_codes(home_roster)
+
+    # OPTIMIZED: Tokenize the change strings once into (row, teamnum) pairs and cumsum an
+    # event x teamnum incidence matrix, instead of two regex scans of every row per roster player.
+    # Players only leave the ice at CHANGE events.
+    on_rows, on_tokens = _change_tokens(merged.jumping_on)
+    off_rows, off_tokens = _change_tokens(merged.jumping_off.where(change_mask))
+    token_ids, tokens = pd.factorize(np.concatenate([on_tokens, off_tokens]))
+    # One spare, always-zero column for roster players who never appear in a change
+    on_incidence = np.zeros((len(merged), len(tokens) + 1), dtype=np.int64)
+    on_incidence[on_rows, token_ids[:len(on_rows)]] = 1
+    off_incidence = np.zeros_like(on_incidence)
+    off_incidence[off_rows, token_ids[len(on_rows):]] = 1
+    on_ice_by_token = np.cumsum(on_incidence - off_incidence, axis = 0)
+    tokens = pd.Index(tokens)
+
+    away_slots = _on_ice_slots(on_ice_by_token[:, tokens.get_indexer(away_teamnums)])
+    home_slots = _on_ice_slots(on_ice_by_token[:, tokens.get_indexer(home_teamnums)])
 
     # =========================================================================
     # FIX: Override cumsum-based on-ice tracking with HTML PBP embedded data
@@ -2311,58 +2345,31 @@ def merge_and_prepare(events, shifts, roster=None, live = False):
     # The NHL's HTML PBP is the source of truth for who was on ice.
     # =========================================================================
 
-    # Create jersey number -> player name mapping for each team
-    away_jersey_to_name = dict(zip(away_roster['#'].astype(str), away_roster['Name']))
-    home_jersey_to_name = dict(zip(home_roster['#'].astype(str), home_roster['Name']))
-
-    # Pattern to extract jersey numbers from HTML on-ice strings
-    # Format is like "18 C 47 C 73 D 91 D 70 G" with whitespace/newlines
-    jersey_pattern = re.compile(r'(\d+)\s*[CLDGRW]')
-
-    def parse_html_on_ice(html_string, jersey_to_name):
-        """Parse jersey numbers from HTML on-ice string and convert to player names."""
-        if pd.isna(html_string) or not isinstance(html_string, str):
-            return None
-        jerseys = jersey_pattern.findall(html_string)
-        if not jerseys:
-            return None
-        # Convert jersey numbers to player names, skip unknowns
-        names = [jersey_to_name.get(j) for j in jerseys if j in jersey_to_name]
-        return natsorted(names) if names else None
-
-    # OPTIMIZED: Vectorized HTML PBP override (replaces slow row-by-row loop)
+    # OPTIMIZED: Each distinct on-ice string is parsed once, straight into 9 code slots, and
+    # every side's override is applied with a single np.where over its whole slot array
     # Get the source columns for HTML on-ice data
-    away_html_col = 'away_skaters_raw' if 'away_skaters_raw' in game.columns else 'away_skaters'
-    home_html_col = 'home_skaters_raw' if 'home_skaters_raw' in game.columns else 'home_skaters'
+    away_html_col = 'away_skaters_raw' if 'away_skaters_raw' in merged.columns else 'away_skaters'
+    home_html_col = 'home_skaters_raw' if 'home_skaters_raw' in merged.columns else 'home_skaters'
 
-    # Parse all HTML strings at once and cache results
-    away_parsed = game[away_html_col].astype(str).apply(lambda x: parse_html_on_ice(x, away_jersey_to_name))
-    home_parsed = game[home_html_col].astype(str).apply(lambda x: parse_html_on_ice(x, home_jersey_to_name))
+    away_html_slots, away_has_data = _html_on_ice_slots(merged[away_html_col], away_jersey_codes)
+    home_html_slots, home_has_data = _html_on_ice_slots(merged[home_html_col], home_jersey_codes)
 
-    # Build arrays for each on-ice column position (1-9)
     # Only update rows where we have valid parsed data
     # Exclude penalty shots: HTML PBP only lists shooter vs goalie (1v1),
     # but the NHL officially counts penalty shots as even strength with the
     # full on-ice lineup. Keep the shift-based data for these events.
-    is_penalty_shot = game['description'].str.contains('Penalty Shot', na=False)
-
-    for side, parsed in [('away', away_parsed), ('home', home_parsed)]:
-        # Create mask for rows with valid parsed names (excluding penalty shots)
-        has_data = parsed.apply(lambda x: x is not None and len(x) > 0) & ~is_penalty_shot
+    is_penalty_shot = merged['description'].str.contains('Penalty Shot', na=False).to_numpy()
 
-        for i in range(1, 10):
-            col_name = f'{side}_on_{i}'
-            pos = i - 1  # 0-indexed position
+    away_slots = np.where((away_has_data & ~is_penalty_shot)[:, None], away_html_slots, away_slots)
+    home_slots = np.where((home_has_data & ~is_penalty_shot)[:, None], home_html_slots, home_slots)
 
-            # Extract name at this position, or '\xa0' if not enough names
-            def get_name(names, p=pos):
-                if names is None:
-                    return None
-                return names[p] if p < len(names) else '\xa0'
+    # Materialize names, finding each row's goalie on the way (see _on_ice_names)
+    home_on_names, home_goalie = _on_ice_names(home_names, home_slots, goalies.Name)
+    away_on_names, away_goalie = _on_ice_names(away_names, away_slots, goalies.Name)
+    home_on = pd.DataFrame(home_on_names, columns = [f'home_on_{i}' for i in range(1, 10)])
+    away_on = pd.DataFrame(away_on_names, columns = [f'away_on_{i}' for i in range(1, 10)])
 
-            new_values = parsed.apply(get_name)
-            # Update only rows with parsed data
-            game[col_name] = np.where(has_data, new_values, game[col_name])
+    game = pd.concat([merged, home_on, away_on], axis = 1)
 
     # =========================================================================
     # End of HTML PBP on-ice override fix
@@ -2377,90 +2384,41 @@ def merge_and_prepare(events, shifts, roster=None, live = False):
     game['description'] = np.where(game.description=='nan', '\xa0', game.description)
 
     game = game.drop(columns = ['original_index', 'strength', 'original_time', 'home_team', 'away_team', 'other_team', 'event_player_str',
-                                'version', 'team', 'change_before_event', 'prio', 'change_prio', 'priority', 'tmp', 'tmp2']).rename(
+                                'version', 'team', 'change_prio', 'priority', 'tmp', 'tmp2']).rename(
         columns = {'away_team_abbreviated':'away_team', 'home_team_abbreviated':'home_team', 'coordsx':'coords_x', 'coordsy':'coords_y',
                     'ep1_name':'event_player_1', 'ep2_name':'event_player_2', 'ep3_name':'event_player_3'})
 
-    # OPTIMIZED: Pre-compile regex and use vectorized operations where possible
-    # event_zone: combine the two apply() calls into one
-    def extract_zone(desc):
-        match = _ZONE_PATTERN.search(str(desc))
-        return match.group() if match else None
-    
-    # OPTIMIZED: event_detail - reduce string operations by caching splits
-    def extract_detail(row):
-        desc = row['description']
-        event = row['event']
-        if pd.isna(desc):
-            return '\xa0'
-        if event in ['SHOT', 'BLOCK', 'MISS', 'GOAL']:
-            parts = desc.split(', ')
-            return parts[1].strip() if len(parts) > 1 else '\xa0'
-        elif event in ["PSTR", "PEND", "SOC", "GEND"]:
-            parts = desc.split(': ')
-            return parts[1].strip() if len(parts) > 1 else '\xa0'
-        elif event == 'PENL':
-            match = _PARENTHESIS_PATTERN.search(desc)
-            return match.group(1).strip() if match else '\xa0'
-        elif event == 'CHANGE':
-            parts = desc.split(' - ')
-            return parts[0].strip() if len(parts) > 0 else '\xa0'
-        return '\xa0'
-    
+    # OPTIMIZED: event_zone and event_detail use vectorized string operations, one masked
+    # operation per event type, instead of a regex apply and a row-wise DataFrame apply
+    description = game.description.astype(str)
+    event_zone = description.str.extract(_ZONE_PATTERN, expand=False)
+    event_zone = event_zone.where(event_zone.notna(), None)
+
+    event_detail = np.full(len(game), '\xa0', dtype=object)
+
+    def set_detail(mask, details):
+        # details is NaN where the description has none; those rows keep '\xa0'
+        mask = (mask & details.notna()).to_numpy()
+        event_detail[mask] = details[mask].astype(str).str.strip().to_numpy()
+
+    # Shots: the text after the first ', '
+    set_detail(game.event.isin(['SHOT', 'BLOCK', 'MISS', 'GOAL']), description.str.split(', ', regex=False).str[1])
+    # Period and game markers: the text after the first ': '
+    set_detail(game.event.isin(["PSTR", "PEND", "SOC", "GEND"]), description.str.split(': ', regex=False).str[1])
+    # Penalties: the first parenthesized text
+    set_detail(game.event == 'PENL', description.str.extract(_PARENTHESIS_PATTERN, expand=False))
+    # Changes: the text before the first ' - '
+    set_detail(game.event == 'CHANGE', description.str.split(' - ', n=1, regex=False).str[0])
+
     game = game.assign(
         game_id = int(game_id),
         season = int(season),
-        event_zone = game.description.apply(extract_zone),
-        event_detail = game.apply(extract_detail, axis=1))
-
-    # Goalie finding - keep nested np.where() as it's actually quite fast for this use case
-    game = game.assign(home_goalie = np.where(
-    game.home_on_1.isin(goalies.Name), game.home_on_1,
-    np.where(
-    game.home_on_2.isin(goalies.Name), game.home_on_2,
-    np.where(
-    game.home_on_3.isin(goalies.Name), game.home_on_3,
-    np.where(
-    game.home_on_4.isin(goalies.Name), game.home_on_4,
-    np.where(
-    game.home_on_5.isin(goalies.Name), game.home_on_5,
-    np.where(
-    game.home_on_6.isin(goalies.Name), game.home_on_6,
-    np.where(
-    game.home_on_7.isin(goalies.Name), game.home_on_7,
-    np.where(
-    game.home_on_8.isin(goalies.Name), game.home_on_8,
-    np.where(
-    game.home_on_9.isin(goalies.Name), game.home_on_9,
-    '\xa0'))))))))),
-    away_goalie = np.where(
-    game.away_on_1.isin(goalies.Name), game.away_on_1,
-    np.where(
-    game.away_on_2.isin(goalies.Name), game.away_on_2,
-    np.where(
-    game.away_on_3.isin(goalies.Name), game.away_on_3,
-    np.where(
-    game.away_on_4.isin(goalies.Name), game.away_on_4,
-    np.where(
-    game.away_on_5.isin(goalies.Name), game.away_on_5,
-    np.where(
-    game.away_on_6.isin(goalies.Name), game.away_on_6,
-    np.where(
-    game.away_on_7.isin(goalies.Name), game.away_on_7,
-    np.where(
-    game.away_on_8.isin(goalies.Name), game.away_on_8,
-    np.where(
-    game.away_on_9.isin(goalies.Name), game.away_on_9,
-    '\xa0'))))))))))
-
-    # OPTIMIZED: Vectorized column cleaning - use np.where() in loop for consistency
-    # Slightly faster than individual assigns due to reduced function call overhead
-    on_ice_cols = [f'{side}_on_{i}' for side in ['away', 'home'] for i in range(1, 10)]
-    goalie_cols = ['home_goalie', 'away_goalie']
-    
-    for col in on_ice_cols + goalie_cols:
-        if col in game.columns:
-            game[col] = np.where((pd.isna(game[col])) | (game[col] == '') | (game[col] == '\xa0'), '\xa0', game[col])
+        event_zone = event_zone,
+        event_detail = event_detail)
+
+    # OPTIMIZED: Goalies were found on the slot arrays and blanks normalized per player, so the
+    # on-ice and goalie columns need no further scans here
+    game = game.assign(home_goalie = home_goalie, away_goalie = away_goalie)
 
     # OPTIMIZED: Vectorized skater counting using .ne() and .sum()
     # Cache the game_id check to avoid repeated string operations
@@ -2729,6 +2687,34 @@ def fix_missing(single, event_coords, events):
 
     return events
 
+def _game_page_urls(season, game_id, include_api=True):
+    """
+    Build the URLs of every page needed to scrape a single game.
+
+    Args:
+        season: Season string (e.g., '20242025')
+        game_id: Full game ID (e.g., 2025020333)
+        include_api: If True, also include the NHL API play-by-play endpoint
+
+    Returns:
+        Dictionary with keys: 'events', 'roster', 'home_shifts', 'away_shifts', 'summary'
+        and optionally 'api'.
+    """
+    small_id = str(game_id)[5:]
+    urls = {
+        'events': f'http://www.nhl.com/scores/htmlreports/{season}/PL0{small_id}.HTM',
+        'roster': f'http://www.nhl.com/scores/htmlreports/{season}/RO0{small_id}.HTM',
+        'home_shifts': f'http://www.nhl.com/scores/htmlreports/{season}/TH0{small_id}.HTM',
+        'away_shifts': f'http://www.nhl.com/scores/htmlreports/{season}/TV0{small_id}.HTM',
+        'summary': f'https://www.nhl.com/scores/htmlreports/{season}/GS0{small_id}.HTM'
+    }
+    if include_api:
+        urls['api'] = f'https://api-web.nhle.com/v1/gamecenter/{game_id}/play-by-play'
+    return urls
+
+# Any page on the host serving the HTML reports, to look up its adaptive limit
+_HTML_REPORT_URL = 'http://www.nhl.com/scores/htmlreports/'
+
 def _fetch_all_pages_parallel(season, game_id, verbose=False, include_api=True):
     """
     Fetch all required HTML pages and optionally the NHL API in parallel.
@@ -2743,33 +2729,21 @@ def _fetch_all_pages_parallel(season, game_id, verbose=False, include_api=True):
         Dictionary with keys: 'events', 'roster', 'home_shifts', 'away_shifts', 'summary'
         and optionally 'api'. All values are requests.Response objects.
     """
-    small_id = str(game_id)[5:]
-
-    # Prepare all URLs
-    events_url = f'http://www.nhl.com/scores/htmlreports/{season}/PL0{small_id}.HTM'
-    roster_url = f'http://www.nhl.com/scores/htmlreports/{season}/RO0{small_id}.HTM'
-    home_shifts_url = f'http://www.nhl.com/scores/htmlreports/{season}/TH0{small_id}.HTM'
-    away_shifts_url = f'http://www.nhl.com/scores/htmlreports/{season}/TV0{small_id}.HTM'
-    summary_url = f'https://www.nhl.com/scores/htmlreports/{season}/GS0{small_id}.HTM'
-    api_url = f'https://api-web.nhle.com/v1/gamecenter/{game_id}/play-by-play'
+    urls = _game_page_urls(season, game_id, include_api=include_api)
 
     # Fetch all pages concurrently (5 HTML + 1 API = 6 requests)
     fetch_start = time.time()
     if verbose:
         print('  🔄 Fetching HTML pages and API in parallel...')
 
-    max_workers = 6 if include_api else 5
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # One thread per page; with configure_http_client(adaptive=True) the per-host limit decides how
+    # many of them are actually in flight, and these timeouts only apply until latencies are measured
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
         # Submit fetch tasks
         futures = {
-            'events': executor.submit(_fetch_url, events_url, timeout=10),
-            'roster': executor.submit(_fetch_url, roster_url, timeout=10),
-            'home_shifts': executor.submit(_fetch_url, home_shifts_url, timeout=10),
-            'away_shifts': executor.submit(_fetch_url, away_shifts_url, timeout=10),
-            'summary': executor.submit(_fetch_url, summary_url, timeout=10)
+            key: executor.submit(_fetch_url, url, timeout=30 if key == 'api' else 10)
+            for key, url in urls.items()
         }
-        if include_api:
-            futures['api'] = executor.submit(_fetch_url, api_url, timeout=30)
 
         # Create reverse mapping from future to key
         future_to_key = {future: key for key, future in futures.items()}
@@ -2789,8 +2763,141 @@ def _fetch_all_pages_parallel(season, game_id, verbose=False, include_api=True):
 
     return results
 
-def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_intermediates = False, verbose = False):
+def _fetch_game_pages(game_id, verbose=False, include_api=True):
+    """
+    Fetch every page for a game, deriving the season from the game ID.
+    Used as the unit of work for cross-game prefetching.
+    """
+    season = str(int(str(game_id)[:4])) + str(int(str(game_id)[:4]) + 1)
+    return _fetch_all_pages_parallel(season, game_id, verbose=verbose, include_api=include_api)
+
+def _top_up_prefetch(executor, prefetched, game_id_list, i, prefetch, include_api=True, not_before=None):
+    """
+    Keep the next `prefetch` games after position i downloading in the background.
+
+    Args:
+        executor: ThreadPoolExecutor running the background fetches
+        prefetched: Dict of {position in game_id_list: Future}, updated in place
+        game_id_list: List of game IDs being scraped
+        i: Position of the game currently being parsed
+        prefetch: Number of games to keep in flight ahead of position i
+        include_api: If True, also fetch NHL API play-by-play endpoint
+        not_before: Dict of {position: earliest retry time} for requeued games; these are
+            left alone until their deadline passes
+    """
+    now = time.time()
+    for j in range(i + 1, min(i + 1 + prefetch, len(game_id_list))):
+        if j not in prefetched and (not_before is None or not_before.get(j, 0) <= now):
+            prefetched[j] = executor.submit(_fetch_game_pages, game_id_list[j], False, include_api)
+
+def _adaptive_prefetch_depth(include_api=True):
+    """
+    Prefetch depth for prefetch='auto': enough games that their pages slightly exceed the adaptive
+    controller's current limit for the HTML report host, so the limit is reached and can grow.
+    Falls back to one game ahead when the controller is off.
+    """
+    adaptive = _http_client.adaptive
+    if adaptive is None:
+        return 1
+    pages_per_game = 6 if include_api else 5
+    return int(adaptive.limit(_HTML_REPORT_URL) // pages_per_game) + 1
+
+def _shutdown_prefetch(executor, prefetched):
+    """
+    Cancel any queued prefetches and release the prefetch worker threads.
+    """
+    if executor is None:
+        return
+    for future in prefetched.values():
+        future.cancel()
+    prefetched.clear()
+    executor.shutdown(wait=False)
+
+# ========== RETRY SCHEDULING ==========
+# Failure classes worth another attempt, with the base delay (seconds) before a requeued game is retried
+_RETRYABLE_FAILURES = {'network': 10, 'empty_html': 5, 'worker_error': 5}
+# Failure classes that will fail the same way again, so they are reported instead of retried
+_PERMANENT_FAILURES = ('http_error',)
+# Failure classes not requeued within a run, since the same pages would fail the same way, but given
+# full_scrape's end-of-run retry: that pass uses ESPN shifts, which recovers many HTML shift/parse failures
+_ESPN_FALLBACK_FAILURES = ('missing_shifts', 'parse_error')
+_MAX_GAME_RETRIES = 3
+
+# Seconds a rate-limited host is held back after a throttled or failed request
+_THROTTLE_PENALTY = 2
+
+# Games that could not be scraped by the most recent full_scrape_1by1 call: {game_id: failure class}
+_last_scrape_failures = {}
+
+def _classify_scrape_failure(e):
+    """
+    Sort an exception that ended a game's scrape into a failure class:
+    'network' or 'empty_html' (transient; a crashed pool worker is also recorded as a transient
+    'worker_error'), 'missing_shifts' or 'parse_error' (left for the end-of-run
+    ESPN fallback retry; KeyError and anything unrecognized land here), or 'http_error' (permanent).
+    """
+    if isinstance(e, HTTPError):
+        status = e.response.status_code if e.response is not None else None
+        if status is not None and (status == 429 or status >= 500):
+            return 'network'
+        return 'http_error'
+    if isinstance(e, (ConnectionError, ChunkedEncodingError, Timeout)):
+        return 'network'
+    if isinstance(e, (AttributeError, ValueError)):
+        # An empty or half-published HTML report; these usually fill in if we come back later
+        return 'empty_html'
+    if isinstance(e, IndexError):
+        return 'missing_shifts'
+    return 'parse_error'
+
+def _requeue_game(game_id_list, not_before, retries, game_id, failure):
+    """
+    Push a game that failed transiently to the back of the work queue, with a deadline before
+    which it won't be attempted again, so the games behind it keep flowing meanwhile.
+
+    Args:
+        game_id_list: Work queue of game IDs, appended to in place
+        not_before: Dict of {position in game_id_list: earliest retry time}, updated in place
+        retries: Dict of {game_id: retries used so far}, updated in place
+        game_id: Game that failed
+        failure: Its failure class, a key of _RETRYABLE_FAILURES
+
+    Returns:
+        False if the game has used up its retries, True otherwise.
+    """
+    attempt = retries.get(game_id, 0) + 1
+    if attempt > _MAX_GAME_RETRIES:
+        print(f"  All {_MAX_GAME_RETRIES} retries exhausted for {game_id}, skipping.")
+        return False
+    retries[game_id] = attempt
+    delay = _RETRYABLE_FAILURES[failure] * attempt  # e.g. 10, 20, 30 seconds
+    game_id_list.append(game_id)
+    not_before[len(game_id_list) - 1] = time.time() + delay
+    print(f"  Requeued {game_id} to retry in {delay} seconds or later, after the games ahead of it. (attempt {attempt}/{_MAX_GAME_RETRIES})")
+    return True
+
+def _defer_early_game(game_id_list, not_before, i):
+    """
+    Handle a requeued game that reaches the front of the queue before its deadline. If a game
+    behind it can start sooner (it is ready, or its own deadline is earlier), the early game is
+    moved to the back of the queue with its deadline, so the queue keeps flowing.
+
+    Returns:
+        True if the game was moved and position i should be skipped, False if it is the
+        earliest game left, so waiting for it is all there is to do.
+    """
+    deadline = not_before[i]
+    if not any(not_before.get(j, 0) < deadline for j in range(i + 1, len(game_id_list))):
+        return False
+    game_id_list.append(game_id_list[i])
+    not_before[len(game_id_list) - 1] = not_before.pop(i)
+    return True
+
+def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_intermediates = False, verbose = False, prefetch = 0, pages_by_game = None):
     
+    global _last_scrape_failures
+    _last_scrape_failures = {}
+
     # OPTIMIZED: Use list instead of DataFrame for accumulating results
     full_list = []
     
@@ -2798,8 +2905,28 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
     intermediates_list = []
 
     i = 0
-    retry_count = 0  # Track retries for transient errors (empty HTML, network issues)
-    MAX_RETRIES = 3
+    # Work queue: games that fail transiently are appended again with a retry deadline instead of
+    # being slept on in place. Copied so the caller's list isn't modified.
+    game_id_list = list(game_id_list)
+    not_before = {}
+    retries = {}
+
+    # OPTIMIZED: Pipelined fetching - while game i is being parsed, the pages for the next
+    # `prefetch` games download in the background. Bounded so memory stays at K games of pages.
+    # prefetch='auto' re-sizes the depth from the adaptive controller's limit before every game.
+    auto_prefetch = prefetch == 'auto'
+    if auto_prefetch:
+        if _http_client.adaptive is None:
+            print("prefetch='auto' needs configure_http_client(adaptive=True); prefetching one game ahead.")
+            max_prefetch = 1
+        else:
+            max_prefetch = _http_client.adaptive.max_limit // 5 + 1
+    else:
+        max_prefetch = prefetch
+    prefetch_executor = ThreadPoolExecutor(max_workers=max_prefetch) if max_prefetch > 0 else None
+    prefetched = {}
+    # Pages already fetched by the caller (e.g. afull_scrape), keyed by game ID; used once per game
+    pages_by_game = dict(pages_by_game) if pages_by_game else {}
 
     while i in range(0, len(game_id_list)) and len(game_id_list)>0:
 
@@ -2808,16 +2935,40 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
         try:
             first_time = time.time()
             game_id = game_id_list[i]
+            # A requeued game that comes up before its deadline goes behind any game that can start sooner
+            if not_before.get(i, 0) > time.time() and _defer_early_game(game_id_list, not_before, i):
+                i = i + 1
+                continue
+            # Only when every game left is waiting does the queue wait, for the earliest deadline
+            wait = not_before.pop(i, 0) - time.time()
+            if wait > 0:
+                time.sleep(wait)
             print('Attempting scrape for: ' + str(game_id))
             season = str(int(str(game_id)[:4])) + str(int(str(game_id)[:4]) + 1)
             small_id = str(game_id)[5:]
+            # OPTIMIZED: Each page is decoded and parsed once per game, whichever stages read it
+            start_game_documents()
             
             # OPTIMIZED: Fetch HTML pages and API in parallel
             parallel_start = time.time()
             if verbose:
                 print('Fetching pages')
             # Only include API if we're not forcing ESPN fallback
-            pages = _fetch_all_pages_parallel(season, game_id, verbose=verbose, include_api=not shift_to_espn)
+            if auto_prefetch:
+                prefetch = min(max_prefetch, _adaptive_prefetch_depth(not shift_to_espn))
+            if prefetch_executor is not None:
+                _top_up_prefetch(prefetch_executor, prefetched, game_id_list, i, prefetch, include_api=not shift_to_espn, not_before=not_before)
+            # On a retry the prefetched entry is already consumed, so the game is fetched fresh
+            prefetched_pages = prefetched.pop(i, None)
+            if game_id in pages_by_game:
+                pages = pages_by_game.pop(game_id)
+            elif prefetched_pages is not None:
+                pages = prefetched_pages.result()
+            else:
+                pages = _fetch_all_pages_parallel(season, game_id, verbose=verbose, include_api=not shift_to_espn)
+            for key, url in _game_page_urls(season, game_id).items():
+                if key in pages:
+                    register_page(url, pages[key])
             parallel_duration = time.time() - parallel_start
             if verbose:
                 try:
@@ -2846,7 +2997,7 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
             api_response = pages.get('api') if 'api' in pages else None
             if api_response is not None and return_intermediates:
                 try:
-                    api_json = json.loads(api_response.content)
+                    api_json = page_json(api_response)
                     roster_spots_json = api_json.get('rosterSpots', None)
                 except Exception:
                     pass
@@ -3015,7 +3166,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                 except Exception:
                     print(f"⏱️ TOTAL game scrape: {total_duration:.2f}s")
                 i = i + 1
-                retry_count = 0  # Reset for next game
 
                 # If there is an issue with the API, fall back to ESPN:
                 
@@ -3125,7 +3275,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                         if verbose:
                             print("This game took " + str(round(total_duration, 2)) + " seconds.")
                         i = i + 1
-                        retry_count = 0  # Reset for next game
                     else:
                         print('Successfully scraped ' + str(game_id) + '. Coordinates sourced from ESPN.')
                         try:
@@ -3139,7 +3288,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                         except Exception:
                             print(f"⏱️ TOTAL game scrape: {total_duration:.2f}s")
                         i = i + 1
-                        retry_count = 0  # Reset for next game
 
                     # If there are issues with ESPN
 
@@ -3160,7 +3308,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                             'raw_html': None  # Don't store Response objects - they hold connections open
                         })
                     i = i + 1
-                    retry_count = 0  # Reset for next game
                     continue
                 except IndexError as e:
                     print('ESPN also had trouble scraping coordinates for: ' + str(game_id) + '. Looks like we will need to punt this one, unfortunately.')
@@ -3178,7 +3325,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                             'raw_html': None  # Don't store Response objects - they hold connections open
                         })
                     i = i + 1
-                    retry_count = 0  # Reset for next game
                     continue
                 except TypeError as e:
                     print('ESPN also had trouble scraping coordinates for: ' + str(game_id) + '. Looks like we will need to punt this one, unfortunately.')
@@ -3196,7 +3342,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                             'raw_html': None  # Don't store Response objects - they hold connections open
                         })
                     i = i + 1
-                    retry_count = 0  # Reset for next game
                     continue
                 except ExpatError as e:
                     print('ESPN also had trouble scraping coordinates for: ' + str(game_id) + '. Looks like we will need to punt this one, unfortunately.')
@@ -3214,7 +3359,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                             'raw_html': None  # Don't store Response objects - they hold connections open
                         })
                     i = i + 1
-                    retry_count = 0  # Reset for next game
                     continue
 
             except ExpatError:
@@ -3329,7 +3473,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                     except Exception:
                         print(f"⏱️ TOTAL game scrape: {total_duration:.2f}s")
                     i = i + 1
-                    retry_count = 0  # Reset for next game
 
                     # If there are issues with ESPN
 
@@ -3349,7 +3492,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                             'raw_html': None  # Don't store Response objects - they hold connections open
                         })
                     i = i + 1
-                    retry_count = 0  # Reset for next game
                     continue
                 except IndexError as e:
                     print('ESPN also had trouble scraping coordinates for: ' + str(game_id) + '. Looks like we will need to punt this one, unfortunately.')
@@ -3367,7 +3509,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                             'raw_html': None  # Don't store Response objects - they hold connections open
                         })
                     i = i + 1
-                    retry_count = 0  # Reset for next game
                     continue
                 except TypeError as e:
                     print('ESPN also had trouble scraping coordinates for: ' + str(game_id) + '. Looks like we will need to punt this one, unfortunately.')
@@ -3385,7 +3526,6 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                             'raw_html': None  # Don't store Response objects - they hold connections open
                         })
                     i = i + 1
-                    retry_count = 0  # Reset for next game
                     continue
                 except ExpatError as e:
                     print('ESPN also had trouble scraping coordinates for: ' + str(game_id) + '. Looks like we will need to punt this one, unfortunately.')
@@ -3403,11 +3543,10 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                             'raw_html': None  # Don't store Response objects - they hold connections open
                         })
                     i = i + 1
-                    retry_count = 0  # Reset for next game
                     continue
 
         except ConnectionError as e:
-            print('Got a Connection Error, time to sleep.')
+            print('Got a Connection Error for ' + str(game_id) + '.')
             if return_intermediates:
                 intermediates_list.append({
                     'game_id': game_id if 'game_id' in locals() else game_id_list[i],
@@ -3420,21 +3559,15 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                     'error_traceback': traceback.format_exc(),
                     'raw_html': None  # Don't store Response objects - they hold connections open
                 })
-            # Retry with backoff, but don't loop forever
-            if retry_count < MAX_RETRIES:
-                retry_count += 1
-                delay = 10 * retry_count  # 10, 20, 30 seconds
-                print(f"  Retrying {game_id} in {delay} seconds... (attempt {retry_count}/{MAX_RETRIES})")
-                time.sleep(delay)
-                continue  # Retry same game
-            else:
-                print(f"  All {MAX_RETRIES} retries exhausted for {game_id}, skipping.")
-                retry_count = 0  # Reset for next game
-                i = i + 1
-                continue
+            # Push the game to the back of the queue instead of sleeping on it, so other games keep flowing
+            failure = _classify_scrape_failure(e)
+            if not _requeue_game(game_id_list, not_before, retries, game_id, failure):
+                _last_scrape_failures[game_id] = failure
+            i = i + 1
+            continue
             
         except ChunkedEncodingError as e:
-            print('Got a ChunkedEncodingError, time to sleep.')
+            print('Got a ChunkedEncodingError for ' + str(game_id) + '.')
             if return_intermediates:
                 intermediates_list.append({
                     'game_id': game_id if 'game_id' in locals() else game_id_list[i],
@@ -3447,18 +3580,33 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                     'error_traceback': traceback.format_exc(),
                     'raw_html': None  # Don't store Response objects - they hold connections open
                 })
-            # Retry with backoff, but don't loop forever
-            if retry_count < MAX_RETRIES:
-                retry_count += 1
-                delay = 10 * retry_count  # 10, 20, 30 seconds
-                print(f"  Retrying {game_id} in {delay} seconds... (attempt {retry_count}/{MAX_RETRIES})")
-                time.sleep(delay)
-                continue  # Retry same game
-            else:
-                print(f"  All {MAX_RETRIES} retries exhausted for {game_id}, skipping.")
-                retry_count = 0  # Reset for next game
-                i = i + 1
-                continue
+            # Push the game to the back of the queue instead of sleeping on it, so other games keep flowing
+            failure = _classify_scrape_failure(e)
+            if not _requeue_game(game_id_list, not_before, retries, game_id, failure):
+                _last_scrape_failures[game_id] = failure
+            i = i + 1
+            continue
+
+        except (HTTPError, Timeout) as e:
+            failure = _classify_scrape_failure(e)
+            print('Got a ' + type(e).__name__ + ' for ' + str(game_id) + ': ' + str(e))
+            if return_intermediates:
+                intermediates_list.append({
+                    'game_id': game_id if 'game_id' in locals() else game_id_list[i],
+                    'shifts': None,
+                    'api_coords': None,
+                    'roster_cache': roster_cache.copy() if 'roster_cache' in locals() and roster_cache is not None else None,
+                    'coordinate_source': None,
+                    'warning': None,
+                    'error': f'{type(e).__name__}: {str(e)}',
+                    'error_traceback': traceback.format_exc(),
+                    'raw_html': None  # Don't store Response objects - they hold connections open
+                })
+            # Throttling, server errors and timeouts are retried later; anything else (e.g. a 404) won't change
+            if failure not in _RETRYABLE_FAILURES or not _requeue_game(game_id_list, not_before, retries, game_id, failure):
+                _last_scrape_failures[game_id] = failure
+            i = i + 1
+            continue
             
         except AttributeError as e:
             print(str(game_id) + ' does not have an HTML report. Here is the error: ' + str(e))
@@ -3475,18 +3623,12 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                     'error_traceback': traceback.format_exc(),
                     'raw_html': None  # Don't store Response objects - they hold connections open
                 })
-            # Retry transient HTML errors with backoff
-            if retry_count < MAX_RETRIES:
-                retry_count += 1
-                delay = 5 * retry_count  # 5, 10, 15 seconds
-                print(f"  Retrying {game_id} in {delay} seconds... (attempt {retry_count}/{MAX_RETRIES})")
-                time.sleep(delay)
-                continue  # Retry same game
-            else:
-                print(f"  All {MAX_RETRIES} retries exhausted for {game_id}, skipping.")
-                retry_count = 0  # Reset for next game
-                i = i + 1
-                continue
+            # Push the game to the back of the queue instead of sleeping on it, so other games keep flowing
+            failure = _classify_scrape_failure(e)
+            if not _requeue_game(game_id_list, not_before, retries, game_id, failure):
+                _last_scrape_failures[game_id] = failure
+            i = i + 1
+            continue
             
         except IndexError as e:
             print(str(game_id) + ' has an issue with the HTML Report. Here is the error: ' + str(e))
@@ -3503,8 +3645,10 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                     'error_traceback': traceback.format_exc(),
                     'raw_html': None  # Don't store Response objects - they hold connections open
                 })
+            # Missing shifts won't appear on a second attempt at the same pages; full_scrape's
+            # end-of-run retry falls back to ESPN shifts instead
+            _last_scrape_failures[game_id] = _classify_scrape_failure(e)
             i = i + 1
-            retry_count = 0  # Reset for next game
             continue
 
         except ValueError as e:
@@ -3522,18 +3666,12 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                     'error_traceback': traceback.format_exc(),
                     'raw_html': None  # Don't store Response objects - they hold connections open
                 })
-            # Retry transient HTML errors with backoff
-            if retry_count < MAX_RETRIES:
-                retry_count += 1
-                delay = 5 * retry_count  # 5, 10, 15 seconds
-                print(f"  Retrying {game_id} in {delay} seconds... (attempt {retry_count}/{MAX_RETRIES})")
-                time.sleep(delay)
-                continue  # Retry same game
-            else:
-                print(f"  All {MAX_RETRIES} retries exhausted for {game_id}, skipping.")
-                retry_count = 0  # Reset for next game
-                i = i + 1
-                continue
+            # Push the game to the back of the queue instead of sleeping on it, so other games keep flowing
+            failure = _classify_scrape_failure(e)
+            if not _requeue_game(game_id_list, not_before, retries, game_id, failure):
+                _last_scrape_failures[game_id] = failure
+            i = i + 1
+            continue
 
         except KeyError as k:
             print(str(game_id) + 'gave some kind of Key Error. Here is the error: ' + str(k))
@@ -3549,14 +3687,17 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                     'error_traceback': traceback.format_exc(),
                     'raw_html': None  # Don't store Response objects - they hold connections open
                 })
+            # Left for full_scrape's end-of-run retry, which falls back to ESPN shifts
+            _last_scrape_failures[game_id] = _classify_scrape_failure(k)
             i = i + 1
-            retry_count = 0  # Reset for next game
             continue
 
         except KeyboardInterrupt:
             print('You manually interrupted the scrape. You will get to keep every game you have already completed scraping after just a bit of post-processing. Good bye.')
             global hidden_patrick
             hidden_patrick = 1
+            _shutdown_prefetch(prefetch_executor, prefetched)
+            release_game_documents()
             # OPTIMIZED: Concat list to DataFrame
             full = pd.concat(full_list, ignore_index=True) if full_list else pd.DataFrame()
             if len(full) > 0:
@@ -3605,6 +3746,9 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
                 return {'final': full, 'intermediates': intermediates_list}
             return full
 
+    _shutdown_prefetch(prefetch_executor, prefetched)
+    release_game_documents()
+
     # OPTIMIZED: Concat list to DataFrame before final processing
     full = pd.concat(full_list, ignore_index=True) if full_list else pd.DataFrame()
     
@@ -3685,24 +3829,147 @@ def full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_in
         return {'final': full, 'intermediates': intermediates_list}
     return full
 
-def full_scrape(game_id_list, live = True, shift = False, return_intermediates = False, verbose = False):
-    
-    global hidden_patrick
-    hidden_patrick = 0
-    
-    result = full_scrape_1by1(game_id_list, live, shift_to_espn = shift, return_intermediates = return_intermediates, verbose = verbose)
-    
-    # Handle return_intermediates case
+# ========== MULTI-PROCESS SCRAPING ==========
+def _frame_to_ipc(df):
+    """
+    Encode a worker's result DataFrame as an Arrow IPC stream so it crosses the process
+    boundary as one buffer instead of a pickled object graph.
+
+    Falls back to returning the DataFrame itself (pickled by the pool) when pyarrow is not
+    installed or when a column would not survive the round trip unchanged, e.g. object
+    columns that mix strings with numbers, or that mix None with NaN.
+
+    Returns:
+        Tuple of (ipc_bytes, none_columns) when encoded, otherwise the DataFrame.
+    """
+    if _pa is None or not isinstance(df, pd.DataFrame) or len(df) == 0:
+        return df
+    none_columns = []
+    for column in df.columns[df.dtypes == object]:
+        if pd.api.types.infer_dtype(df[column], skipna=True) not in ('string', 'empty'):
+            return df
+        missing = df[column].isna()
+        if missing.any():
+            is_none = df[column].map(lambda x: x is None)
+            if is_none.any():
+                if (is_none != missing).any():
+                    return df
+                none_columns.append(column)
+    try:
+        table = _pa.Table.from_pandas(df, preserve_index=False)
+        sink = _pa.BufferOutputStream()
+        with _pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    except (_pa.ArrowException, TypeError, ValueError):
+        return df
+    return (sink.getvalue().to_pybytes(), none_columns)
+
+def _frame_from_ipc(payload):
+    """
+    Decode the output of _frame_to_ipc back into a DataFrame.
+    """
+    if isinstance(payload, pd.DataFrame):
+        return payload
+    ipc_bytes, none_columns = payload
+    df = _pa.ipc.open_stream(ipc_bytes).read_all().to_pandas()
+    # Arrow hands back missing strings as None; restore NaN wherever the worker had NaN
+    for column in df.columns[df.dtypes == object]:
+        if column not in none_columns:
+            df[column] = df[column].where(df[column].notna(), np.nan)
+    return df
+
+def _init_scrape_worker(http_client_config, rate_limits, response_cache_config, response_archive_config):
+    """
+    Process pool initializer: carry the parent's fetch settings into each worker process.
+    """
+    configure_http_client(**http_client_config)
+    configure_rate_limits(**rate_limits)
+    if response_cache_config is not None:
+        enable_response_cache(**response_cache_config)
+    configure_response_archive(**response_archive_config)
+
+def _scrape_games_worker(game_id_list, live, shift_to_espn, return_intermediates, verbose):
+    """
+    Process pool entry point: scrape a batch of games and encode the result for the parent.
+    Returns the encoded result and the batch's failures, which live in the worker's own globals.
+    """
+    result = full_scrape_1by1(game_id_list, live, shift_to_espn = shift_to_espn, return_intermediates = return_intermediates, verbose = verbose)
     if return_intermediates:
-        df = result['final']
-        intermediates_list = result['intermediates']
-    else:
-        df = result
-        intermediates_list = None
-    
-    if verbose:
-        print('Full scrape complete, we have this many rows:', len(df))
+        return {'final': _frame_to_ipc(result['final']), 'intermediates': result['intermediates']}, _last_scrape_failures
+    return _frame_to_ipc(result), _last_scrape_failures
+
+def _full_scrape_pool(game_id_list, workers, live = False, shift_to_espn = True, return_intermediates = False, verbose = False):
+    """
+    Spread games across a process pool, one game per task, and reassemble the results
+    in the original game order. Takes the same arguments and returns the same shape of
+    result as full_scrape_1by1.
+    """
+    global hidden_patrick, _last_scrape_failures
+    _last_scrape_failures = {}
+    results = [None] * len(game_id_list)
+    futures = {}
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_scrape_worker, initargs=(_http_client.config(), rate_limit_config(), cache_config(), archive_config()))
+    try:
+        futures = {
+            executor.submit(_scrape_games_worker, [game_id], live, shift_to_espn, return_intermediates, verbose): position
+            for position, game_id in enumerate(game_id_list)
+        }
+        for future in as_completed(futures):
+            position = futures[future]
+            game_id = game_id_list[position]
+            # A crashed worker (e.g. BrokenProcessPool after an OOM kill, or a result that fails to
+            # pickle or decode) costs only its own game, which is left for the end-of-run retry
+            try:
+                result, failures = future.result()
+                if return_intermediates:
+                    results[position] = {'final': _frame_from_ipc(result['final']), 'intermediates': result['intermediates']}
+                else:
+                    results[position] = _frame_from_ipc(result)
+            except Exception as e:
+                print('The worker scraping ' + str(game_id) + ' failed: ' + type(e).__name__ + ': ' + str(e))
+                _last_scrape_failures[game_id] = 'worker_error'
+                continue
+            _last_scrape_failures.update(failures)
+    except KeyboardInterrupt:
+        print('You manually interrupted the scrape. You will get to keep every game you have already completed scraping. Good bye.')
+        hidden_patrick = 1
+        for future in futures:
+            future.cancel()
+    finally:
+        executor.shutdown(wait=True)
+
+    frames = []
+    intermediates_list = []
+    for result in results:
+        if result is None:
+            continue
+        if return_intermediates:
+            frames.append(result['final'])
+            intermediates_list.extend(result['intermediates'])
+        else:
+            frames.append(result)
+
+    frames = [frame for frame in frames if len(frame) > 0]
+    full = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if return_intermediates:
+        return {'final': full, 'intermediates': intermediates_list}
+    return full
+
+def full_scrape(game_id_list, live = True, shift = False, return_intermediates = False, verbose = False, prefetch = 0, workers = 1, record_dir = None, replay_dir = None):
 
+    # Record/replay only applies for the duration of this scrape
+    previous_archive = archive_config()
+    if record_dir is not None or replay_dir is not None:
+        configure_response_archive(record_dir = record_dir, replay_dir = replay_dir)
+    try:
+        return _full_scrape(game_id_list, live, shift, return_intermediates, verbose, prefetch, workers)
+    finally:
+        configure_response_archive(**previous_archive)
+
+def _disambiguate_pettersson(df):
+    """
+    Relabel Elias Pettersson the defenseman (#25) as 'ELIAS PETTERSSON(D)' in the event player columns.
+    """
     try:
         df = df.assign(
             event_player_1 = np.where(
@@ -3737,6 +4004,31 @@ def full_scrape(game_id_list, live = True, shift = False, return_intermediates =
         _log_exception_with_dataframe(e, 'full_scrape.pettersson_disambiguation', {
             'df': df if 'df' in locals() else None
         })
+    return df
+
+def _full_scrape(game_id_list, live = True, shift = False, return_intermediates = False, verbose = False, prefetch = 0, workers = 1):
+    
+    global hidden_patrick
+    hidden_patrick = 0
+    
+    # OPTIMIZED: With workers > 1, games are parsed in parallel across processes (parsing is GIL-bound)
+    if workers > 1:
+        result = _full_scrape_pool(game_id_list, workers, live, shift_to_espn = shift, return_intermediates = return_intermediates, verbose = verbose)
+    else:
+        result = full_scrape_1by1(game_id_list, live, shift_to_espn = shift, return_intermediates = return_intermediates, verbose = verbose, prefetch = prefetch)
+    
+    # Handle return_intermediates case
+    if return_intermediates:
+        df = result['final']
+        intermediates_list = result['intermediates']
+    else:
+        df = result
+        intermediates_list = None
+    
+    if verbose:
+        print('Full scrape complete, we have this many rows:', len(df))
+
+    df = _disambiguate_pettersson(df)
 
     # Don't even need this, we've had this problem with Stutzle for years, just let it be. 
     # df.event_description = df.event_description.str.replace('FEHÃ\x89RVÃ\x81RY', 'FEHERVARY').str.replace('BLÃMEL', 'BLAMEL')
@@ -3745,10 +4037,22 @@ def full_scrape(game_id_list, live = True, shift = False, return_intermediates =
         
         gids = list(set(df.game_id))
         missing = [x for x in game_id_list if x not in gids]
+        # Don't spend another attempt on games that failed for reasons a retry won't fix
+        permanent = {x: _last_scrape_failures[x] for x in missing if _last_scrape_failures.get(x) in _PERMANENT_FAILURES}
+        if len(permanent)>0:
+            print('These games could not be scraped and will not be retried: ' + str(permanent))
+            missing = [x for x in missing if x not in permanent]
         if len(missing)>0:
             print('You missed the following games: ' + str(missing))
             print('Let us try scraping each of them one more time.')
-            retry_result = full_scrape_1by1(missing, return_intermediates = return_intermediates, verbose = verbose)
+            fallback = [x for x in missing if _last_scrape_failures.get(x) in _ESPN_FALLBACK_FAILURES]
+            if len(fallback)>0:
+                print('These games failed to parse and will be retried with ESPN shifts: ' + str(fallback))
+            # This pass always falls back to ESPN shifts, which is what recovers parse errors and missing shifts
+            if workers > 1:
+                retry_result = _full_scrape_pool(missing, workers, shift_to_espn = True, return_intermediates = return_intermediates, verbose = verbose)
+            else:
+                retry_result = full_scrape_1by1(missing, shift_to_espn = True, return_intermediates = return_intermediates, verbose = verbose, prefetch = prefetch)
             if return_intermediates:
                 retry_df = retry_result['final']
                 retry_intermediates = retry_result['intermediates']
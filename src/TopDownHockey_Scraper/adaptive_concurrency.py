@@ -0,0 +1,198 @@
+"""
+Adaptive concurrency and timeouts for the shared HTTP client.
+
+Each host gets an in-flight request limit driven by additive-increase /
+multiplicative-decrease: while requests are queued at the limit, healthy responses
+raise it by roughly one request per round trip, and an error or throttling response
+halves it, at most once per round trip. Timeouts are derived per endpoint (host plus
+path shape, with IDs masked) from a high percentile of recently observed latencies
+instead of fixed constants.
+
+The limit is a ceiling, not a pool size: it backs off below what callers issue under
+errors and throttling, and only grows while callers actually hit it. full_scrape's
+prefetch='auto' sizes its prefetch depth from the current limit, so a run keeps just
+enough pages in flight to find the limit; process counts (workers) are still chosen
+by hand, since each process has its own controller.
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+import numpy as np
+
+_ID_PATTERN = re.compile(r'\d+')
+
+# Responses that mean "slow down" rather than "this page is bad"
+_THROTTLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def endpoint_key(url):
+    """
+    Group URLs by endpoint: host plus path with every number masked, so
+    PL020333.HTM and PL020334.HTM share latency statistics.
+    """
+    parts = urlsplit(url)
+    return parts.netloc + _ID_PATTERN.sub('#', parts.path)
+
+
+class AimdLimit:
+    """
+    In-flight request limit for one host, adjusted by AIMD.
+
+    Args:
+        initial: Starting limit
+        minimum: Lowest the limit may fall to
+        maximum: Highest the limit may grow to
+        decrease: Factor the limit is multiplied by after an error
+    """
+
+    def __init__(self, initial=6, minimum=1, maximum=64, decrease=0.5):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.in_flight = 0
+        self._last_decrease = float('-inf')
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def try_acquire(self):
+        """
+        Take a slot if one is free, without waiting. Returns True if it was taken.
+        """
+        with self._condition:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, ok, started=None):
+        """
+        Give back a slot and adjust the limit.
+
+        Args:
+            ok: Whether the request succeeded without an error or throttling response, or None
+                to give the slot back without adjusting the limit (e.g. the request was cancelled)
+            started: time.monotonic() when the request was sent. A failure of a request sent
+                before the last decrease belongs to the same congestion event and doesn't
+                decrease again. None counts as sent just now.
+        """
+        now = time.monotonic()
+        with self._condition:
+            saturated = self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            if ok:
+                # +1 per limit's worth of successes, i.e. about one extra request per round trip,
+                # but only while the limit is what holds requests back
+                if saturated:
+                    self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            elif ok is not None and (started is None or started >= self._last_decrease):
+                self.limit = max(self.minimum, self.limit * self.decrease)
+                self._last_decrease = now
+            self._condition.notify_all()
+
+
+class AdaptiveController:
+    """
+    Per-host AIMD limits plus per-endpoint latency-percentile timeouts.
+
+    Args:
+        initial_limit: Starting in-flight limit per host
+        max_limit: Ceiling for any host's in-flight limit
+        percentile: Latency percentile the timeout is based on
+        multiplier: Timeout = percentile latency * multiplier
+        min_timeout: Lower bound on a derived timeout, in seconds
+        max_timeout: Upper bound on a derived timeout, in seconds
+        min_samples: Samples needed before an endpoint's timeout is derived; until then the
+            call site's own timeout is used
+        window: Number of recent latencies kept per endpoint
+    """
+
+    def __init__(self, initial_limit=6, max_limit=64, percentile=99, multiplier=3.0,
+                 min_timeout=2.0, max_timeout=60.0, min_samples=20, window=200):
+        self.initial_limit = initial_limit
+        self.max_limit = max_limit
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.min_samples = min_samples
+        self.window = window
+        self._limits = {}
+        self._latencies = {}
+        self._lock = threading.Lock()
+
+    def _host_limit(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            limit = self._limits.get(host)
+            if limit is None:
+                limit = AimdLimit(self.initial_limit, maximum=self.max_limit)
+                self._limits[host] = limit
+        return limit
+
+    def limit(self, url):
+        """
+        Current in-flight limit for this URL's host.
+        """
+        return self._host_limit(url).limit
+
+    def timeout(self, url, fallback):
+        """
+        Timeout for a request to this URL's endpoint, or `fallback` until enough samples exist.
+        """
+        with self._lock:
+            samples = list(self._latencies.get(endpoint_key(url), ()))
+        if len(samples) < self.min_samples:
+            return fallback
+        derived = float(np.percentile(samples, self.percentile)) * self.multiplier
+        return min(self.max_timeout, max(self.min_timeout, derived))
+
+    def _record_latency(self, url, seconds):
+        key = endpoint_key(url)
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = deque(maxlen=self.window)
+                self._latencies[key] = latencies
+            latencies.append(seconds)
+
+    def acquire(self, url):
+        """
+        Wait for an in-flight slot for this URL's host. Returns the AimdLimit to release.
+        """
+        limit = self._host_limit(url)
+        limit.acquire()
+        return limit
+
+    def try_acquire(self, url):
+        """
+        Take an in-flight slot for this URL's host if one is free, without waiting.
+        Returns the AimdLimit to release, or None when the host is at its limit.
+        """
+        limit = self._host_limit(url)
+        return limit if limit.try_acquire() else None
+
+    def release(self, url, limit, seconds, response=None, error=None):
+        """
+        Give back a slot and feed the outcome of the request into the controller.
+        """
+        ok = error is None and response is not None and response.status_code not in _THROTTLE_STATUS_CODES
+        if ok:
+            self._record_latency(url, seconds)
+        limit.release(ok, started=time.monotonic() - seconds)
+
+    def stats(self):
+        """
+        Current in-flight limit per host, for monitoring.
+        """
+        with self._lock:
+            return {host: limit.limit for host, limit in self._limits.items()}
@@ -0,0 +1,310 @@
+"""
+asyncio counterpart to full_scrape.
+
+Pages are downloaded with aiohttp on the running event loop, so hundreds of requests
+can be in flight without a thread each; the CPU-bound parsing of every game is handed
+to an executor. Cancelling the awaiting task cancels every outstanding download.
+
+Downloads follow the shared HTTP client's settings: its timeout override, the per-host
+rate limits, and either its adaptive limits or its fixed per_host_limit. Waiting on any
+of these happens on the loop itself, so it never occupies the executor's threads.
+
+Requires the optional aiohttp dependency (pip install TopDownHockey_Scraper[async]).
+"""
+
+import asyncio
+import functools
+import time
+
+import pandas as pd
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from TopDownHockey_Scraper.TopDownHockey_NHL_Scraper import (
+    _game_page_urls,
+    _http_client,
+    _disambiguate_pettersson,
+    _classify_scrape_failure,
+    _PERMANENT_FAILURES,
+    full_scrape_1by1,
+)
+from TopDownHockey_Scraper.response_cache import (
+    get_cached_response, store_response, conditional_headers, remember_validated_response, not_modified_response
+)
+from TopDownHockey_Scraper.response_archive import is_replaying, replay_response, record_response
+from TopDownHockey_Scraper import rate_limiter
+
+
+def _to_response(url, aio_response, content):
+    """
+    Wrap an aiohttp response in a requests.Response, so the existing parsers consume it unchanged.
+    """
+    response = requests.Response()
+    response._content = content
+    response.status_code = aio_response.status
+    response.reason = aio_response.reason
+    response.headers = CaseInsensitiveDict(aio_response.headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = str(aio_response.url) or url
+    return response
+
+
+def _is_transient(e):
+    """
+    True for fetch errors worth retrying: network failures, timeouts, 429 and 5xx.
+    Other HTTP errors (404, 403, ...) would get the same answer again.
+    """
+    if isinstance(e, (aiohttp.ClientError, asyncio.TimeoutError)):
+        return True
+    return _classify_scrape_failure(e) == 'network'
+
+
+# How often a request waiting on a host's adaptive limit checks for a free slot. Slots are also
+# freed by other threads' requests, so waiting polls the shared limit rather than an asyncio primitive.
+_SLOT_POLL_SECONDS = 0.02
+
+
+async def _aacquire_token(url):
+    """
+    Wait for the host's rate-limit token on the loop, without tying up a thread.
+    """
+    wait = rate_limiter.try_acquire(url)
+    while wait > 0:
+        await asyncio.sleep(wait)
+        wait = rate_limiter.try_acquire(url)
+
+
+async def _aacquire_slot(adaptive, url):
+    """
+    Wait for the adaptive controller's in-flight slot on the loop, without tying up a thread.
+    Cancelling the wait leaves nothing behind. Returns the AimdLimit to release.
+    """
+    limit = adaptive.try_acquire(url)
+    while limit is None:
+        await asyncio.sleep(_SLOT_POLL_SECONDS)
+        limit = adaptive.try_acquire(url)
+    return limit
+
+
+async def _aget(session, url, timeout, headers=None):
+    """
+    One GET through aiohttp, under the shared client's timeout override, rate limits and
+    adaptive concurrency (its fixed per_host_limit is applied by the session's connector).
+    """
+    await _aacquire_token(url)
+    if _http_client.timeout is not None:
+        timeout = _http_client.timeout
+    adaptive = _http_client.adaptive
+    limit = None
+    if adaptive is not None:
+        if _http_client.timeout is None:
+            timeout = adaptive.timeout(url, timeout)
+        limit = await _aacquire_slot(adaptive, url)
+    start = time.time()
+    response = None
+    error = None
+    try:
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as aio_response:
+            content = await aio_response.read()
+        response = _to_response(url, aio_response, content)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        error = e
+        raise
+    finally:
+        if limit is not None:
+            if response is not None or error is not None:
+                adaptive.release(url, limit, time.time() - start, response=response, error=error)
+            else:
+                # Cancelled, or failed in our own code: not a sign of congestion, so just give the slot back
+                limit.release(None)
+    return response
+
+
+async def _aget_conditional(session, url, timeout):
+    """
+    Async version of _http_get: serves the on-disk cache, makes the request conditional
+    when the URL was seen before, and hands back the previous response on a 304.
+    """
+    response = get_cached_response(url)
+    if response is not None:
+        return response
+    validators = conditional_headers(url)
+    response = await _aget(session, url, timeout, headers=validators or None)
+    if response.status_code == 304:
+        previous = not_modified_response(url)
+        if previous is not None:
+            return previous
+        # Previous response was evicted in the meantime; ask again unconditionally
+        response = await _aget(session, url, timeout)
+    remember_validated_response(url, response)
+    store_response(url, response)
+    return response
+
+
+async def _afetch_url(session, url, timeout, max_retries=3, base_delay=2):
+    """
+    Async version of _fetch_url: same cache, conditional GETs, archive, rate limits,
+    adaptive concurrency and exponential backoff, without blocking the event loop.
+    Only network errors, timeouts, 429 and 5xx are retried.
+    """
+    if is_replaying():
+        response = replay_response(url)
+        response.raise_for_status()
+        return response
+
+    for attempt in range(max_retries + 1):
+        try:
+            response = await _aget_conditional(session, url, timeout)
+            response.raise_for_status()
+            break
+        except (aiohttp.ClientError, asyncio.TimeoutError, requests.HTTPError) as e:
+            if not _is_transient(e):
+                raise
+            if attempt < max_retries:
+                delay = base_delay * (2 ** attempt)
+                print(f"  Fetch failed for {url.split('/')[-1]} (attempt {attempt + 1}/{max_retries + 1}): {e}")
+                if rate_limiter.is_rate_limited(url):
+                    # Back off the whole host through its token bucket, so every download slows down together
+                    rate_limiter.penalize(url, delay)
+                else:
+                    await asyncio.sleep(delay)
+            else:
+                print(f"  All {max_retries + 1} attempts failed for {url.split('/')[-1]}")
+                raise
+    record_response(url, response)
+    return response
+
+
+async def afetch_all_pages(session, season, game_id, verbose=False, include_api=True):
+    """
+    Async version of _fetch_all_pages_parallel.
+
+    Args:
+        session: aiohttp.ClientSession to fetch with
+        season: Season string (e.g., '20242025')
+        game_id: Full game ID (e.g., 2025020333)
+        verbose: If True, print detailed timing information
+        include_api: If True, also fetch NHL API play-by-play endpoint
+
+    Returns:
+        Dictionary with keys: 'events', 'roster', 'home_shifts', 'away_shifts', 'summary'
+        and optionally 'api'. All values are requests.Response objects.
+    """
+    urls = _game_page_urls(season, game_id, include_api=include_api)
+    fetch_start = time.time()
+    responses = await asyncio.gather(*[
+        _afetch_url(session, url, 30 if key == 'api' else 10) for key, url in urls.items()
+    ])
+    if verbose:
+        print(f'  ⏱️ All pages for {game_id} fetched in: {time.time() - fetch_start:.2f}s')
+    return dict(zip(urls.keys(), responses))
+
+
+async def _ascrape_game(session, game_semaphore, executor, game_id, live, shift, return_intermediates, verbose, failures):
+    """
+    Fetch one game's pages on the loop, then parse them in the executor.
+    If the async fetch fails transiently, the game is parsed without pages and falls back to
+    full_scrape_1by1's own blocking fetch and retry handling. A permanent failure (e.g. a 404)
+    is recorded in `failures` and the game is skipped.
+    """
+    async with game_semaphore:
+        season = str(int(str(game_id)[:4])) + str(int(str(game_id)[:4]) + 1)
+        try:
+            pages = await afetch_all_pages(session, season, game_id, verbose=verbose, include_api=not shift)
+            pages_by_game = {game_id: pages}
+        except (aiohttp.ClientError, asyncio.TimeoutError, requests.HTTPError) as e:
+            if not _is_transient(e):
+                print(f'Async fetch failed for {game_id} ({e}); skipping it.')
+                failures[game_id] = _classify_scrape_failure(e)
+                empty = pd.DataFrame()
+                return {'final': empty, 'intermediates': []} if return_intermediates else empty
+            print(f'Async fetch failed for {game_id} ({e}); falling back to a blocking fetch.')
+            pages_by_game = None
+
+        parse = functools.partial(
+            full_scrape_1by1, [game_id], live, shift_to_espn = shift,
+            return_intermediates = return_intermediates, verbose = verbose, pages_by_game = pages_by_game
+        )
+        return await asyncio.get_running_loop().run_in_executor(executor, parse)
+
+
+async def _ascrape_games(game_id_list, concurrency, executor, live, shift, return_intermediates, verbose, failures):
+    # Without the adaptive controller, the shared client's fixed per-host limit caps each host here
+    per_host_limit = _http_client.per_host_limit if _http_client.adaptive is None else None
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host_limit or 0)
+    # Cap games whose pages are held in memory but not parsed yet at about one request slot each
+    game_semaphore = asyncio.Semaphore(max(1, concurrency // 6))
+    headers = dict(_http_client.session.headers)
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        return await asyncio.gather(*[
+            _ascrape_game(session, game_semaphore, executor, game_id, live, shift, return_intermediates, verbose, failures)
+            for game_id in game_id_list
+        ])
+
+
+def _combine_results(results, return_intermediates):
+    frames = []
+    intermediates_list = []
+    for result in results:
+        if return_intermediates:
+            frames.append(result['final'])
+            intermediates_list.extend(result['intermediates'])
+        else:
+            frames.append(result)
+    frames = [frame for frame in frames if len(frame) > 0]
+    full = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return full, intermediates_list
+
+
+async def afull_scrape(game_id_list, concurrency = 60, live = True, shift = False, return_intermediates = False, verbose = False, executor = None):
+    """
+    Scrape a list of games with asyncio. Returns the same result as full_scrape.
+
+    Args:
+        game_id_list: A list of NHL game ids
+        concurrency: Maximum number of HTTP requests in flight at once (default 60)
+        live: Same as full_scrape
+        shift: Same as full_scrape
+        return_intermediates: Same as full_scrape
+        verbose: If True, print detailed timing information
+        executor: concurrent.futures executor that runs the parsing. None uses the loop's
+            default thread pool; pass a ProcessPoolExecutor to parse on several cores.
+
+    Returns:
+        DataFrame of play-by-play data (or {'final': ..., 'intermediates': ...})
+    """
+    if aiohttp is None:
+        raise ImportError('afull_scrape requires aiohttp. Install it with: pip install aiohttp')
+
+    # Games whose pages failed to download for good: {game_id: failure class}
+    failures = {}
+    results = await _ascrape_games(game_id_list, concurrency, executor, live, shift, return_intermediates, verbose, failures)
+    df, intermediates_list = _combine_results(results, return_intermediates)
+    df = _disambiguate_pettersson(df)
+
+    # Same as full_scrape: give every missing game one more try
+    if len(df) > 0:
+        gids = set(df.game_id)
+        missing = [x for x in game_id_list if x not in gids]
+        # Don't spend another attempt on games that failed for reasons a retry won't fix
+        permanent = {x: failures[x] for x in missing if failures.get(x) in _PERMANENT_FAILURES}
+        if len(permanent) > 0:
+            print('These games could not be scraped and will not be retried: ' + str(permanent))
+            missing = [x for x in missing if x not in permanent]
+        if len(missing) > 0:
+            print('You missed the following games: ' + str(missing))
+            print('Let us try scraping each of them one more time.')
+            retry_results = await _ascrape_games(missing, concurrency, executor, False, True, return_intermediates, verbose, failures)
+            retry_df, retry_intermediates = _combine_results(retry_results, return_intermediates)
+            df = pd.concat([df, retry_df], ignore_index=True)
+            intermediates_list.extend(retry_intermediates)
+
+    if return_intermediates:
+        return {'final': df, 'intermediates': intermediates_list}
+    return df
@@ -0,0 +1,110 @@
+"""
+Per-game registry of decoded and parsed pages.
+
+Several stages of one game's scrape read the same raw pages: the roster is read by
+scrape_html_events and, without a cached roster, again by merge_and_prepare; the API
+play-by-play JSON is read for its roster spots and again for its events; the game
+summary is searched for both teams' goaltenders. The registry keeps each page's decoded
+text, lxml tree and JSON the first time a stage asks for them, so every report is
+decoded and parsed once per game.
+
+full_scrape_1by1 starts a fresh registry for each game and releases it when the scrape
+ends. With no registry active (e.g. scrape_html_events called on its own) pages are
+simply parsed on every call. Registries are per thread, because afull_scrape parses
+several games at once in executor threads.
+
+Trees and JSON are shared between stages, so no stage may modify them.
+"""
+
+import threading
+
+from lxml import html
+
+from TopDownHockey_Scraper.json_backend import response_json
+
+_local = threading.local()
+
+
+def start_game_documents():
+    """
+    Start an empty registry for the current thread's next game, releasing the previous one.
+    """
+    _local.registry = {'documents': {}, 'urls': {}}
+
+
+def release_game_documents():
+    """
+    Drop the current thread's registry and everything parsed into it.
+    """
+    _local.registry = None
+
+
+def _registry():
+    return getattr(_local, 'registry', None)
+
+
+def register_page(url, page):
+    """
+    Record the response fetched for a URL, so a stage that would fetch it again uses this one.
+    """
+    registry = _registry()
+    if registry is not None:
+        registry['urls'][url] = page
+
+
+def registered_page(url):
+    """
+    Response registered for a URL in the current game, or None.
+    """
+    registry = _registry()
+    if registry is None:
+        return None
+    return registry['urls'].get(url)
+
+
+def _cached(page, key, build):
+    registry = _registry()
+    if registry is None:
+        return build()
+    # Entries hold on to their page, so its id can't be reused by another object while registered
+    entry = registry['documents'].get(id(page))
+    if entry is None or entry[0] is not page:
+        entry = registry['documents'][id(page)] = (page, {})
+    values = entry[1]
+    if key not in values:
+        values[key] = build()
+    return values[key]
+
+
+def page_text(page, encoding=None):
+    """
+    Decoded text of a page.
+
+    Args:
+        page: requests.Response, or an already decoded str (returned as is)
+        encoding: Codec to decode the raw bytes with. None uses requests' own decoding (page.text).
+
+    Returns:
+        The page as a str
+    """
+    if type(page) == str:
+        return page
+    if encoding is None:
+        return _cached(page, ('text', None), lambda: page.text)
+    return _cached(page, ('text', encoding), lambda: page.content.decode(encoding))
+
+
+def page_tree(page, encoding=None):
+    """
+    lxml document of a page. Takes the same arguments as page_text; an HtmlElement is returned as is.
+    """
+    if isinstance(page, html.HtmlElement):
+        return page
+    return _cached(page, ('tree', encoding), lambda: html.fromstring(page_text(page, encoding)))
+
+
+def page_json(page):
+    """
+    Decoded JSON body of a requests.Response.
+    """
+    return _cached(page, 'json', lambda: response_json(page))
@@ -0,0 +1,177 @@
+"""
+Shared HTTP client for every scraper module.
+
+All modules fetch through one HttpClient, so keep-alive connections are pooled and
+reused across the NHL HTML reports, the NHL API, ESPN and EliteProspects. Pool size,
+retries, timeouts and per-host concurrency are configurable at runtime with
+configure_http_client(), e.g. to match the pool to the number of workers.
+Requests also wait on the per-host token buckets from rate_limiter, when configured.
+With adaptive=True, each host's concurrency is capped by a limit that backs off under
+errors and throttling, and timeouts follow observed latency (see adaptive_concurrency).
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from TopDownHockey_Scraper import rate_limiter
+from TopDownHockey_Scraper.adaptive_concurrency import AdaptiveController
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/146.0.0.0 Safari/537.36',
+    'Origin': 'https://www.nhl.com',
+    'Referer': 'https://www.nhl.com/',
+    'Accept': '*/*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'sec-ch-ua': '"Chromium";v="146", "Not-A.Brand";v="24", "Google Chrome";v="146"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"macOS"',
+    'sec-fetch-dest': 'empty',
+    'sec-fetch-mode': 'cors',
+    'sec-fetch-site': 'cross-site',
+}
+
+
+class HttpClient:
+    """
+    A requests.Session plus the knobs the scraper needs on top of it.
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum keep-alive connections per host
+        max_retries: Connection-level retries done by urllib3
+        timeout: If set, overrides the timeout every call site asks for
+        per_host_limit: If set, maximum concurrent in-flight requests per host
+        headers: Default headers sent with every request
+        adaptive: If True (or an AdaptiveController), replaces the fixed per-host limit and
+            call-site timeouts with AIMD limits and latency-percentile timeouts
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=20, max_retries=2, timeout=None,
+                 per_host_limit=None, headers=None, adaptive=False):
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS if headers is None else headers)
+        self._lock = threading.Lock()
+        self._host_semaphores = {}
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit
+        self.adaptive = None
+        self._set_adaptive(adaptive)
+        self._mount()
+
+    def _set_adaptive(self, adaptive):
+        if isinstance(adaptive, AdaptiveController):
+            self.adaptive = adaptive
+        elif adaptive:
+            self.adaptive = AdaptiveController(initial_limit=self.per_host_limit or 6, max_limit=self.pool_maxsize)
+        else:
+            self.adaptive = None
+
+    def _mount(self):
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def configure(self, pool_connections=None, pool_maxsize=None, max_retries=None, timeout=None,
+                  per_host_limit=None, headers=None, adaptive=None):
+        """
+        Change settings in place. Arguments left as None keep their current value.
+        """
+        with self._lock:
+            if pool_connections is not None or pool_maxsize is not None or max_retries is not None:
+                if pool_connections is not None:
+                    self.pool_connections = pool_connections
+                if pool_maxsize is not None:
+                    self.pool_maxsize = pool_maxsize
+                if max_retries is not None:
+                    self.max_retries = max_retries
+                self._mount()
+            if timeout is not None:
+                self.timeout = timeout
+            if per_host_limit is not None:
+                self.per_host_limit = per_host_limit
+                self._host_semaphores = {}
+            if headers is not None:
+                self.session.headers.update(headers)
+            if adaptive is not None:
+                self._set_adaptive(adaptive)
+
+    def config(self):
+        """
+        Return the current settings, suitable for configure(**config) in a worker process.
+        """
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'max_retries': self.max_retries,
+            'timeout': self.timeout,
+            'per_host_limit': self.per_host_limit,
+            'headers': dict(self.session.headers),
+            'adaptive': self.adaptive is not None,
+        }
+
+    def _host_semaphore(self, url):
+        if not self.per_host_limit:
+            return None
+        host = urlsplit(url).netloc
+        with self._lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def get(self, url, **kwargs):
+        """
+        GET a URL through the shared session, honouring the configured timeout,
+        per-host rate limit and per-host concurrency limit.
+        """
+        if self.timeout is not None:
+            kwargs['timeout'] = self.timeout
+        # Wait for a rate-limit token before taking a concurrency slot
+        rate_limiter.acquire(url)
+        adaptive = self.adaptive
+        if adaptive is not None:
+            if self.timeout is None:
+                kwargs['timeout'] = adaptive.timeout(url, kwargs.get('timeout'))
+            limit = adaptive.acquire(url)
+            start = time.time()
+            try:
+                response = self.session.get(url, **kwargs)
+            except Exception as e:
+                adaptive.release(url, limit, time.time() - start, error=e)
+                raise
+            adaptive.release(url, limit, time.time() - start, response=response)
+            return response
+        semaphore = self._host_semaphore(url)
+        if semaphore is None:
+            return self.session.get(url, **kwargs)
+        with semaphore:
+            return self.session.get(url, **kwargs)
+
+
+_client = HttpClient()
+
+
+def get_http_client():
+    """
+    Return the HttpClient shared by every scraper module.
+    """
+    return _client
+
+
+def configure_http_client(**settings):
+    """
+    Tune the shared HttpClient. Accepts the same arguments as HttpClient.configure():
+    pool_connections, pool_maxsize, max_retries, timeout, per_host_limit, headers, adaptive.
+    """
+    _client.configure(**settings)
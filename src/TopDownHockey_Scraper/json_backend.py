@@ -0,0 +1,64 @@
+"""
+JSON decoding for API payloads, with an optional fast backend.
+
+When orjson (or else msgspec) is installed, payloads are decoded with it straight from
+the response bytes, with no intermediate str; otherwise the standard library is used.
+Install one with: pip install TopDownHockey_Scraper[fast-json]
+
+The fast decoders are stricter than the standard library (UTF-8 only, no NaN or
+Infinity literals), so anything they reject is decoded again with the standard
+library, which gives the same result or the same error as before. One difference
+remains: orjson reads integers wider than 64 bits as floats. NHL and ESPN IDs are
+far below that.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if orjson is not None:
+    _fast_loads, _fast_error, _backend = orjson.loads, orjson.JSONDecodeError, 'orjson'
+elif msgspec is not None:
+    _fast_loads, _fast_error, _backend = msgspec.json.decode, msgspec.DecodeError, 'msgspec'
+else:
+    _fast_loads, _fast_error, _backend = None, None, 'json'
+
+
+def json_backend():
+    """
+    Name of the library decoding JSON: 'orjson', 'msgspec' or 'json'.
+    """
+    return _backend
+
+
+def loads(data):
+    """
+    Decode a JSON document.
+
+    Args:
+        data: bytes (e.g. response.content) or str
+
+    Returns:
+        The decoded value
+    """
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(data)
+        except _fast_error:
+            pass
+    return json.loads(data)
+
+
+def response_json(response):
+    """
+    Decode a requests.Response's JSON body from its raw bytes. Use instead of response.json().
+    """
+    return loads(response.content)
@@ -1,3 +1,5 @@
+import functools
+import numpy as np
 import pandas as pd
 import re
 import unicodedata
@@ -278,12 +280,19 @@ NAME_CORRECTIONS.update(NAME_CORRECTIONS_MULTI)
 
 NAME_CORRECTIONS.update(ESPNNAME_CORRECTIONS)
 
+# Distinct names kept by the normalization memo; a season has a couple of thousand
+_NAME_CACHE_SIZE = 8192
+
 def normalize_player_name(name):
     """Apply the same name normalization as scrape_espn_events"""
     if pd.isna(name) or name == '':
         return name
-    
-    name = str(name).strip()
+    # OPTIMIZED: The same few hundred names repeat across every shift and game, so results are memoized
+    return _normalize_name(str(name))
+
+@functools.lru_cache(maxsize=_NAME_CACHE_SIZE)
+def _normalize_name(name):
+    name = name.strip()
     
     # Remove (A) and (C) designations
     name = re.sub(r' \(A\)$', '', name).strip()
@@ -305,4 +314,35 @@ def normalize_player_name(name):
 
     name = name_corrections.get(name, name)
     
-    return name.strip()
\ No newline at end of file
+    return name.strip()
+
+def normalize_player_names(names):
+    """
+    Normalize a column of names, running normalize_player_name once per distinct value.
+
+    Args:
+        names: pandas Series or array-like of names
+
+    Returns:
+        Series of normalized names with the same index (an object array for other inputs).
+        Missing values are passed through unchanged.
+    """
+    values = np.asarray(names, dtype=object)
+    codes, uniques = pd.factorize(values)
+    if len(uniques) == 0:
+        return names.copy() if isinstance(names, pd.Series) else values.copy()
+    normalized = np.empty(len(uniques), dtype=object)
+    normalized[:] = [normalize_player_name(name) for name in uniques]
+    result = normalized[codes]
+    missing = codes == -1
+    if missing.any():
+        result[missing] = values[missing]
+    if isinstance(names, pd.Series):
+        return pd.Series(result, index=names.index, name=names.name)
+    return result
+
+def clear_name_cache():
+    """
+    Forget memoized normalizations. Call after changing NAME_CORRECTIONS at runtime.
+    """
+    _normalize_name.cache_clear()
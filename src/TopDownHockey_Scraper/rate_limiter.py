@@ -0,0 +1,211 @@
+"""
+Per-host token-bucket rate limiting for the shared HTTP client.
+
+Each host gets a bucket that refills at a configured number of requests per second,
+up to a burst capacity. Every request takes one token first, waiting if the bucket is
+empty. The 'memory' backend coordinates all threads in one process; the 'file'
+backend keeps each bucket in a small locked file so several processes (for example,
+full_scrape workers) share a single budget per host.
+
+Rate limiting is off until configure_rate_limits() is called.
+"""
+
+import os
+import struct
+import threading
+import time
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_BUCKET_FORMAT = 'dd'  # tokens, last refill time
+_BUCKET_SIZE = struct.calcsize(_BUCKET_FORMAT)
+
+_rates = {}
+_default_rate = None
+_burst = None
+_backend = 'memory'
+_state_dir = None
+_buckets = {}
+_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    In-process token bucket, safe to share between threads.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum number of tokens the bucket holds
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.time()
+        self._lock = threading.Lock()
+
+    def _update(self, tokens, last, penalty=0):
+        """
+        Refill, then take a token (or apply a penalty). Returns (tokens, last, seconds to wait).
+        """
+        now = time.time()
+        tokens = min(self.capacity, tokens + (now - last) * self.rate)
+        if penalty:
+            # Penalties overlap rather than add up: threads that all hit the same 429 hold the host back once
+            return min(tokens, 0, -penalty * self.rate), now, 0
+        if tokens >= 1:
+            return tokens - 1, now, 0
+        return tokens, now, (1 - tokens) / self.rate
+
+    def _take(self, penalty=0):
+        with self._lock:
+            self._tokens, self._last, wait = self._update(self._tokens, self._last, penalty)
+        return wait
+
+    def acquire(self):
+        """
+        Block until a token is available, then take it.
+        """
+        wait = self._take()
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._take()
+
+    def penalize(self, seconds):
+        """
+        Empty the bucket so that no request goes out for `seconds`, e.g. after a 429.
+        """
+        self._take(penalty=seconds)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in a file guarded by flock, shared between processes.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum number of tokens the bucket holds
+        path: File holding the bucket state (created if missing)
+    """
+
+    def __init__(self, rate, capacity, path):
+        super().__init__(rate, capacity)
+        self.path = path
+
+    def _take(self, penalty=0):
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                raw = os.pread(fd, _BUCKET_SIZE, 0)
+                if len(raw) == _BUCKET_SIZE:
+                    tokens, last = struct.unpack(_BUCKET_FORMAT, raw)
+                else:
+                    tokens, last = self.capacity, time.time()
+                tokens, last, wait = self._update(tokens, last, penalty)
+                os.pwrite(fd, struct.pack(_BUCKET_FORMAT, tokens, last), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+        return wait
+
+
+def configure_rate_limits(rates=None, default_rate=None, burst=None, backend='memory', state_dir=None):
+    """
+    Turn on per-host rate limiting (or off, when called with no rates).
+
+    Args:
+        rates: Dict of {host: requests per second}, e.g. {'www.nhl.com': 8, 'api-web.nhle.com': 10}
+        default_rate: Requests per second for hosts not in `rates` (None = unlimited)
+        burst: Bucket capacity, i.e. how many requests may go out back to back (default: one second's worth)
+        backend: 'memory' to share buckets between threads, or 'file' to also share them between processes
+        state_dir: Directory for the 'file' backend's bucket files
+    """
+    global _rates, _default_rate, _burst, _backend, _state_dir, _buckets
+    if backend == 'file':
+        if fcntl is None:
+            print('File-based rate limiting needs fcntl, which this platform lacks. Falling back to in-process buckets.')
+            backend = 'memory'
+        elif state_dir is None:
+            raise ValueError("backend='file' requires a state_dir")
+        else:
+            state_dir = os.path.abspath(os.path.expanduser(state_dir))
+            os.makedirs(state_dir, exist_ok=True)
+    with _lock:
+        _rates = dict(rates or {})
+        _default_rate = default_rate
+        _burst = burst
+        _backend = backend
+        _state_dir = state_dir
+        _buckets = {}
+
+
+def rate_limit_config():
+    """
+    Return the current settings, suitable for configure_rate_limits(**config) in a worker process.
+    """
+    return {'rates': dict(_rates), 'default_rate': _default_rate, 'burst': _burst,
+            'backend': _backend, 'state_dir': _state_dir}
+
+
+def _bucket(url):
+    host = urlsplit(url).netloc
+    rate = _rates.get(host, _default_rate)
+    if not rate:
+        return None
+    with _lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            capacity = _burst if _burst is not None else max(1, rate)
+            if _backend == 'file':
+                bucket = FileTokenBucket(rate, capacity, os.path.join(_state_dir, host.replace(':', '_') + '.bucket'))
+            else:
+                bucket = TokenBucket(rate, capacity)
+            _buckets[host] = bucket
+    return bucket
+
+
+def is_rate_limited(url):
+    """
+    True if requests to this URL's host go through a token bucket.
+    """
+    return _bucket(url) is not None
+
+
+def acquire(url):
+    """
+    Wait for a token for this URL's host. Returns immediately for unlimited hosts.
+    """
+    bucket = _bucket(url)
+    if bucket is not None:
+        bucket.acquire()
+
+
+def try_acquire(url):
+    """
+    Take a token for this URL's host if one is available, without waiting. For callers that
+    can't block, such as coroutines on an event loop.
+
+    Returns:
+        0 once a token was taken (or the host is unlimited), otherwise the seconds to wait
+        before asking again.
+    """
+    bucket = _bucket(url)
+    if bucket is None:
+        return 0
+    return bucket._take()
+
+
+def penalize(url, seconds):
+    """
+    Hold back every request to this URL's host for `seconds`, across all threads
+    (and processes, with the file backend).
+    """
+    bucket = _bucket(url)
+    if bucket is not None:
+        bucket.penalize(seconds)
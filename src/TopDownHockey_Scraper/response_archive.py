@@ -0,0 +1,121 @@
+"""
+Record/replay archive of raw HTTP responses.
+
+When recording, every page the scraper fetches (HTML reports, API JSON, shift charts,
+ESPN pages) is written under the record directory, laid out by host and path so an
+archived season is easy to browse. When replaying, pages are served from a replay
+directory instead of the network; a page missing from the archive comes back as a 404.
+"""
+
+import json
+import os
+import re
+import threading
+from urllib.parse import urlsplit
+
+import requests
+
+from TopDownHockey_Scraper.response_cache import response_meta, rebuild_response
+
+_record_dir = None
+_replay_dir = None
+_record_error_reported = False
+
+_UNSAFE_PATH_PATTERN = re.compile(r'[^A-Za-z0-9._=-]')
+
+
+def configure_response_archive(record_dir=None, replay_dir=None):
+    """
+    Set (or clear, with None) the directories responses are recorded to and replayed from.
+
+    Args:
+        record_dir: Directory to save every fetched response in
+        replay_dir: Directory to serve responses from instead of the network
+    """
+    global _record_dir, _replay_dir, _record_error_reported
+    _record_error_reported = False
+    _record_dir = os.path.abspath(os.path.expanduser(record_dir)) if record_dir else None
+    _replay_dir = os.path.abspath(os.path.expanduser(replay_dir)) if replay_dir else None
+
+
+def archive_config():
+    """
+    Return the current archive settings, suitable for configure_response_archive(**config).
+    """
+    return {'record_dir': _record_dir, 'replay_dir': _replay_dir}
+
+
+def is_replaying():
+    """
+    True when responses are being served from a replay directory.
+    """
+    return _replay_dir is not None
+
+
+def _archive_path(root, url, params=None):
+    """
+    Map a URL to its file in an archive: <root>/<host>/<path>[__<query>].
+    """
+    if params:
+        url = requests.Request('GET', url, params=params).prepare().url
+    parts = urlsplit(url)
+    path = parts.path.strip('/') or 'index'
+    if parts.query:
+        path += '__' + _UNSAFE_PATH_PATTERN.sub('_', parts.query)
+    segments = [_UNSAFE_PATH_PATTERN.sub('_', segment) for segment in path.split('/')]
+    return os.path.join(root, parts.netloc, *segments)
+
+
+def replay_response(url, params=None):
+    """
+    Serve a URL from the replay directory.
+
+    Returns:
+        The archived requests.Response, or a 404 response if the page was never recorded.
+    """
+    body_path = _archive_path(_replay_dir, url, params)
+    try:
+        with open(body_path + '.meta.json', 'r') as f:
+            meta = json.load(f)
+        with open(body_path, 'rb') as f:
+            content = f.read()
+    except OSError:
+        return rebuild_response(b'', {
+            'url': url,
+            'status_code': 404,
+            'reason': 'Not Found in replay archive',
+            'encoding': None,
+            'headers': {},
+        })
+    return rebuild_response(content, meta)
+
+
+def record_response(url, response, params=None):
+    """
+    Save a successful response to the record directory, if recording. A page that can't be
+    written (disk full, permissions, path too long) is skipped, so recording never breaks a scrape.
+    """
+    global _record_error_reported
+    if _record_dir is None or response.status_code != 200:
+        return
+    body_path = _archive_path(_record_dir, url, params)
+    meta_path = body_path + '.meta.json'
+    suffix = f'.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        with open(body_path + suffix, 'wb') as f:
+            f.write(response.content)
+        with open(meta_path + suffix, 'w') as f:
+            json.dump(response_meta(url, response), f)
+        os.replace(body_path + suffix, body_path)
+        os.replace(meta_path + suffix, meta_path)
+    except OSError as e:
+        for path in (body_path + suffix, meta_path + suffix):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        # Report the first failure only; a full disk would otherwise print for every page
+        if not _record_error_reported:
+            _record_error_reported = True
+            print('Could not record responses to ' + _record_dir + ', continuing without them: ' + str(e))
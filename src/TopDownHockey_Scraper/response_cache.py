@@ -0,0 +1,371 @@
+"""
+Persistent on-disk cache of raw HTTP responses.
+
+Bodies are stored zlib-compressed under the SHA-256 of their URL, next to a small
+JSON sidecar holding the status, encoding and headers needed to rebuild a
+requests.Response. Reports for completed games never change, so those entries
+never expire; anything else (live games, schedules, shift charts) expires after
+a short TTL. Total size is capped, evicting the least recently used entries first.
+
+The cache is off until enable_response_cache() is called.
+
+Separately, an in-memory layer supports conditional GETs for live polling: the
+last response carrying an ETag or Last-Modified validator is remembered per URL,
+a 304 answer reuses it, and while a game is in progress its parse results are memoized
+on those validators (or on a hash of the body), so a polled page that hasn't changed is
+not parsed twice.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+import pandas as pd
+import requests
+from requests.structures import CaseInsensitiveDict
+
+_cache_dir = None
+_max_bytes = None
+_live_ttl = None
+_total_bytes = None
+_lock = threading.Lock()
+
+# URLs that identify one game's report. Only these can be final; date-wide pages such as
+# the ESPN scoreboard list finished and upcoming games side by side and must keep expiring
+_SINGLE_GAME_URL_PATTERN = re.compile(
+    r'nhl\.com/scores/htmlreports/\d{8}/[A-Z]{2}\d+\.HTM$'
+    r'|api-web\.nhle\.com/v1/gamecenter/\d+/'
+    r'|espn\.com/nhl/playbyplay/_/gameId/\d+', re.IGNORECASE)
+
+# Markers that a page describes a game that is over
+_FINAL_API_PATTERN = re.compile(rb'"gameState"\s*:\s*"(?:OFF|FINAL)"')
+_FINAL_HTML_PATTERN = re.compile(rb'>\s*Final\s*<')
+
+# Only the headers worth keeping to rebuild a response
+_KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+def enable_response_cache(cache_dir, max_bytes=2 * 1024 ** 3, live_ttl=60):
+    """
+    Turn on the on-disk response cache.
+
+    Args:
+        cache_dir: Directory to store cached responses in (created if missing)
+        max_bytes: Size cap for the cache in bytes, enforced with LRU eviction (default 2 GB)
+        live_ttl: Seconds before a response for a game that is not final is refetched (default 60)
+    """
+    global _cache_dir, _max_bytes, _live_ttl, _total_bytes
+    cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+    os.makedirs(cache_dir, exist_ok=True)
+    with _lock:
+        _cache_dir = cache_dir
+        _max_bytes = max_bytes
+        _live_ttl = live_ttl
+        _total_bytes = None
+
+
+def disable_response_cache():
+    """
+    Turn off the on-disk response cache. Files already on disk are kept.
+    """
+    global _cache_dir, _total_bytes
+    with _lock:
+        _cache_dir = None
+        _total_bytes = None
+
+
+def cache_config():
+    """
+    Return the current cache settings as a dict (or None when disabled), so they can be
+    re-applied with enable_response_cache(**config) inside worker processes.
+    """
+    if _cache_dir is None:
+        return None
+    return {'cache_dir': _cache_dir, 'max_bytes': _max_bytes, 'live_ttl': _live_ttl}
+
+
+def response_meta(url, response):
+    """
+    Describe a response with everything (besides the body) needed to rebuild it later.
+    """
+    return {
+        'url': response.url or url,
+        'status_code': response.status_code,
+        'reason': response.reason,
+        'encoding': response.encoding,
+        'headers': {k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers},
+        'fetched_at': time.time(),
+    }
+
+
+def rebuild_response(content, meta):
+    """
+    Rebuild a requests.Response from a stored body and its response_meta() description.
+    """
+    response = requests.Response()
+    response._content = content
+    response.status_code = meta['status_code']
+    response.reason = meta.get('reason')
+    response.encoding = meta['encoding']
+    response.headers = CaseInsensitiveDict(meta['headers'])
+    response.url = meta['url']
+    return response
+
+
+def _cache_key(url, params=None):
+    if params:
+        url = requests.Request('GET', url, params=params).prepare().url
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def _entry_paths(key):
+    directory = os.path.join(_cache_dir, key[:2])
+    return os.path.join(directory, key + '.z'), os.path.join(directory, key + '.json')
+
+
+def _is_final(url, content):
+    """
+    Decide whether a page is a single game's report for a completed game.
+    The API play-by-play carries gameState; the HTML reports print 'Final' in the header.
+    """
+    if not url or not _SINGLE_GAME_URL_PATTERN.search(url.split('?')[0]):
+        return False
+    return bool(_FINAL_API_PATTERN.search(content) or _FINAL_HTML_PATTERN.search(content))
+
+
+def get_cached_response(url, params=None):
+    """
+    Look up a URL in the cache.
+
+    Returns:
+        A requests.Response rebuilt from disk, or None on a miss, an expired entry,
+        or when the cache is disabled.
+    """
+    if _cache_dir is None:
+        return None
+    body_path, meta_path = _entry_paths(_cache_key(url, params))
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        if not meta['final'] and time.time() - meta['fetched_at'] > _live_ttl:
+            return None
+        with open(body_path, 'rb') as f:
+            content = zlib.decompress(f.read())
+        # Touch the body so LRU eviction sees this entry as recently used
+        os.utime(body_path, None)
+    except (OSError, ValueError, KeyError, zlib.error):
+        return None
+
+    return rebuild_response(content, meta)
+
+
+def store_response(url, response, params=None):
+    """
+    Write a successful response to the cache. Non-200 responses are not cached.
+    """
+    global _total_bytes
+    if _cache_dir is None or response.status_code != 200:
+        return
+    body_path, meta_path = _entry_paths(_cache_key(url, params))
+    compressed = zlib.compress(response.content)
+    meta = response_meta(url, response)
+    meta['final'] = _is_final(url, response.content)
+    try:
+        # An overwritten entry's old body no longer counts towards the cache size
+        replaced_bytes = os.path.getsize(body_path)
+    except OSError:
+        replaced_bytes = 0
+    try:
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        # Write-then-rename so concurrent readers (threads or processes) never see a partial entry
+        suffix = f'.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(body_path + suffix, 'wb') as f:
+            f.write(compressed)
+        with open(meta_path + suffix, 'w') as f:
+            json.dump(meta, f)
+        os.replace(body_path + suffix, body_path)
+        os.replace(meta_path + suffix, meta_path)
+    except OSError:
+        return
+
+    with _lock:
+        if _total_bytes is not None:
+            _total_bytes += len(compressed) - replaced_bytes
+        if _total_bytes is None or _total_bytes > _max_bytes:
+            _evict()
+
+
+def _evict():
+    """
+    Drop least recently used entries until the cache is back under 90% of its cap.
+    Re-measures the directory, so entries written by other processes are counted too.
+    Must be called with _lock held.
+    """
+    global _total_bytes
+    entries = []
+    total = 0
+    for directory in os.scandir(_cache_dir):
+        if not directory.is_dir():
+            continue
+        for entry in os.scandir(directory.path):
+            if entry.name.endswith('.z'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+    if total > _max_bytes:
+        target = _max_bytes * 0.9
+        for _, size, body_path in sorted(entries):
+            if total <= target:
+                break
+            for path in (body_path, body_path[:-2] + '.json'):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+    _total_bytes = total
+
+
+# ========== CONDITIONAL GET (ETag / If-Modified-Since) ==========
+_MAX_VALIDATED_RESPONSES = 64
+_MAX_PARSED_RESULTS = 32
+_validated_responses = OrderedDict()  # url -> last 200 response that carried a validator
+_parsed_results = OrderedDict()  # parse key -> parse result
+_memo_lock = threading.Lock()
+
+
+def response_validator(response):
+    """
+    Return (url, ETag, Last-Modified) for a response, or None if it carries neither.
+    """
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag is None and last_modified is None:
+        return None
+    return (response.url, etag, last_modified)
+
+
+def conditional_headers(url):
+    """
+    Build If-None-Match / If-Modified-Since headers from the last response seen for a URL.
+    """
+    with _memo_lock:
+        previous = _validated_responses.get(url)
+    if previous is None:
+        return {}
+    headers = {}
+    if 'ETag' in previous.headers:
+        headers['If-None-Match'] = previous.headers['ETag']
+    if 'Last-Modified' in previous.headers:
+        headers['If-Modified-Since'] = previous.headers['Last-Modified']
+    return headers
+
+
+def remember_validated_response(url, response):
+    """
+    Keep a 200 response that carries a validator, so the next request can be conditional.
+    """
+    if response.status_code != 200 or response_validator(response) is None:
+        return
+    with _memo_lock:
+        _validated_responses[url] = response
+        _validated_responses.move_to_end(url)
+        while len(_validated_responses) > _MAX_VALIDATED_RESPONSES:
+            _validated_responses.popitem(last=False)
+
+
+def not_modified_response(url):
+    """
+    Return the response a 304 for this URL refers to, or None if it has been evicted.
+    """
+    with _memo_lock:
+        return _validated_responses.get(url)
+
+
+def _page_key(page):
+    """
+    Key a page by its validator, or by a hash of its body when it carries none.
+    Returns None for a page of a completed game: outside live polling a page is fetched and
+    parsed once, so keeping its parse would only cost memory and copies.
+    """
+    if _is_final(page.url, page.content):
+        return None
+    validator = response_validator(page)
+    if validator is not None:
+        return ('page',) + validator
+    return ('body', page.url, hashlib.sha1(page.content).hexdigest())
+
+
+def _parse_key_part(value):
+    """
+    Reduce one non-page parse argument to a hashable key part. DataFrame arguments (the
+    roster cache) are keyed by their content, since a corrected roster page changes them
+    while the events page stays the same.
+    Raises KeyError (or TypeError, for unhashable cells) for anything that can't be keyed reliably.
+    """
+    if isinstance(value, pd.DataFrame):
+        return ('frame', tuple(value.columns), int(pd.util.hash_pandas_object(value).sum()))
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise KeyError('unkeyable argument')
+
+
+def _copy_parse_result(result):
+    if isinstance(result, pd.DataFrame):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_copy_parse_result(part) for part in result)
+    return result
+
+
+def reuse_unchanged_parse(parse):
+    """
+    Decorator for parse functions that take pre-fetched pages. While polling a game in
+    progress, when every page argument carries the same validator (or body) as a previous
+    call, for instance because the server answered 304, a copy of the earlier result is
+    returned instead of parsing again. Calls with a completed game's page, or with no page,
+    are passed straight through.
+    """
+    def key_part(value):
+        if isinstance(value, requests.Response):
+            page_key = _page_key(value)
+            if page_key is None:
+                raise KeyError('page of a completed game')
+            return page_key
+        return _parse_key_part(value)
+
+    @functools.wraps(parse)
+    def wrapper(*args, **kwargs):
+        has_page = any(isinstance(value, requests.Response) for value in list(args) + list(kwargs.values()))
+        key = None
+        if has_page:
+            try:
+                parts = [key_part(arg) for arg in args]
+                parts += [(name, key_part(value)) for name, value in sorted(kwargs.items())]
+                key = (parse.__qualname__, tuple(parts))
+            except (KeyError, TypeError):
+                key = None
+        if key is None:
+            return parse(*args, **kwargs)
+
+        with _memo_lock:
+            result = _parsed_results.get(key)
+            if result is not None:
+                _parsed_results.move_to_end(key)
+        if result is not None:
+            return _copy_parse_result(result)
+
+        result = parse(*args, **kwargs)
+        with _memo_lock:
+            _parsed_results[key] = result
+            while len(_parsed_results) > _MAX_PARSED_RESULTS:
+                _parsed_results.popitem(last=False)
+        return _copy_parse_result(result)
+    return wrapper
@@ -13,23 +13,16 @@ import unicodedata
 import time
 import os
 
-# Use the same session pattern as the main scraper
-_session = requests.Session()
-_session.headers.update({
-    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/146.0.0.0 Safari/537.36',
-    'Origin': 'https://www.nhl.com',
-    'Referer': 'https://www.nhl.com/',
-    'Accept': '*/*',
-    'Accept-Language': 'en-US,en;q=0.9',
-    'sec-ch-ua': '"Chromium";v="146", "Not-A.Brand";v="24", "Google Chrome";v="146"',
-    'sec-ch-ua-mobile': '?0',
-    'sec-ch-ua-platform': '"macOS"',
-    'sec-fetch-dest': 'empty',
-    'sec-fetch-mode': 'cors',
-    'sec-fetch-site': 'cross-site',
-})
-
-from TopDownHockey_Scraper.name_corrections import NAME_CORRECTIONS, normalize_player_name
+from TopDownHockey_Scraper.http_client import get_http_client
+
+# Share the main scraper's pooled HTTP client
+_http_client = get_http_client()
+_session = _http_client.session
+
+from TopDownHockey_Scraper.name_corrections import NAME_CORRECTIONS, normalize_player_name, normalize_player_names
+from TopDownHockey_Scraper.response_cache import reuse_unchanged_parse
+from TopDownHockey_Scraper.documents import page_json
+from TopDownHockey_Scraper.json_backend import response_json
 
 # Load packaged handedness data
 _handedness_dict = {}
@@ -72,9 +65,9 @@ def _get_handedness_from_api(player_id):
 
     try:
         url = f"https://api-web.nhle.com/v1/player/{player_id_str}/landing"
-        response = _session.get(url, timeout=10)
+        response = _http_client.get(url, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         handedness = data.get('shootsCatches')
         _handedness_api_cache[player_id_str] = handedness
         return handedness
@@ -90,6 +83,28 @@ def _get_player_name(player_id, player_mapping_dict):
     player_id_str = str(int(player_id)) if pd.notna(player_id) else None
     return player_mapping_dict.get(player_id_str, None)
 
+def _period_seconds(time_in_period):
+    """Seconds into the period from an "MM:SS" string, or 0 if it is missing or malformed"""
+    if time_in_period:
+        try:
+            time_parts = time_in_period.split(':')
+            return int(time_parts[0]) * 60 + int(time_parts[1])
+        except (ValueError, IndexError):
+            return 0
+    return 0
+
+def _map_unique(values, func):
+    """Apply func once per distinct value (missing values included) and spread the results back out"""
+    values = np.asarray(values, dtype=object)
+    codes, uniques = pd.factorize(values)
+    # Missing values get code -1, i.e. the last slot, computed from the original missing value (None stays None)
+    results = np.empty(len(uniques) + 1, dtype=object)
+    results[:-1] = [func(value) for value in uniques]
+    missing = codes == -1
+    if missing.any():
+        results[-1] = func(values[missing.argmax()])
+    return results[codes]
+
 def _map_event_type(type_desc_key, type_code=None):
     """Map NHL API event types to ESPN-style event codes"""
     # NHL API uses typeDescKey for event descriptions
@@ -192,6 +207,7 @@ def _extract_player_id_from_event(event_details, event_type):
     
     return None
 
+@reuse_unchanged_parse
 def scrape_api_events(game_id, drop_description=True, shift_to_espn=False, verbose=False, api_response=None):
     """
     Scrape event coordinates and data from NHL API play-by-play endpoint.
@@ -243,7 +259,8 @@ def scrape_api_events(game_id, drop_description=True, shift_to_espn=False, verbo
         
         # TIME: JSON parsing
         parse_start = time.time()
-        api_data = json.loads(response.content)
+        # Shared with full_scrape_1by1's roster spots lookup, so the JSON is decoded once per game
+        api_data = page_json(response)
         player_mapping_df = pd.DataFrame(api_data['rosterSpots'])
         player_mapping_df = player_mapping_df.assign(player = (player_mapping_df['firstName'].apply(lambda x: x['default']) + ' ' + player_mapping_df['lastName'].apply(lambda x: x['default'])).str.upper(),
                       link = 'https://assets.nhle.com/mugs/nhl/latest/' + player_mapping_df['playerId'].astype(str) + '.png',
@@ -284,45 +301,21 @@ def scrape_api_events(game_id, drop_description=True, shift_to_espn=False, verbo
             columns.append('description')
         return pd.DataFrame(columns=columns)
 
-    # Parse plays into list of dictionaries
-    events_list = []
+    # OPTIMIZED: One pass over the plays pulls every field into its own column; times, names and
+    # handedness are then resolved once per distinct value instead of once per event
+    columns = {name: [] for name in ('coords_x', 'coords_y', 'event', 'period', 'description',
+                                     'time_in_period', 'player_id', 'goalie_id', 'miss_reason')}
+    event_codes = {}
     
     for play in plays:
-        # Extract period information
-        period_desc = play.get('periodDescriptor', {})
-        period = period_desc.get('number', 1)
-        
-        # Extract time information
-        time_in_period = play.get('timeInPeriod', '')
-        time_remaining = play.get('timeRemaining', '')
-        
-        # Parse time string (format: "MM:SS")
-        if time_in_period:
-            try:
-                time_parts = time_in_period.split(':')
-                minutes = int(time_parts[0])
-                seconds = int(time_parts[1])
-            except (ValueError, IndexError):
-                minutes, seconds = 0, 0
-        else:
-            minutes, seconds = 0, 0
-        
-        # Calculate game_seconds — per-event time, consistent across all periods.
-        # The HTML flow in TopDownHockey_NHL_Scraper computes (period-1)*1200 + period_seconds
-        # for every period, so the API side must match for fix_missing's timing-based
-        # merge to recover coords. In playoffs, period 5+ is 2OT/3OT/... and each event
-        # has distinct timing; hardcoding 3900 here broke coord recovery for multi-OT games.
-        game_seconds = ((period - 1) * 1200) + (minutes * 60) + seconds
-        
-        # Extract event type
-        event_type_code = play.get('typeCode')
-        event_type_desc = play.get('typeDescKey', '')
+        details = play.get('details', {})
         
-        # Map to ESPN-style event code
-        event_code = _map_event_type(event_type_desc, event_type_code)
+        # Map to ESPN-style event code, once per distinct event type
+        event_type = (play.get('typeDescKey', ''), play.get('typeCode'))
+        event_code = event_codes.get(event_type)
+        if event_code is None:
+            event_code = event_codes[event_type] = _map_event_type(*event_type)
         
-        # Extract coordinates from details
-        details = play.get('details', {})
         coords_x = details.get('xCoord')
         coords_y = details.get('yCoord')
         
@@ -335,73 +328,78 @@ def scrape_api_events(game_id, drop_description=True, shift_to_espn=False, verbo
             coords_x = coords_x if coords_x is not None else 0
             coords_y = coords_y if coords_y is not None else 0
         
-        # Extract player ID and map to name
-        player_id = _extract_player_id_from_event(details, event_code)
-        player_name = _get_player_name(player_id, player_mapping_dict) if player_id else None
-        
-        # Extract goalie ID and map to name
-        goalie_id = details.get('goalieInNetId')
-        goalie_name = _get_player_name(goalie_id, player_mapping_dict) if goalie_id else None
-
-        # Extract miss reason (only present for missed shots)
-        miss_reason = details.get('reason')
-
         # Extract description
         description = play.get('description', {})
         if isinstance(description, dict):
             description = description.get('default', '')
-        description = str(description) if description else ''
         
-        # Only include events with coordinates (matching ESPN behavior)
-        # For faceoffs, allow missing player names (they'll be handled in merge)
-        if coords_x is not None and coords_y is not None:
-            
-            events_list.append({
-                'coords_x': int(coords_x),
-                'coords_y': int(coords_y),
-                'event_player_1': player_name,
-                'event': event_code,
-                'game_seconds': game_seconds,
-                'period': period,
-                'description': description,
-                'time_in_period': time_in_period,
-                'player_id': player_id,
-                'goalie_id': goalie_id,
-                'goalie_name': goalie_name,
-                'miss_reason': miss_reason,
-            })
+        columns['coords_x'].append(int(coords_x))
+        columns['coords_y'].append(int(coords_y))
+        columns['event'].append(event_code)
+        columns['period'].append(play.get('periodDescriptor', {}).get('number', 1))
+        columns['description'].append(str(description) if description else '')
+        columns['time_in_period'].append(play.get('timeInPeriod', ''))
+        columns['player_id'].append(_extract_player_id_from_event(details, event_code))
+        columns['goalie_id'].append(details.get('goalieInNetId'))
+        # Extract miss reason (only present for missed shots)
+        columns['miss_reason'].append(details.get('reason'))
     
-    if not events_list:
+    if not columns['event']:
         # Return empty DataFrame with correct columns
         columns = ['coords_x', 'coords_y', 'event_player_1', 'event', 'game_seconds', 'period', 'version', 'goalie_id', 'goalie_name', 'miss_reason', 'shooter_handedness']
         if not drop_description:
             columns.append('description')
         return pd.DataFrame(columns=columns)
 
-    # Convert to DataFrame
-    events_df = pd.DataFrame(events_list)
+    # Calculate game_seconds — per-event time, consistent across all periods.
+    # The HTML flow in TopDownHockey_NHL_Scraper computes (period-1)*1200 + period_seconds
+    # for every period, so the API side must match for fix_missing's timing-based
+    # merge to recover coords. In playoffs, period 5+ is 2OT/3OT/... and each event
+    # has distinct timing; hardcoding 3900 here broke coord recovery for multi-OT games.
+    period_seconds = _map_unique(columns['time_in_period'], _period_seconds)
+    game_seconds = (np.asarray(columns['period']) - 1) * 1200 + period_seconds.astype(np.int64)
+
+    # Map player and goalie IDs to names, once per distinct ID
+    get_name = lambda player_id: _get_player_name(player_id, player_mapping_dict) if player_id else None
+    
+    events_df = pd.DataFrame({
+        'coords_x': columns['coords_x'],
+        'coords_y': columns['coords_y'],
+        'event_player_1': _map_unique(columns['player_id'], get_name),
+        'event': columns['event'],
+        'game_seconds': game_seconds,
+        'period': columns['period'],
+        'description': columns['description'],
+        'time_in_period': columns['time_in_period'],
+        'player_id': columns['player_id'],
+        'goalie_id': columns['goalie_id'],
+        'goalie_name': _map_unique(columns['goalie_id'], get_name),
+        'miss_reason': columns['miss_reason'],
+    })
     
     # Filter out events without player names (matching ESPN behavior)
     # ESPN filters: events must have coords AND player names
     events_df = events_df[events_df['event_player_1'].notna()]
     
     # Normalize player names
-    events_df['event_player_1'] = events_df['event_player_1'].apply(normalize_player_name)
-    events_df['goalie_name'] = events_df['goalie_name'].apply(normalize_player_name)
+    events_df['event_player_1'] = normalize_player_names(events_df['event_player_1'])
+    events_df['goalie_name'] = normalize_player_names(events_df['goalie_name'])
     
     # Filter again after normalization (in case normalization resulted in empty strings)
     events_df = events_df[events_df['event_player_1'] != '']
 
     # Add shooter handedness from packaged data, with API fallback for unknowns
-    def get_handedness(row):
+    def get_handedness(player_id, player_name):
         # Try packaged data first (fast)
-        player_name = row['event_player_1']
         if player_name in _handedness_dict:
             return _handedness_dict[player_name]
         # Fall back to NHL API for unknown players (slow, but cached)
-        return _get_handedness_from_api(row.get('player_id'))
+        return _get_handedness_from_api(player_id)
 
-    events_df['shooter_handedness'] = events_df.apply(get_handedness, axis=1)
+    # A player's name follows from their ID, so handedness is looked up once per shooter
+    shooters = events_df.drop_duplicates('player_id')
+    handedness = dict(zip(shooters['player_id'], map(get_handedness, shooters['player_id'], shooters['event_player_1'])))
+    events_df['shooter_handedness'] = _map_unique(events_df['player_id'], handedness.get)
 
     # Calculate priority for sorting (matching ESPN function)
     events_df['priority'] = np.where(
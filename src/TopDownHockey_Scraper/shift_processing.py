@@ -11,14 +11,14 @@ from bs4 import BeautifulSoup
 import re
 from datetime import datetime
 
-from TopDownHockey_Scraper.name_corrections import normalize_player_name
+from TopDownHockey_Scraper.name_corrections import normalize_player_names
 
 # Import helper functions from the main scraper module
 from TopDownHockey_Scraper.TopDownHockey_NHL_Scraper import (
     convert_clock_to_seconds,
     convert_seconds_to_clock,
     subtract_from_twenty_minutes,
-    _session,
+    _http_get,
     _CAPTAIN_A_PATTERN,
     _CAPTAIN_C_PATTERN,
     _log_exception_with_dataframe,
@@ -359,7 +359,7 @@ def _apply_name_normalization(all_shifts):
         .str.replace('CHRISTOPHER ', 'CHRIS ', regex=False))
 
     all_shifts['name'] = all_shifts['name'].str.normalize('NFKD').str.encode('ascii', errors='ignore').str.decode('utf-8').str.upper()
-    all_shifts['name'] = all_shifts['name'].apply(lambda x: normalize_player_name(x))
+    all_shifts['name'] = normalize_player_names(all_shifts['name'])
 
     all_shifts['name'] = all_shifts['name'].apply(lambda x: re.sub(r' \(A\)$', '', x).strip())
     all_shifts['name'] = all_shifts['name'].apply(lambda x: re.sub(r' \(C\)$', '', x).strip())
@@ -491,11 +491,11 @@ def scrape_html_shifts(season, game_id, live=True, home_page=None, away_page=Non
     # Fetch pages if not provided
     if home_page is None:
         url = 'http://www.nhl.com/scores/htmlreports/' + season + '/TH0' + game_id + '.HTM'
-        home_page = _session.get(url, timeout=10)
+        home_page = _http_get(url, timeout=10)
 
     if away_page is None:
         url = 'http://www.nhl.com/scores/htmlreports/' + season + '/TV0' + game_id + '.HTM'
-        away_page = _session.get(url, timeout=10)
+        away_page = _http_get(url, timeout=10)
 
     # Parse HTML
     if type(home_page) == str:
@@ -15,14 +15,15 @@ import re
 import time
 from datetime import datetime
 
-from TopDownHockey_Scraper.name_corrections import normalize_player_name
+from TopDownHockey_Scraper.name_corrections import normalize_player_names
+from TopDownHockey_Scraper.json_backend import response_json
 
 # Import helper functions from the main scraper module
 from TopDownHockey_Scraper.TopDownHockey_NHL_Scraper import (
     convert_clock_to_seconds,
     convert_seconds_to_clock,
     subtract_from_twenty_minutes,
-    _session,
+    _http_get,
     _log_exception_with_dataframe,
 )
 
@@ -45,14 +46,14 @@ def _fetch_shifts_from_api(full_game_id, verbose=False):
     url = f'{_SHIFTS_API_URL}?cayenneExp=gameId={full_game_id}'
 
     start = time.time()
-    response = _session.get(url, timeout=30)
+    response = _http_get(url, timeout=30)
     response.raise_for_status()
     duration = time.time() - start
 
     if verbose:
         print(f'  API shifts fetch: {duration:.2f}s')
 
-    data = response.json()
+    data = response_json(response)
     return data.get('data', [])
 
 
@@ -177,7 +178,7 @@ def _apply_name_normalization(all_shifts):
         .str.replace('CHRISTOPHER ', 'CHRIS ', regex=False))
 
     all_shifts['name'] = all_shifts['name'].str.normalize('NFKD').str.encode('ascii', errors='ignore').str.decode('utf-8').str.upper()
-    all_shifts['name'] = all_shifts['name'].apply(lambda x: normalize_player_name(x))
+    all_shifts['name'] = normalize_player_names(all_shifts['name'])
 
     all_shifts['name'] = all_shifts['name'].apply(lambda x: re.sub(r' \(A\)$', '', x).strip())
     all_shifts['name'] = all_shifts['name'].apply(lambda x: re.sub(r' \(C\)$', '', x).strip())
@@ -0,0 +1,141 @@
+"""
+Tests for the adaptive per-host concurrency limits and latency-based timeouts.
+These run offline; requests are simulated by acquiring and releasing slots.
+"""
+import threading
+import time
+import requests
+from TopDownHockey_Scraper.adaptive_concurrency import AimdLimit, AdaptiveController, endpoint_key
+
+
+URL = 'http://www.nhl.com/scores/htmlreports/20242025/PL020333.HTM'
+
+
+def make_response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+class TestAimdLimit:
+    """Tests for one host's AIMD limit."""
+
+    def test_burst_of_failures_decreases_once(self):
+        """Test that failures of requests sent together count as one congestion event."""
+        limit = AimdLimit(initial=16)
+        started = time.monotonic()
+        for _ in range(16):
+            limit.acquire()
+        for _ in range(16):
+            limit.release(False, started=started)
+        assert limit.limit == 8
+
+    def test_failure_after_a_decrease_decreases_again(self):
+        """Test that a request sent after the last decrease can decrease the limit again."""
+        limit = AimdLimit(initial=16)
+        limit.acquire()
+        limit.release(False, started=time.monotonic())
+        limit.acquire()
+        limit.release(False, started=time.monotonic())
+        assert limit.limit == 4
+
+    def test_limit_stays_within_bounds(self):
+        """Test that the limit never drops below its minimum or grows past its maximum."""
+        limit = AimdLimit(initial=2, minimum=1, maximum=3)
+        for _ in range(5):
+            limit.acquire()
+            limit.release(False)
+        assert limit.limit == 1
+        for _ in range(50):
+            slots = int(limit.limit)
+            for _ in range(slots):
+                limit.acquire()
+            for _ in range(slots):
+                limit.release(True)
+        assert limit.limit == 3
+
+    def test_grows_only_while_saturated(self):
+        """Test that successes raise the limit only when requests were held at it."""
+        limit = AimdLimit(initial=4)
+        for _ in range(20):
+            limit.acquire()
+            limit.release(True)
+        assert limit.limit == 4
+        for _ in range(4):
+            limit.acquire()
+        limit.release(True)
+        assert limit.limit == 4.25
+
+    def test_acquire_waits_for_a_free_slot(self):
+        """Test that a request over the limit waits until another one finishes."""
+        limit = AimdLimit(initial=1)
+        limit.acquire()
+        acquired = threading.Event()
+        waiter = threading.Thread(target=lambda: (limit.acquire(), acquired.set()))
+        waiter.start()
+        assert not acquired.wait(0.1)
+        limit.release(True)
+        assert acquired.wait(1)
+        waiter.join()
+        assert limit.in_flight == 1
+
+
+class TestAdaptiveController:
+    """Tests for the per-host limits and per-endpoint timeouts together."""
+
+    def test_endpoint_key_masks_ids(self):
+        """Test that reports for different games share one endpoint."""
+        assert endpoint_key(URL) == endpoint_key(URL.replace('020333', '020334'))
+        assert endpoint_key(URL) != endpoint_key('https://api-web.nhle.com/v1/gamecenter/2024020333/play-by-play')
+
+    def test_timeout_uses_fallback_until_enough_samples(self):
+        """Test that the call site's timeout applies until the endpoint has enough samples."""
+        controller = AdaptiveController(min_samples=20, multiplier=3.0, min_timeout=2.0, max_timeout=60.0)
+        for _ in range(19):
+            controller.release(URL, controller.acquire(URL), 1.0, response=make_response(200))
+        assert controller.timeout(URL, 10) == 10
+        controller.release(URL, controller.acquire(URL), 1.0, response=make_response(200))
+        assert controller.timeout(URL, 10) == 3.0
+
+    def test_timeout_is_clamped(self):
+        """Test that derived timeouts stay within the configured bounds."""
+        controller = AdaptiveController(min_samples=1, min_timeout=2.0, max_timeout=60.0)
+        controller.release(URL, controller.acquire(URL), 0.01, response=make_response(200))
+        assert controller.timeout(URL, 10) == 2.0
+        controller = AdaptiveController(min_samples=1, min_timeout=2.0, max_timeout=60.0)
+        controller.release(URL, controller.acquire(URL), 100.0, response=make_response(200))
+        assert controller.timeout(URL, 10) == 60.0
+
+    def test_throttling_backs_off_without_recording_latency(self):
+        """Test that 429s, 5xx and exceptions shrink the host's limit and aren't used for timeouts."""
+        controller = AdaptiveController(initial_limit=8, min_samples=1)
+        host = 'www.nhl.com'
+        controller.release(URL, controller.acquire(URL), 0.0, response=make_response(429))
+        assert controller.stats()[host] == 4
+        controller.release(URL, controller.acquire(URL), 0.0, error=requests.ConnectionError())
+        assert controller.stats()[host] == 2
+        assert controller.timeout(URL, 10) == 10
+
+    def test_concurrent_throttling_backs_off_once(self):
+        """Test that a burst of throttled responses to requests in flight together halves the limit once."""
+        controller = AdaptiveController(initial_limit=8)
+        slots = [controller.acquire(URL) for _ in range(6)]
+        time.sleep(0.01)
+        for slot in slots:
+            controller.release(URL, slot, 0.005, response=make_response(503))
+        assert controller.stats()['www.nhl.com'] == 4
+
+
+class TestAutoPrefetch:
+    """Tests for sizing full_scrape's prefetch depth from the controller."""
+
+    def test_depth_follows_the_html_host_limit(self, monkeypatch):
+        """Test that prefetch='auto' keeps slightly more pages in flight than the current limit."""
+        from TopDownHockey_Scraper import TopDownHockey_NHL_Scraper as scraper
+        controller = AdaptiveController(initial_limit=6)
+        monkeypatch.setattr(scraper._http_client, 'adaptive', controller)
+        assert scraper._adaptive_prefetch_depth(include_api=False) == 2
+        controller._host_limit(URL).limit = 24
+        assert scraper._adaptive_prefetch_depth(include_api=False) == 5
+        monkeypatch.setattr(scraper._http_client, 'adaptive', None)
+        assert scraper._adaptive_prefetch_depth() == 1
@@ -0,0 +1,237 @@
+"""
+Tests for the asyncio scraping API, run against a local stub HTTP server.
+"""
+import asyncio
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+from TopDownHockey_Scraper import async_scraper
+
+
+GAME_ID = 2024020333
+
+
+async def start_stub_server(handler):
+    """Serve every path with `handler` on a free local port."""
+    app = web.Application()
+    app.router.add_get('/{path:.*}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f'http://127.0.0.1:{port}'
+
+
+class TestAsyncScraper:
+    """Tests for afetch_all_pages and afull_scrape."""
+
+    @pytest.fixture
+    def stub_urls(self, monkeypatch):
+        """Point the game page URLs at the stub server."""
+        def use_base(base):
+            def game_page_urls(season, game_id, include_api=True):
+                keys = ['events', 'roster', 'home_shifts', 'away_shifts', 'summary'] + (['api'] if include_api else [])
+                return {key: f'{base}/{season}/{key}/{game_id}' for key in keys}
+            monkeypatch.setattr(async_scraper, '_game_page_urls', game_page_urls)
+        return use_base
+
+    def test_fetches_every_page_concurrently(self, stub_urls):
+        """Test that all six pages come back as Responses and are requested concurrently."""
+        in_flight = {'now': 0, 'peak': 0}
+
+        async def handler(request):
+            in_flight['now'] += 1
+            in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+            await asyncio.sleep(0.05)
+            in_flight['now'] -= 1
+            # No charset, like the NHL's reports, so requests' ISO-8859-1 default applies
+            return web.Response(body=request.path.encode(), content_type='text/html')
+
+        async def run():
+            runner, base = await start_stub_server(handler)
+            stub_urls(base)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    return await async_scraper.afetch_all_pages(session, '20242025', GAME_ID)
+            finally:
+                await runner.cleanup()
+
+        pages = asyncio.run(run())
+        assert set(pages) == {'events', 'roster', 'home_shifts', 'away_shifts', 'summary', 'api'}
+        assert pages['events'].text == f'/20242025/events/{GAME_ID}'
+        assert pages['events'].encoding == 'ISO-8859-1'
+        assert in_flight['peak'] == 6
+
+    def test_hands_fetched_pages_to_the_parser(self, stub_urls, monkeypatch):
+        """Test that afull_scrape parses each game from the pages it fetched."""
+        import pandas as pd
+        parsed = {}
+
+        def fake_full_scrape_1by1(game_id_list, live, shift_to_espn=True, return_intermediates=False,
+                                  verbose=False, pages_by_game=None):
+            game_id = game_id_list[0]
+            parsed[game_id] = pages_by_game[game_id]['roster'].text
+            return pd.DataFrame({'game_id': [game_id], 'event_player_1': ['X'], 'event_player_2': ['Y'],
+                                 'event_player_3': ['Z'], 'event_type': ['SHOT'], 'event_description': ['']})
+
+        monkeypatch.setattr(async_scraper, 'full_scrape_1by1', fake_full_scrape_1by1)
+
+        async def handler(request):
+            return web.Response(text=request.path, content_type='text/html')
+
+        async def run():
+            runner, base = await start_stub_server(handler)
+            stub_urls(base)
+            try:
+                return await async_scraper.afull_scrape([GAME_ID, GAME_ID + 1], concurrency=12)
+            finally:
+                await runner.cleanup()
+
+        df = asyncio.run(run())
+        assert list(df.game_id) == [GAME_ID, GAME_ID + 1]
+        assert parsed[GAME_ID + 1] == f'/20242025/roster/{GAME_ID + 1}'
+
+    def test_only_transient_errors_are_retried(self):
+        """Test that a 404 fails at once while a 503 is retried."""
+        hits = {}
+
+        async def handler(request):
+            hits[request.path] = hits.get(request.path, 0) + 1
+            if request.path == '/missing':
+                return web.Response(status=404)
+            if hits[request.path] == 1:
+                return web.Response(status=503)
+            return web.Response(text='ok', content_type='text/html')
+
+        async def run():
+            runner, base = await start_stub_server(handler)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    with pytest.raises(async_scraper.requests.HTTPError):
+                        await async_scraper._afetch_url(session, base + '/missing', 5, base_delay=0)
+                    return await async_scraper._afetch_url(session, base + '/busy', 5, base_delay=0)
+            finally:
+                await runner.cleanup()
+
+        assert asyncio.run(run()).text == 'ok'
+        assert hits == {'/missing': 1, '/busy': 2}
+
+    def test_unchanged_page_is_fetched_conditionally(self):
+        """Test that a 304 hands back the previous response."""
+        seen = []
+
+        async def handler(request):
+            seen.append(request.headers.get('If-None-Match'))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return web.Response(status=304)
+            return web.Response(text='v1', content_type='text/html', headers={'ETag': '"v1"'})
+
+        async def run():
+            runner, base = await start_stub_server(handler)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    first = await async_scraper._afetch_url(session, base + '/live', 5)
+                    second = await async_scraper._afetch_url(session, base + '/live', 5)
+                    return first, second
+            finally:
+                await runner.cleanup()
+
+        first, second = asyncio.run(run())
+        assert second is first
+        assert seen == [None, '"v1"']
+
+    def test_game_with_missing_page_is_not_retried(self, stub_urls, monkeypatch):
+        """Test that a game whose page is a 404 is skipped, not scraped again at the end."""
+        import pandas as pd
+        parsed = []
+
+        def fake_full_scrape_1by1(game_id_list, live, shift_to_espn=True, return_intermediates=False,
+                                  verbose=False, pages_by_game=None):
+            parsed.append(game_id_list[0])
+            return pd.DataFrame({'game_id': game_id_list, 'event_player_1': ['X'], 'event_player_2': ['Y'],
+                                 'event_player_3': ['Z'], 'event_type': ['SHOT'], 'event_description': ['']})
+
+        monkeypatch.setattr(async_scraper, 'full_scrape_1by1', fake_full_scrape_1by1)
+
+        async def handler(request):
+            if request.path.endswith(str(GAME_ID + 1)):
+                return web.Response(status=404)
+            return web.Response(text=request.path, content_type='text/html')
+
+        async def run():
+            runner, base = await start_stub_server(handler)
+            stub_urls(base)
+            try:
+                return await async_scraper.afull_scrape([GAME_ID, GAME_ID + 1], concurrency=12)
+            finally:
+                await runner.cleanup()
+
+        df = asyncio.run(run())
+        assert list(df.game_id) == [GAME_ID]
+        assert parsed == [GAME_ID]
+
+    def test_per_host_limit_caps_downloads(self, stub_urls, monkeypatch):
+        """Test that the shared client's per_host_limit applies to the async downloads too."""
+        import pandas as pd
+        in_flight = {'now': 0, 'peak': 0}
+
+        async def handler(request):
+            in_flight['now'] += 1
+            in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+            await asyncio.sleep(0.02)
+            in_flight['now'] -= 1
+            return web.Response(text=request.path, content_type='text/html')
+
+        def fake_full_scrape_1by1(game_id_list, live, shift_to_espn=True, return_intermediates=False,
+                                  verbose=False, pages_by_game=None):
+            return pd.DataFrame()
+
+        monkeypatch.setattr(async_scraper, 'full_scrape_1by1', fake_full_scrape_1by1)
+        monkeypatch.setattr(async_scraper._http_client, 'per_host_limit', 2)
+
+        async def run():
+            runner, base = await start_stub_server(handler)
+            stub_urls(base)
+            try:
+                return await async_scraper.afull_scrape([GAME_ID, GAME_ID + 1], concurrency=12)
+            finally:
+                await runner.cleanup()
+
+        asyncio.run(run())
+        assert in_flight['peak'] == 2
+
+    def test_adaptive_slot_is_always_given_back(self, monkeypatch):
+        """Test that a failed conversion or a cancelled wait never leaks an adaptive slot."""
+        from TopDownHockey_Scraper.adaptive_concurrency import AdaptiveController
+        controller = AdaptiveController(initial_limit=1)
+        monkeypatch.setattr(async_scraper._http_client, 'adaptive', controller)
+
+        def broken_response(url, aio_response, content):
+            raise UnicodeDecodeError('utf-8', b'', 0, 1, 'bad')
+
+        async def handler(request):
+            return web.Response(text='ok', content_type='text/html')
+
+        async def run():
+            runner, base = await start_stub_server(handler)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    with monkeypatch.context() as patch:
+                        patch.setattr(async_scraper, '_to_response', broken_response)
+                        with pytest.raises(UnicodeDecodeError):
+                            await async_scraper._aget(session, base + '/page', 5)
+                    held = controller.acquire(base + '/page')
+                    waiting = asyncio.create_task(async_scraper._aget(session, base + '/page', 5))
+                    await asyncio.sleep(0.05)
+                    waiting.cancel()
+                    with pytest.raises(asyncio.CancelledError):
+                        await waiting
+                    held.release(True)
+                    return await async_scraper._aget(session, base + '/page', 5)
+            finally:
+                await runner.cleanup()
+
+        assert asyncio.run(run()).text == 'ok'
+        assert [limit.in_flight for limit in controller._limits.values()] == [0]
@@ -0,0 +1,74 @@
+"""
+Tests for decoding the ESPN and NHL API event feeds.
+These run offline against saved payloads in tests/fixtures; the expected frames are what the
+decoders produced before they were optimized.
+"""
+import os
+import pandas as pd
+import requests
+from TopDownHockey_Scraper import TopDownHockey_NHL_Scraper as scraper
+from TopDownHockey_Scraper import scrape_nhl_api_events as api_events
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def fixture_response(name):
+    response = requests.Response()
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        response._content = f.read()
+    response.status_code = 200
+    return response
+
+
+class TestEspnEvents:
+    """Tests for scrape_espn_events."""
+
+    def test_brackets_inside_strings(self, monkeypatch):
+        """Test that ] and } inside play text don't end the embedded arrays early."""
+        page = fixture_response('espn_playbyplay.html')
+        monkeypatch.setattr(scraper, '_http_get', lambda url, **kwargs: page)
+        events = scraper.scrape_espn_events(401, drop_description=False)
+        # The play with no clock is dropped, and so is its coordinate entry
+        expected = pd.DataFrame({
+            'coords_x': [0, -60, 80, 95],
+            'coords_y': [0, 12, -3, 40],
+            'event_player_1': ['ELIAS PETTERSSON', 'ALEX OVECHKIN', 'TIM STUTZLE', 'J.T. MILLER'],
+            'event': ['FAC', 'SHOT', 'GOAL', 'HIT'],
+            'game_seconds': [0, 25, 1270, 2399],
+            'description': ['Elias Pettersson won faceoff [VAN] vs {EDM}', 'Shot on goal by Alexander Ovechkin ]}',
+                            'Goal by Tim Stutzle [PPG] {assists: none}', 'Hit {boards}'],
+            'period': [1, 1, 2, 2],
+            'version': [0, 0, 0, 0],
+            'espn_id': [401, 401, 401, 401]})
+        pd.testing.assert_frame_equal(events, expected)
+
+
+class TestApiEvents:
+    """Tests for scrape_api_events."""
+
+    def test_sparse_plays(self, monkeypatch):
+        """Test game_seconds, goalies and handedness for plays with missing details, goalies and clocks."""
+        # 8499991 isn't in the packaged handedness data, so it's the only player looked up online
+        lookups = []
+        monkeypatch.setattr(api_events, '_get_handedness_from_api', lambda player_id: lookups.append(player_id) or 'R')
+        events = api_events.scrape_api_events.__wrapped__(2024030333, api_response=fixture_response('api_playbyplay.json'))
+        # The faceoff with no details has no player and is dropped; the shot with no clock is at the period start
+        expected = pd.DataFrame({
+            'coords_x': [0, -60, 70, -75, -50, 95, 40, 10, -20, 30, 74],
+            'coords_y': [0, 12, -5, 3, 20, 40, 2, 10, 0, -8, 1],
+            'event_player_1': ['CONNOR MCDAVID', 'CONNOR MCDAVID', 'ELIAS PETTERSSON(D)', 'ROOKIE WINGER', 'ROOKIE WINGER', 'QUINN HUGHES',
+                               'ELIAS PETTERSSON', 'LEON DRAISAITL', 'CONNOR MCDAVID', 'ELIAS PETTERSSON(D)', 'ELIAS PETTERSSON'],
+            'event': ['FAC', 'SHOT', 'MISS', 'BLOCK', 'SHOT', 'HIT', 'SHOT', 'SHOT', 'GOAL', 'SHOT', 'GOAL'],
+            'game_seconds': [0, 25, 330, 1605, 1620, 1622, 2399, 2400, 3520, 3735, 4800],
+            'period': [1, 1, 1, 2, 2, 2, 2, 3, 3, 4, 5],
+            'version': [0] * 11,
+            'goalie_id': [None, 8477967, 8475683, None, 8477967, None, 8475683, None, None, 8475683, 8475683],
+            'goalie_name': [None, 'THATCHER DEMKO', 'STUART SKINNER', None, 'THATCHER DEMKO', None, 'STUART SKINNER', None, None,
+                            'STUART SKINNER', 'STUART SKINNER'],
+            'miss_reason': [None, None, 'wide-of-net', None, None, None, None, None, None, None, None],
+            'shooter_handedness': ['L', 'L', 'L', 'R', 'R', 'L', 'L', 'L', 'L', 'L', 'L'],
+            'player_id': [8478402, 8478402, 8483678, 8499991, 8499991, 8480800, 8480012, 8477934, 8478402, 8483678, 8480012]})
+        expected = expected.astype({'goalie_id': float, 'player_id': float})
+        pd.testing.assert_frame_equal(events, expected)
+        assert lookups == [8499991]
@@ -0,0 +1,46 @@
+"""
+Tests for parsing the NHL HTML reports.
+These run offline against the saved pages of one small game in tests/fixtures, and compare
+with the frames the parsers produced before they were optimized.
+"""
+import os
+import pandas as pd
+from TopDownHockey_Scraper import TopDownHockey_NHL_Scraper as scraper
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures', '2024020333')
+
+
+def read_page(report):
+    with open(os.path.join(FIXTURES, f'{report}020333.HTM'), encoding='utf-8') as f:
+        return f.read()
+
+
+def expected(name):
+    return pd.read_pickle(os.path.join(FIXTURES, f'{name}.pkl'))
+
+
+class TestHtmlReports:
+    """Tests for the PL, RO, TH, TV and GS report parsers."""
+
+    def test_play_by_play_and_roster(self):
+        """Test that the PL and RO pages give the same events and roster as the old parser."""
+        # The PL page has a repeated header row, a penalty with Drawn By, and on-ice cells with five skaters
+        events, roster = scraper.scrape_html_events.__wrapped__('20242025', '020333', read_page('PL'), read_page('RO'))
+        pd.testing.assert_frame_equal(events, expected('events'))
+        pd.testing.assert_frame_equal(roster, expected('roster'))
+
+    def test_shift_reports(self):
+        """Test that the TH, TV and GS pages give the same shift changes as the old parser."""
+        # The away goalie is pulled at 19:00, so his goaltender summary row shows 19:00 of TOI
+        shifts = scraper.scrape_html_shifts.__wrapped__('20242025', '020333', False, home_page=read_page('TH'), away_page=read_page('TV'),
+                                                        summary=read_page('GS'), roster_cache=expected('roster'))
+        pd.testing.assert_frame_equal(shifts, expected('shifts'))
+
+    def test_merge_and_prepare(self):
+        """Test that merging the saved events, shifts and roster gives the same game as the old merge_and_prepare."""
+        # The fixture game has a CHANGE at the same second as a play both before and after it, an HTML
+        # on-ice cell that disagrees with the shifts, an empty net from 19:00, and jerseys 8 and 10 on one line
+        events = expected('events').assign(game_id = 2024020333)
+        game = scraper.merge_and_prepare(events, expected('shifts'), expected('roster'))
+        pd.testing.assert_frame_equal(game, expected('merged'))
@@ -0,0 +1,49 @@
+"""
+Tests for the shared HTTP client.
+These run offline; the session's network call is replaced by a stub.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from TopDownHockey_Scraper.http_client import HttpClient
+from TopDownHockey_Scraper import TopDownHockey_EliteProspects_Scraper as elite_prospects
+
+
+class TestHttpClient:
+    """Tests for HttpClient and the headers each scraper sends through it."""
+
+    def test_config_round_trips(self):
+        """Test that config() rebuilds an identical client, as worker processes do."""
+        client = HttpClient(pool_maxsize=40, timeout=15, per_host_limit=4)
+        copy = HttpClient()
+        copy.configure(**client.config())
+        assert copy.config() == client.config()
+
+    def test_per_host_limit_caps_concurrency(self):
+        """Test that requests to one host never exceed the per-host limit."""
+        client = HttpClient(per_host_limit=2)
+        in_flight = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def fake_get(url, **kwargs):
+            with lock:
+                in_flight['now'] += 1
+                in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+            time.sleep(0.02)
+            with lock:
+                in_flight['now'] -= 1
+            return requests.Response()
+
+        client.session.get = fake_get
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(client.get, ['http://www.nhl.com/'] * 8))
+        assert in_flight['peak'] == 2
+
+    def test_elite_prospects_sends_baseline_headers(self):
+        """Test that EliteProspects requests carry none of the nhl.com browser headers."""
+        session = HttpClient().session
+        request = requests.Request('GET', 'https://www.eliteprospects.com/league/ahl', headers=elite_prospects._EP_HEADERS)
+        headers = session.prepare_request(request).headers
+        assert headers['User-Agent'] == requests.utils.default_user_agent()
+        assert not any(name.lower().startswith(('sec-', 'origin', 'referer')) for name in headers)
@@ -0,0 +1,34 @@
+"""
+Tests for shipping worker results between processes as Arrow IPC.
+Skipped when pyarrow is not installed (pip install TopDownHockey_Scraper[parallel]).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+from TopDownHockey_Scraper import TopDownHockey_NHL_Scraper as scraper
+
+
+class TestIpcTransfer:
+    """Tests for _frame_to_ipc and _frame_from_ipc."""
+
+    def test_round_trip_keeps_values_and_missing_markers(self):
+        """Test that numbers, strings with NaN and columns of None come back unchanged."""
+        df = pd.DataFrame({
+            'game_id': [2024020333, 2024020333, 2024020333],
+            'game_seconds': [0.0, 12.5, np.nan],
+            'event_type': ['FAC', 'SHOT', 'GOAL'],
+            'event_player_2': ['CONNOR MCDAVID', np.nan, np.nan],
+            'coords_x': [None, None, None],
+            'home_on_1': ['\xa0', 'LEON DRAISAITL', '\xa0'],
+        })
+        payload = scraper._frame_to_ipc(df)
+        assert isinstance(payload, tuple)
+        pd.testing.assert_frame_equal(scraper._frame_from_ipc(payload), df)
+
+    def test_mixed_object_column_falls_back_to_pickling(self):
+        """Test that a column mixing strings and numbers is shipped as the DataFrame itself."""
+        df = pd.DataFrame({'event_detail': ['Wrist', 3, np.nan]})
+        assert scraper._frame_to_ipc(df) is df
+        assert scraper._frame_from_ipc(df) is df
@@ -0,0 +1,78 @@
+"""
+Tests for per-host token-bucket rate limiting.
+These run offline against a simulated clock.
+"""
+import pytest
+from TopDownHockey_Scraper import rate_limiter
+
+
+URL = 'http://www.nhl.com/scores/htmlreports/20242025/PL020333.HTM'
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances the clock instead of waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        self.slept += seconds
+
+
+class TestRateLimiter:
+    """Tests for the token buckets and their per-host configuration."""
+
+    @pytest.fixture(autouse=True)
+    def clock(self, monkeypatch):
+        """Run every test on a simulated clock, with rate limiting off afterwards."""
+        clock = FakeClock()
+        monkeypatch.setattr(rate_limiter, 'time', clock)
+        yield clock
+        rate_limiter.configure_rate_limits()
+
+    def test_unconfigured_hosts_are_unlimited(self):
+        """Test that only hosts with a rate go through a bucket."""
+        rate_limiter.configure_rate_limits(rates={'www.nhl.com': 5})
+        assert rate_limiter.is_rate_limited(URL)
+        assert not rate_limiter.is_rate_limited('https://www.espn.com/nhl/scoreboard')
+
+    def test_burst_then_steady_rate(self, clock):
+        """Test that a full bucket allows a burst, after which requests go out at the configured rate."""
+        rate_limiter.configure_rate_limits(rates={'www.nhl.com': 5}, burst=3)
+        for _ in range(3):
+            rate_limiter.acquire(URL)
+        assert clock.slept == 0
+        for _ in range(5):
+            rate_limiter.acquire(URL)
+        assert clock.slept == pytest.approx(1.0)
+
+    def test_penalty_holds_back_the_host(self, clock):
+        """Test that penalize stops requests to the host for the given number of seconds."""
+        rate_limiter.configure_rate_limits(rates={'www.nhl.com': 5}, burst=3)
+        rate_limiter.penalize(URL, 4)
+        rate_limiter.acquire(URL)
+        assert clock.slept == pytest.approx(4.2)
+
+    def test_concurrent_penalties_overlap(self, clock):
+        """Test that several threads penalizing a host at once hold it back once, not once each."""
+        rate_limiter.configure_rate_limits(rates={'www.nhl.com': 5}, burst=3)
+        for _ in range(6):
+            rate_limiter.penalize(URL, 2)
+        rate_limiter.acquire(URL)
+        assert clock.slept == pytest.approx(2.2)
+
+    def test_file_backend_shares_one_budget(self, clock, tmp_path):
+        """Test that buckets backed by the same file (as in separate processes) share their tokens."""
+        path = str(tmp_path / 'www.nhl.com.bucket')
+        first = rate_limiter.FileTokenBucket(5, 2, path)
+        second = rate_limiter.FileTokenBucket(5, 2, path)
+        first.acquire()
+        second.acquire()
+        assert clock.slept == 0
+        first.acquire()
+        assert clock.slept == pytest.approx(0.2)
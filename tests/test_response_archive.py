@@ -0,0 +1,59 @@
+"""
+Tests for recording and replaying raw responses.
+These run offline against synthetic responses.
+"""
+import os
+import pytest
+import requests
+from TopDownHockey_Scraper import response_archive
+
+
+URL = 'http://www.nhl.com/scores/htmlreports/20242025/PL020333.HTM'
+
+
+def make_response(url, content):
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    response.url = url
+    response.encoding = 'ISO-8859-1'
+    response.headers['Content-Type'] = 'text/html'
+    return response
+
+
+class TestResponseArchive:
+    """Tests for the record/replay archive."""
+
+    @pytest.fixture(autouse=True)
+    def reset_archive(self):
+        """Leave recording and replay off after each test."""
+        yield
+        response_archive.configure_response_archive()
+
+    def test_recorded_page_replays(self, tmp_path):
+        """Test that a recorded page is served back unchanged, and unrecorded pages are 404s."""
+        response_archive.configure_response_archive(record_dir=str(tmp_path), replay_dir=str(tmp_path))
+        response_archive.record_response(URL, make_response(URL, b'<td>Final</td>'))
+        replayed = response_archive.replay_response(URL)
+        assert replayed.status_code == 200
+        assert replayed.text == '<td>Final</td>'
+        assert response_archive.replay_response(URL.replace('020333', '020334')).status_code == 404
+
+    def test_unwritable_record_dir_is_reported_once(self, tmp_path, capsys):
+        """Test that a record directory that can't be created doesn't break the scrape."""
+        blocker = tmp_path / 'archive'
+        blocker.write_text('not a directory')
+        response_archive.configure_response_archive(record_dir=str(blocker))
+        response_archive.record_response(URL, make_response(URL, b'<td>Final</td>'))
+        response_archive.record_response(URL, make_response(URL, b'<td>Final</td>'))
+        assert capsys.readouterr().out.count('Could not record responses') == 1
+
+    def test_failed_write_leaves_no_temporary_files(self, tmp_path, monkeypatch):
+        """Test that a write failing halfway removes its temporary files."""
+        def failing_replace(src, dst):
+            raise OSError(28, 'No space left on device')
+        response_archive.configure_response_archive(record_dir=str(tmp_path))
+        monkeypatch.setattr(response_archive.os, 'replace', failing_replace)
+        response_archive.record_response(URL, make_response(URL, b'<td>Final</td>'))
+        leftovers = [name for _, _, names in os.walk(tmp_path) for name in names]
+        assert leftovers == []
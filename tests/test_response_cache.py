@@ -0,0 +1,124 @@
+"""
+Tests for the on-disk raw response cache.
+These run offline against synthetic responses.
+"""
+import os
+import pandas as pd
+import pytest
+import requests
+from TopDownHockey_Scraper import response_cache
+
+
+def make_response(url, content):
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    response.url = url
+    response.encoding = 'ISO-8859-1'
+    response.headers['Content-Type'] = 'text/html'
+    return response
+
+
+class TestResponseCache:
+    """Tests for the response cache."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path):
+        """Enable the cache in a fresh directory for each test."""
+        response_cache.enable_response_cache(str(tmp_path), max_bytes=10_000, live_ttl=60)
+        yield tmp_path
+        response_cache.disable_response_cache()
+
+    def test_round_trip(self):
+        """Test that a cached response rebuilds with the same body and encoding."""
+        url = 'http://www.nhl.com/scores/htmlreports/20242025/PL020333.HTM'
+        response_cache.store_response(url, make_response(url, b'<td>Final</td>'))
+        cached = response_cache.get_cached_response(url)
+        assert cached.content == b'<td>Final</td>'
+        assert cached.encoding == 'ISO-8859-1'
+        assert cached.text == '<td>Final</td>'
+
+    def test_live_entries_expire(self, monkeypatch):
+        """Test that live games expire after the TTL while final games do not."""
+        live_url = 'http://www.nhl.com/scores/htmlreports/20242025/PL020334.HTM'
+        final_url = 'https://api-web.nhle.com/v1/gamecenter/2024020333/play-by-play'
+        response_cache.store_response(live_url, make_response(live_url, b'<td>Period 2</td>'))
+        response_cache.store_response(final_url, make_response(final_url, b'{"gameState":"OFF"}'))
+        later = response_cache.time.time() + 3600
+        monkeypatch.setattr(response_cache.time, 'time', lambda: later)
+        assert response_cache.get_cached_response(live_url) is None
+        assert response_cache.get_cached_response(final_url) is not None
+
+    def test_size_cap_evicts_least_recently_used(self):
+        """Test that going over the size cap evicts the oldest entries first."""
+        urls = [f'http://www.nhl.com/scores/htmlreports/20242025/PL02{n:04d}.HTM' for n in range(4)]
+        for url in urls:
+            response_cache.store_response(url, make_response(url, b'Final' + os.urandom(4000)))
+        assert response_cache.get_cached_response(urls[0]) is None
+        assert response_cache.get_cached_response(urls[-1]) is not None
+
+    def test_scoreboard_with_final_games_expires(self, monkeypatch):
+        """Test that a date-wide page listing finished games is not treated as final."""
+        url = 'http://www.espn.com/nhl/scoreboard?date=20241201'
+        response_cache.store_response(url, make_response(url, b'<td>Final</td><td>7:00 PM</td>'))
+        later = response_cache.time.time() + 3600
+        monkeypatch.setattr(response_cache.time, 'time', lambda: later)
+        assert response_cache.get_cached_response(url) is None
+
+    def test_overwrite_does_not_double_count_size(self):
+        """Test that refreshing an entry replaces its size instead of adding to it."""
+        url = 'http://www.nhl.com/scores/htmlreports/20242025/PL020337.HTM'
+        for _ in range(2):
+            response_cache.store_response(url, make_response(url, os.urandom(1000)))
+        measured = response_cache._total_bytes
+        response_cache.store_response(url, make_response(url, os.urandom(1000)))
+        assert response_cache._total_bytes == measured
+
+
+class TestParseReuse:
+    """Tests for skipping the re-parse of unchanged pages."""
+
+    @pytest.fixture
+    def counting_parse(self):
+        """A decorated parse function that counts how often it really runs."""
+        calls = []
+
+        @response_cache.reuse_unchanged_parse
+        def parse(game_id, page=None, roster_cache=None):
+            calls.append(game_id)
+            return len(page.content)
+        return parse, calls
+
+    def test_unchanged_live_page_is_parsed_once(self, counting_parse):
+        """Test that polling an unchanged page of a game in progress reuses the first parse."""
+        parse, calls = counting_parse
+        url = 'http://www.nhl.com/scores/htmlreports/20242025/PL020335.HTM'
+        page = make_response(url, b'<td>Period 2</td>')
+        page.headers['ETag'] = '"v1"'
+        roster = pd.DataFrame({'Name': ['A']})
+        assert parse(2024020335, page=page, roster_cache=roster) == parse(2024020335, page=page, roster_cache=roster)
+        assert calls == [2024020335]
+        changed = make_response(url, b'<td>Period 3</td>')
+        changed.headers['ETag'] = '"v2"'
+        parse(2024020335, page=changed, roster_cache=roster)
+        assert len(calls) == 2
+
+    def test_corrected_roster_is_parsed_again(self, counting_parse):
+        """Test that an unchanged events page is parsed again when the roster built from a corrected roster page differs."""
+        parse, calls = counting_parse
+        url = 'http://www.nhl.com/scores/htmlreports/20242025/PL020338.HTM'
+        page = make_response(url, b'<td>Period 2</td>')
+        page.headers['ETag'] = '"v1"'
+        parse(2024020338, page=page, roster_cache=pd.DataFrame({'Name': ['A'], '#': ['8']}))
+        parse(2024020338, page=page, roster_cache=pd.DataFrame({'Name': ['A'], '#': ['10']}))
+        assert len(calls) == 2
+
+    def test_completed_game_pages_are_not_memoized(self, counting_parse):
+        """Test that a completed game's pages are parsed directly, without keeping the result."""
+        parse, calls = counting_parse
+        url = 'http://www.nhl.com/scores/htmlreports/20242025/PL020336.HTM'
+        page = make_response(url, b'<td>Final</td>')
+        page.headers['ETag'] = '"v1"'
+        parse(2024020336, page=page)
+        parse(2024020336, page=page)
+        assert len(calls) == 2
@@ -0,0 +1,102 @@
+"""
+Tests for how full_scrape retries games that failed.
+These run offline with the per-game scraper replaced by a stub.
+"""
+import pandas as pd
+import pytest
+import requests
+from TopDownHockey_Scraper import TopDownHockey_NHL_Scraper as scraper
+
+
+GAME_ID = 2024020333
+
+
+def game_frame(game_id):
+    return pd.DataFrame({'game_id': [game_id], 'event_player_1': ['X'], 'event_player_2': ['Y'],
+                         'event_player_3': ['Z'], 'event_type': ['SHOT'], 'event_description': ['']})
+
+
+def crashing_worker(game_id_list, live, shift_to_espn, return_intermediates, verbose):
+    """Pool worker stand-in that fails for one game and scrapes the rest."""
+    if game_id_list == [GAME_ID + 1]:
+        raise MemoryError('worker ran out of memory')
+    return scraper._frame_to_ipc(game_frame(game_id_list[0])), {}
+
+
+class TestRetryScheduling:
+    """Tests for failure classes and full_scrape's end-of-run retry."""
+
+    @pytest.fixture
+    def stub_scrape(self, monkeypatch):
+        """Replace full_scrape_1by1 with a stub that fails the given games on the first pass only."""
+        calls = []
+
+        def use_failures(failures):
+            def fake_full_scrape_1by1(game_id_list, live = False, shift_to_espn = True, return_intermediates = False,
+                                      verbose = False, prefetch = 0, pages_by_game = None):
+                calls.append((list(game_id_list), shift_to_espn))
+                first_pass = len(calls) == 1
+                scraper._last_scrape_failures = {x: failures[x] for x in game_id_list if first_pass and x in failures}
+                done = [x for x in game_id_list if x not in scraper._last_scrape_failures]
+                return pd.concat([game_frame(x) for x in done], ignore_index=True) if done else pd.DataFrame()
+            monkeypatch.setattr(scraper, 'full_scrape_1by1', fake_full_scrape_1by1)
+            return calls
+        return use_failures
+
+    def test_key_error_is_not_permanent(self):
+        """Test that KeyErrors and unrecognized exceptions are left for the end-of-run retry."""
+        for error in (KeyError('homeTeam'), RuntimeError('unexpected')):
+            failure = scraper._classify_scrape_failure(error)
+            assert failure not in scraper._PERMANENT_FAILURES
+            assert failure in scraper._ESPN_FALLBACK_FAILURES
+
+    def test_key_error_game_is_retried_with_espn_shifts(self, stub_scrape):
+        """Test that a game lost to a KeyError is scraped again at the end, falling back to ESPN shifts."""
+        failure = scraper._classify_scrape_failure(KeyError('homeTeam'))
+        calls = stub_scrape({GAME_ID + 1: failure})
+        df = scraper.full_scrape([GAME_ID, GAME_ID + 1])
+        assert calls == [([GAME_ID, GAME_ID + 1], False), ([GAME_ID + 1], True)]
+        assert sorted(df.game_id) == [GAME_ID, GAME_ID + 1]
+
+    def test_permanent_failure_is_not_retried(self, stub_scrape):
+        """Test that a game that failed with e.g. a 404 is reported instead of retried."""
+        calls = stub_scrape({GAME_ID + 1: 'http_error'})
+        df = scraper.full_scrape([GAME_ID, GAME_ID + 1])
+        assert len(calls) == 1
+        assert list(df.game_id) == [GAME_ID]
+
+    def test_crashed_pool_worker_keeps_finished_games(self, monkeypatch):
+        """Test that one failed worker doesn't discard the games the other workers finished."""
+        monkeypatch.setattr(scraper, '_scrape_games_worker', crashing_worker)
+        df = scraper._full_scrape_pool([GAME_ID, GAME_ID + 1, GAME_ID + 2], workers = 2)
+        assert list(df.game_id) == [GAME_ID, GAME_ID + 2]
+        assert scraper._last_scrape_failures == {GAME_ID + 1: 'worker_error'}
+        assert 'worker_error' not in scraper._PERMANENT_FAILURES
+
+    def test_fetch_failure_is_raised_without_sleeping(self, monkeypatch):
+        """Test that a page that fails to download ends the game's fetch at once, leaving the wait to the requeue."""
+        def failing_get(url, **kwargs):
+            raise requests.ConnectionError('connection reset')
+        slept = []
+        monkeypatch.setattr(scraper, '_http_get', failing_get)
+        monkeypatch.setattr(scraper.time, 'sleep', slept.append)
+        with pytest.raises(requests.ConnectionError):
+            scraper._fetch_url('http://www.nhl.com/scores/htmlreports/20242025/PL020333.HTM')
+        assert slept == []
+
+    def test_early_requeued_game_goes_behind_ready_games(self):
+        """Test that a requeued game still waiting on its deadline lets ready games go first."""
+        now = scraper.time.time()
+        queue = [GAME_ID, GAME_ID + 1]
+        not_before = {0: now + 60}
+        assert scraper._defer_early_game(queue, not_before, 0)
+        assert queue == [GAME_ID, GAME_ID + 1, GAME_ID]
+        assert not_before == {2: now + 60}
+
+    def test_earliest_waiting_game_is_not_moved(self):
+        """Test that when every game left is waiting, the one due first stays put."""
+        now = scraper.time.time()
+        queue = [GAME_ID, GAME_ID + 1]
+        not_before = {0: now + 10, 1: now + 20}
+        assert not scraper._defer_early_game(queue, not_before, 0)
+        assert queue == [GAME_ID, GAME_ID + 1]